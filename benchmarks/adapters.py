@@ -0,0 +1,58 @@
+"""
+Per-call cost of parsing the responses of APIMethods: the parsing wrapper looked up
+or built on every call as `parse_obj_as` does, against the cached adapter.
+
+    python -m benchmarks.adapters
+"""
+
+import json
+import timeit
+from pathlib import Path
+from typing import Any, List, Union
+
+from telefone_types import *
+from telefone_types._compat import PYDANTIC_V2
+from telefone_types.adapters import get_adapter
+
+if PYDANTIC_V2:
+    from pydantic import TypeAdapter
+
+    def parse_per_call(tp: Any, data: Any) -> Any:
+        return TypeAdapter(tp).validate_python(data)
+
+else:
+    from pydantic import parse_obj_as as parse_per_call
+
+DATA = Path(__file__).parent.parent / "tests" / "data" / "updates.json"
+UPDATES = json.loads(DATA.read_text())
+MESSAGE = UPDATES[0]["message"]
+USER = MESSAGE["from"]
+ADMINS = [{"status": "creator", "user": USER, "is_anonymous": False}] * 10
+COMMANDS = [{"command": "start", "description": "Start the bot"}] * 5
+
+CASES = [
+    ("List[Update]", List[Update], UPDATES),
+    ("List[Update], empty", List[Update], []),
+    ("List[ChatMember]", List[ChatMember], ADMINS),
+    ("List[BotCommand]", List[BotCommand], COMMANDS),
+    ("List[Message]", List[Message], [MESSAGE] * 10),
+    ("Union[Message, bool]", Union[Message, bool], True),
+    ("MessageId", MessageId, {"message_id": 1}),
+]
+
+
+def timing(func: Any, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    print(f"{'return type':24} {'per call, us':>14} {'adapter, us':>12}")
+    for name, tp, data in CASES:
+        number = 200 if isinstance(data, list) and data else 5000
+        before = timing(lambda: parse_per_call(tp, data), number)
+        after = timing(lambda: get_adapter(tp).validate(data), number)
+        print(f"{name:24} {before:14.1f} {after:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Memory taken by a cache of parsed messages, measured with tracemalloc. Every message
+is decoded from its own JSON body, so without interning each one holds its own copies
+of the repeated strings, e.g. the language code and the mime type.
+
+    python -m benchmarks.interning
+"""
+
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable, List
+
+from telefone_types import *
+from telefone_types._compat import PYDANTIC_V2
+from telefone_types.trusted import construct_trusted
+
+N = 5000
+LANGUAGES = ("en", "de", "ru", "es", "uk")
+
+
+def body(i: int) -> str:
+    user = {
+        "id": 1000 + i % 50,
+        "is_bot": False,
+        "first_name": "User",
+        "language_code": LANGUAGES[i % len(LANGUAGES)],
+    }
+    message = {
+        "message_id": i,
+        "from": user,
+        "chat": {"id": -100500 - i % 10, "type": "supergroup", "title": "Group"},
+        "date": 1660000000 + i,
+        "text": "hi /start @bot #tag",
+        "entities": [
+            {"type": "bot_command", "offset": 3, "length": 6},
+            {"type": "mention", "offset": 10, "length": 4},
+            {"type": "hashtag", "offset": 15, "length": 4},
+        ],
+        "document": {
+            "file_id": f"file{i}",
+            "file_unique_id": f"unique{i}",
+            "mime_type": "application/pdf",
+        },
+    }
+    return json.dumps(message)
+
+
+def validated(data: Any) -> Message:
+    if PYDANTIC_V2:
+        return Message.model_validate(data)
+    return Message.parse_obj(data)
+
+
+def trusted(data: Any) -> Message:
+    return construct_trusted(Message, data)
+
+
+def measure(parse: Callable[[Any], Message], bodies: List[str]) -> int:
+    parse(json.loads(bodies[0]))
+    gc.collect()
+    tracemalloc.start()
+    cache = [parse(json.loads(b)) for b in bodies]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    languages = len({id(m.from_.language_code) for m in cache})
+    print(f"{parse.__name__:12} {size // len(cache):10} {languages:16}")
+    return size
+
+
+def main() -> None:
+    bodies = [body(i) for i in range(N)]
+    print(f"{'parser':12} {'bytes/msg':>10} {'language strs':>16}")
+    parsers = [validated, trusted]
+    if not PYDANTIC_V2:
+        # the decoders are generated on pydantic v1, v2 validates in pydantic-core
+        parsers.insert(1, Message.fast_parse)
+    for parse in parsers:
+        measure(parse, bodies)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,11 @@
 from .objects import *
 from .methods import APIMethods
-from .updates import BaseBotUpdate, BotUpdateType
+from .updates import BaseBotUpdate, BotUpdateType, to_bot_update
 from .states import BaseStateGroup, StatePeer
+from .lazy import parse_lazy
+from .jsonlib import iter_updates_bytes, parse_update_bytes, parse_updates_bytes
+from .polling import UpdateSource
+from .dispatch import OrderedDispatcher
+from .sharding import ShardedRunner
+from .ratelimit import RateLimiter
+from .errors import APIError, RetryPolicy
@@ -0,0 +1,105 @@
+import typing
+from typing import Any, Callable, Dict, Tuple, Type
+
+from pydantic import VERSION, BaseModel
+
+PYDANTIC_V2 = VERSION.startswith("2.")
+
+if PYDANTIC_V2:
+    from pydantic import field_validator
+else:
+    from pydantic import validator
+
+
+def lenient_issubclass(cls: Any, class_or_tuple: Any) -> bool:
+    try:
+        return isinstance(cls, type) and issubclass(cls, class_or_tuple)
+    except TypeError:
+        return False
+
+
+def field_aliases(model: Type[BaseModel]) -> Dict[str, str]:
+    """
+    Returns the keys of the fields in the raw data by field names.
+    """
+    if PYDANTIC_V2:
+        return {name: field.alias or name for name, field in model.model_fields.items()}
+    return {name: field.alias for name, field in model.__fields__.items()}
+
+
+def field_annotation(model: Type[BaseModel], name: str) -> Any:
+    if PYDANTIC_V2:
+        return model.model_fields[name].annotation
+    return model.__fields__[name].outer_type_
+
+
+def literal_values(annotation: Any) -> Tuple[Any, ...]:
+    """
+    Returns the values allowed by a `Literal` annotation, also wrapped into
+    `Optional` or `Annotated`.
+    """
+    origin = typing.get_origin(annotation)
+    if origin is typing.Literal:
+        return typing.get_args(annotation)
+    if origin in (typing.Union, typing.Annotated):
+        args = typing.get_args(annotation)
+        if origin is typing.Annotated:
+            args = args[:1]
+        return tuple(v for arg in args for v in literal_values(arg))
+    return ()
+
+
+def rebuild_model(model: Type[BaseModel]) -> None:
+    if PYDANTIC_V2:
+        if model is not BaseModel:
+            model.model_rebuild(force=True)
+    else:
+        model.update_forward_refs()
+
+
+def before_validator(field: str) -> Callable[[Callable], Any]:
+    if PYDANTIC_V2:
+        return field_validator(field, mode="before")
+    return validator(field, pre=True)
+
+
+def fields_set(obj: BaseModel) -> set:
+    if PYDANTIC_V2:
+        return obj.model_fields_set
+    return obj.__fields_set__
+
+
+def model_dump(obj: BaseModel) -> dict:
+    """
+    Returns the fields which are set as in the raw data, by aliases.
+    """
+    if PYDANTIC_V2:
+        return obj.model_dump(by_alias=True, exclude_none=True)
+    return obj.dict(by_alias=True, exclude_none=True)
+
+
+def copy_model(obj: BaseModel) -> Any:
+    """
+    Returns a shallow copy of the model with its own fields set.
+    """
+    if PYDANTIC_V2:
+        return obj.model_copy()
+    return obj.copy()
+
+
+def construct(model: Type[BaseModel], values: dict, fields_set: set) -> Any:
+    """
+    Creates the model from the values by field names without validation.
+    """
+    m = model.__new__(model)
+    object.__setattr__(m, "__dict__", values)
+    if PYDANTIC_V2:
+        object.__setattr__(m, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(m, "__pydantic_extra__", None)
+        object.__setattr__(m, "__pydantic_private__", None)
+        if model.__pydantic_post_init__:
+            m.model_post_init(None)
+    else:
+        object.__setattr__(m, "__fields_set__", fields_set)
+        m._init_private_attributes()
+    return m
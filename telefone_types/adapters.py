@@ -0,0 +1,133 @@
+import inspect
+import typing
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from pydantic import BaseModel
+
+from telefone_types._compat import PYDANTIC_V2, lenient_issubclass
+from telefone_types.codegen import fast_parse, get_decoder, is_compilable
+from telefone_types.trusted import type_builder
+from telefone_types.unions import get_dispatcher
+
+if PYDANTIC_V2:
+    from pydantic import TypeAdapter
+else:
+    from pydantic import create_model
+    from pydantic.typing import display_as_type
+
+Parser = Callable[[Any], Any]
+
+
+class Adapter:
+    """
+    Parses objects of one type, e.g. a `List[ChatMember]` response. Everything it
+    needs is prepared when the adapter is created, so a call is a plain function
+    call: models are parsed by their generated decoders, union variants are picked
+    by the dispatcher and anything else is validated by a parsing model created
+    once per type. On pydantic v2 everything is validated by a `TypeAdapter`.
+    """
+
+    def __init__(self, tp: Any) -> None:
+        self.type = tp
+        if PYDANTIC_V2:
+            self.model = TypeAdapter(tp)
+            self.validate = self.model.validate_python
+        else:
+            self.model = create_model(
+                f"ParsingModel[{display_as_type(tp)}]", __root__=(tp, ...)
+            )
+            self.validate = self._validator(tp)
+        self.builder = type_builder(tp)
+
+    def _fallback(self, obj: Any) -> Any:
+        return self.model(__root__=obj).__root__
+
+    def _validator(self, tp: Any) -> Parser:
+        if lenient_issubclass(tp, BaseModel):
+            if not is_compilable(tp):
+                return self._fallback
+            return lambda obj: fast_parse(tp, obj)
+
+        origin = typing.get_origin(tp)
+        if origin is list:
+            item = self._validator(typing.get_args(tp)[0])
+            if item is self._fallback:
+                return self._fallback
+
+            def parse_list(obj: Any) -> Any:
+                if not isinstance(obj, list):
+                    return self._fallback(obj)
+                return [item(i) for i in obj]
+
+            return parse_list
+
+        dispatcher = get_dispatcher(tp)
+        if dispatcher is not None and all(map(is_compilable, dispatcher.variants)):
+
+            def parse_union(obj: Any) -> Any:
+                variant = dispatcher.resolve(obj) if isinstance(obj, dict) else None
+                if variant is None:
+                    return self._fallback(obj)
+                return fast_parse(variant, obj)
+
+            return parse_union
+        return self._fallback
+
+    def construct(self, obj: Any) -> Any:
+        """
+        Builds the object from trusted data without validation.
+        """
+        if self.builder is None or obj is None:
+            return obj
+        return self.builder(obj)
+
+
+_adapters: Dict[Any, Adapter] = {}
+
+
+def get_adapter(tp: Any) -> Adapter:
+    adapter = _adapters.get(tp)
+    if adapter is None:
+        adapter = _adapters[tp] = Adapter(tp)
+    return adapter
+
+
+def return_types() -> Iterable[Any]:
+    """
+    Returns the types returned by the methods of APIMethods.
+    """
+    from telefone_types.methods import APIMethods
+
+    for name, method in vars(APIMethods).items():
+        if not inspect.iscoroutinefunction(method):
+            continue
+        tp = typing.get_type_hints(method, include_extras=True).get("return")
+        if tp is not None and tp not in (bool, int, str, Any):
+            yield tp
+
+
+def prepare_adapters(types: Optional[Iterable[Any]] = None) -> None:
+    """
+    Creates the adapters and compiles the decoders for the given types, by default
+    for all types returned by APIMethods. Call it on startup to move this work out
+    of the first requests.
+    """
+    for tp in return_types() if types is None else types:
+        get_adapter(tp)
+        for model in _models(tp):
+            if is_compilable(model):
+                get_decoder(model)
+
+
+def _models(tp: Any) -> Iterable[type]:
+    if lenient_issubclass(tp, BaseModel):
+        yield tp
+        return
+    dispatcher = get_dispatcher(tp)
+    if dispatcher is not None:
+        yield from dispatcher.variants
+    for arg in typing.get_args(tp):
+        yield from _models(arg)
+
+
+__all__ = ("Adapter", "get_adapter", "prepare_adapters")
@@ -0,0 +1,219 @@
+import pickle
+import zlib
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    ForwardRef,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+
+from telefone_types._compat import (
+    PYDANTIC_V2,
+    construct,
+    fields_set,
+    lenient_issubclass,
+)
+
+if PYDANTIC_V2:
+    from pydantic import field_serializer
+
+if TYPE_CHECKING:
+    from telefone_types.limits import ParseLimits
+
+T = TypeVar("T", bound="Model")
+
+# field names, schema version and default values by model
+Schema = Tuple[Tuple[str, ...], int, Dict[str, Any]]
+
+_schemas: Dict[type, Schema] = {}
+
+
+def _schema(cls: Type[BaseModel]) -> Schema:
+    schema = _schemas.get(cls)
+    if schema is None:
+        if PYDANTIC_V2:
+            fields = cls.model_fields
+            defaults = {
+                name: field.get_default(call_default_factory=True)
+                for name, field in fields.items()
+            }
+        else:
+            fields = cls.__fields__
+            defaults = {name: field.get_default() for name, field in fields.items()}
+        names = tuple(fields)
+        version = zlib.crc32(" ".join(names).encode())
+        schema = _schemas[cls] = (names, version, defaults)
+    return schema
+
+
+def pack(obj: BaseModel, cls: Optional[Type[BaseModel]] = None) -> tuple:
+    """
+    Returns the compact pickle of the model: the schema version, the mask of the set
+    fields by their positions in the schema and the values of these fields.
+    """
+    cls = cls or type(obj)
+    names, version, _ = _schema(cls)
+    set_names = fields_set(obj)
+    values = obj.__dict__
+    mask = 0
+    packed = []
+    for i, name in enumerate(names):
+        if name in set_names:
+            mask |= 1 << i
+            packed.append(values[name])
+    return _unpack, (cls, version, mask, tuple(packed))
+
+
+def _unpack(cls: Type[T], version: int, mask: int, packed: tuple) -> T:
+    names, current_version, defaults = _schema(cls)
+    if version != current_version:
+        raise pickle.UnpicklingError(
+            f"{cls.__name__} was pickled with another set of fields"
+        )
+    values = dict(defaults)
+    set_names = set()
+    packed_values = iter(packed)
+    i = 0
+    while mask:
+        if mask & 1:
+            name = names[i]
+            values[name] = next(packed_values)
+            set_names.add(name)
+        mask >>= 1
+        i += 1
+    return construct(cls, values, set_names)
+
+
+class Stub:
+    """
+    Unparsed object left in place of a field which is beyond the parse limits. The
+    raw data is kept as is, `expand` parses it. The models serialize the stub as its
+    raw data.
+    """
+
+    __slots__ = ("type", "raw")
+
+    def __init__(self, tp: Any, raw: Any) -> None:
+        self.type = tp
+        self.raw = raw
+
+    def expand(self, limits: Optional["ParseLimits"] = None) -> Any:
+        if limits is not None:
+            return limits.parse(self.type, self.raw)
+        from telefone_types.adapters import get_adapter
+
+        return get_adapter(self.type).validate(self.raw)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Stub):
+            return NotImplemented
+        return self.type == other.type and self.raw == other.raw
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        size = f"{len(self.raw)} items" if isinstance(self.raw, list) else "object"
+        return f"Stub({size})"
+
+
+def _raw(stub: Stub) -> Any:
+    return stub.raw
+
+
+def _may_be_stub(annotation: Any) -> bool:
+    # the parse limits leave stubs in place of nested objects and arrays
+    if isinstance(annotation, (str, ForwardRef)):
+        return True
+    if lenient_issubclass(annotation, BaseModel) or get_origin(annotation) is list:
+        return True
+    return any(_may_be_stub(arg) for arg in get_args(annotation))
+
+
+def _stub_fields(cls: type) -> Tuple[str, ...]:
+    names = {
+        name
+        for base in cls.__mro__
+        for name, annotation in getattr(base, "__annotations__", {}).items()
+        if not name.startswith("_") and _may_be_stub(annotation)
+    }
+    return tuple(sorted(names))
+
+
+def _serialize_stub(
+    self: BaseModel, value: Any, handler: Callable[[Any], Any], info: Any
+) -> Any:
+    if value.__class__ is Stub:
+        return value.raw
+    if info.include is None and info.exclude is None:
+        # serialized by its own type, the handler would build it twice
+        return value
+    return handler(value)
+
+
+class Model(BaseModel):
+    """
+    Base class of the Bot API objects.
+    """
+
+    def __reduce__(self):
+        # only the set fields are pickled, they are restored without validation
+        return pack(self)
+
+    if PYDANTIC_V2:
+
+        def __init_subclass__(cls, **kwargs: Any) -> None:
+            # the fields which may hold stubs are serialized as the raw data of
+            # the stubs, so pydantic doesn't warn that they don't match the type
+            names = _stub_fields(cls)
+            if names:
+                cls._serialize_stubs = field_serializer(
+                    *names, mode="wrap", when_used="unless-none", check_fields=False
+                )(_serialize_stub)
+            super().__init_subclass__(**kwargs)
+
+    else:
+
+        class Config:
+            json_encoders = {Stub: _raw}
+
+        @classmethod
+        def validate(cls: Type[T], value: Any) -> T:
+            # other models are not converted, so a union field takes the variant
+            # picked by its dispatcher instead of the first one it converts to
+            if isinstance(value, BaseModel) and not isinstance(value, cls):
+                raise TypeError(f"{type(value).__name__} is not {cls.__name__}")
+            return super().validate(value)
+
+    @classmethod
+    def fast_parse(cls: Type[T], obj: Any) -> T:
+        """
+        Parses the object with the decoder generated for this model. The result is the
+        same as of `parse_obj`, the objects which need more than exact type checks are
+        handed to pydantic.
+        """
+        from telefone_types.codegen import fast_parse
+
+        return fast_parse(cls, obj)
+
+    @classmethod
+    def from_bytes(cls: Type[T], body: Union[bytes, str]) -> T:
+        """
+        Parses the raw JSON, e.g. the body of a webhook request, with the fastest
+        installed JSON library.
+        """
+        if PYDANTIC_V2:
+            return cls.model_validate_json(body)
+
+        from telefone_types import jsonlib
+
+        return cls.fast_parse(jsonlib.loads(body))
@@ -0,0 +1,304 @@
+from typing import Any, Callable, Dict, List, Optional, Set, Type
+
+from pydantic import BaseModel
+
+from telefone_types._compat import PYDANTIC_V2, lenient_issubclass
+from telefone_types.identity import deduplicated
+from telefone_types.interning import INTERNED_FIELDS, intern, literal_table
+from telefone_types.unions import UnionDispatcher, get_dispatcher
+
+if not PYDANTIC_V2:
+    from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+
+Decoder = Callable[[Any], Any]
+
+SCALAR_TYPES = (int, str, bool)
+
+
+class SlowPath(Exception):
+    """
+    Raised by a generated decoder when the data can't be decoded by the fast path,
+    the object is then parsed by pydantic from scratch.
+    """
+
+
+def _check_list(value: Any) -> list:
+    if value.__class__ is not list:
+        raise SlowPath
+    return value
+
+
+def _decode_union(dispatcher: UnionDispatcher, value: Any) -> Any:
+    if value.__class__ is not dict:
+        raise SlowPath
+    variant = dispatcher.resolve(value)
+    if variant is None:
+        raise SlowPath
+    return _decoders[variant](value)
+
+
+_namespace: Dict[str, Any] = {
+    "SlowPath": SlowPath,
+    "_check_list": _check_list,
+    "_decode_union": _decode_union,
+    "_new": object.__new__,
+    "_setattr": object.__setattr__,
+    "_float": float,
+    "_intern": intern,
+}
+_decoders: Dict[Type[BaseModel], Decoder] = {}
+_names: Dict[Type[BaseModel], str] = {}
+
+
+def is_compilable(model: Type[BaseModel]) -> bool:
+    """
+    Tells if a decoder can be generated for the model. The models of pydantic v2 are
+    validated by its compiled core, so they are never compiled here.
+    """
+    if PYDANTIC_V2:
+        return False
+    return not (
+        model.__validators__
+        or model.__pre_root_validators__
+        or model.__post_root_validators__
+        or model.__custom_root_type__
+        or model.__config__.extra == "allow"
+    )
+
+
+def _name(model: Type[BaseModel]) -> str:
+    name = _names.get(model)
+    if name is None:
+        name = f"decode_{model.__name__}_{len(_names)}"
+        _names[model] = name
+    return name
+
+
+def _const(prefix: str, value: Any) -> str:
+    name = f"{prefix}_{len(_namespace)}"
+    _namespace[name] = value
+    return name
+
+
+def _union_variants(field: "ModelField") -> Optional[List[Type[BaseModel]]]:
+    """
+    Returns the variants of a union field if all of them are compilable models.
+    """
+    if field.shape != SHAPE_SINGLETON or not field.sub_fields:
+        return None
+    variants = [f.type_ for f in field.sub_fields]
+    for variant in variants:
+        if not lenient_issubclass(variant, BaseModel) or not is_compilable(variant):
+            return None
+    if get_dispatcher(field.outer_type_) is None:
+        return None
+    return variants
+
+
+def _nested_models(field: "ModelField") -> List[Type[BaseModel]]:
+    if field.shape == SHAPE_LIST and field.sub_fields:
+        return _nested_models(field.sub_fields[0])
+    if field.shape == SHAPE_SINGLETON and not field.sub_fields:
+        if lenient_issubclass(field.type_, BaseModel) and is_compilable(field.type_):
+            return [field.type_]
+    return _union_variants(field) or []
+
+
+def _item_expr(item: "ModelField", var: str) -> Optional[str]:
+    """
+    Returns the expression converting a list item in `var` if it is a model, a union
+    of models or a list of them.
+    """
+    if item.shape == SHAPE_LIST and item.sub_fields:
+        expr = _item_expr(item.sub_fields[0], f"{var}_")
+        if expr is not None:
+            return f"[{expr} for {var}_ in _check_list({var})]"
+    elif item.shape == SHAPE_SINGLETON and not item.sub_fields:
+        if lenient_issubclass(item.type_, BaseModel) and is_compilable(item.type_):
+            return f"{_name(item.type_)}({var})"
+    elif _union_variants(item):
+        dispatcher = _const("DISPATCHER", get_dispatcher(item.outer_type_))
+        return f"_decode_union({dispatcher}, {var})"
+    return None
+
+
+def _emit_value(field: "ModelField", var: str, lines: List[str], indent: str) -> bool:
+    """
+    Emits the code converting the non-None value in `var`, returns False if the field
+    must be validated by pydantic instead.
+    """
+    if field.shape == SHAPE_LIST and field.sub_fields:
+        item = field.sub_fields[0]
+        expr = _item_expr(item, f"{var}_")
+        if expr is not None:
+            lines.append(f"{indent}{var} = [{expr} for {var}_ in _check_list({var})]")
+            return True
+        if item.shape == SHAPE_SINGLETON and item.type_ in SCALAR_TYPES:
+            lines.append(f"{indent}{var} = list(_check_list({var}))")
+            lines.append(f"{indent}for {var}_ in {var}:")
+            lines.append(
+                f"{indent}    if {var}_.__class__ is not {item.type_.__name__}:"
+            )
+            lines.append(f"{indent}        raise SlowPath")
+            return True
+        return False
+    if _union_variants(field):
+        dispatcher = _const("DISPATCHER", get_dispatcher(field.outer_type_))
+        lines.append(f"{indent}{var} = _decode_union({dispatcher}, {var})")
+        return True
+    if field.shape != SHAPE_SINGLETON or field.sub_fields:
+        return False
+    type_ = field.type_
+    if lenient_issubclass(type_, BaseModel):
+        if not is_compilable(type_):
+            return False
+        lines.append(f"{indent}{var} = {_name(type_)}({var})")
+        return True
+    if type_ is float:
+        lines.append(f"{indent}if {var}.__class__ is not float:")
+        lines.append(f"{indent}    if {var}.__class__ is not int:")
+        lines.append(f"{indent}        raise SlowPath")
+        lines.append(f"{indent}    {var} = _float({var})")
+        return True
+    if type_ in SCALAR_TYPES:
+        lines.append(f"{indent}if {var}.__class__ is not {type_.__name__}:")
+        lines.append(f"{indent}    raise SlowPath")
+        if type_ is str and field.name in INTERNED_FIELDS:
+            lines.append(f"{indent}{var} = _intern({var})")
+        return True
+    table = literal_table(field.outer_type_)
+    if table is None:
+        return False
+    # the values are replaced with the constants, so equal values share one string
+    literal = _const("LITERAL", table)
+    lines.append(f"{indent}if {var}.__class__ is not str:")
+    lines.append(f"{indent}    raise SlowPath")
+    lines.append(f"{indent}{var} = {literal}.get({var}, SlowPath)")
+    lines.append(f"{indent}if {var} is SlowPath:")
+    lines.append(f"{indent}    raise SlowPath")
+    return True
+
+
+def _emit_field(
+    model: Type[BaseModel], field: "ModelField", var: str, lines: List[str]
+) -> None:
+    default = field.get_default()
+    if field.required:
+        lines.append(f"    {var} = get({field.alias!r}, SlowPath)")
+        lines.append(f"    if {var} is SlowPath:")
+        lines.append("        raise SlowPath")
+    elif default is None:
+        lines.append(f"    {var} = get({field.alias!r})")
+    else:
+        factory = _const("DEFAULT", field.get_default)
+        lines.append(f"    {var} = get({field.alias!r}, SlowPath)")
+        lines.append(f"    if {var} is SlowPath:")
+        lines.append(f"        {var} = {factory}()")
+
+    value_lines: List[str] = []
+    if not _emit_value(field, var, value_lines, "        "):
+        validated = _const("FIELD", field)
+        owner = _const("MODEL", model)
+        value_lines = [
+            f"        {var}, error = {validated}.validate({var}, {{}}, "
+            f"loc={field.alias!r}, cls={owner})",
+            "        if error:",
+            "            raise SlowPath",
+        ]
+    if field.allow_none:
+        lines.append(f"    if {var} is not None:")
+    else:
+        lines.append(f"    if {var} is None:")
+        lines.append("        raise SlowPath")
+        lines.append("    else:")
+    lines.extend(value_lines)
+
+
+def _model_source(model: Type[BaseModel]) -> str:
+    lines = [f"def {_name(model)}(data):"]
+    lines.append("    if data.__class__ is not dict:")
+    lines.append("        raise SlowPath")
+    lines.append("    get = data.get")
+
+    items = []
+    for i, (name, field) in enumerate(model.__fields__.items()):
+        var = f"v{i}"
+        _emit_field(model, field, var, lines)
+        items.append(f"{name!r}: {var}")
+
+    keys = _const("KEYS", frozenset(f.alias for f in model.__fields__.values()))
+    lines.append(f"    fields_set = data.keys() & {keys}")
+    for name, field in model.__fields__.items():
+        if field.alias != name:
+            lines.append(f"    if {field.alias!r} in fields_set:")
+            lines.append(f"        fields_set.discard({field.alias!r})")
+            lines.append(f"        fields_set.add({name!r})")
+
+    owner = _const("MODEL", model)
+    lines.append(f"    m = _new({owner})")
+    lines.append(f"    _setattr(m, '__dict__', {{{', '.join(items)}}})")
+    lines.append("    _setattr(m, '__fields_set__', fields_set)")
+    if model.__private_attributes__:
+        lines.append("    m._init_private_attributes()")
+    lines.append("    return m")
+    return "\n".join(lines)
+
+
+def _reachable(model: Type[BaseModel]) -> List[Type[BaseModel]]:
+    seen: Set[Type[BaseModel]] = set()
+    stack = [model]
+    result = []
+    while stack:
+        current = stack.pop()
+        if current in seen or current in _decoders:
+            continue
+        seen.add(current)
+        result.append(current)
+        for field in current.__fields__.values():
+            stack.extend(_nested_models(field))
+    return result
+
+
+def generate_source(model: Type[BaseModel]) -> str:
+    """
+    Returns the source of the decoders of the model and all nested models which
+    were not compiled yet.
+    """
+    return "\n\n\n".join(_model_source(m) for m in _reachable(model))
+
+
+def get_decoder(model: Type[BaseModel]) -> Decoder:
+    """
+    Returns the generated decoder of the model, compiling it together with the
+    decoders of nested models on first use. The decoder raises `SlowPath` if the
+    data needs anything beyond exact type checks.
+    """
+    decoder = _decoders.get(model)
+    if decoder is not None:
+        return decoder
+    if not is_compilable(model):
+        raise ValueError(f"A decoder can't be generated for {model.__name__}")
+    models = _reachable(model)
+    source = "\n\n\n".join(_model_source(m) for m in models)
+    exec(
+        compile(source, f"<telefone_types decoders for {model.__name__}>", "exec"),
+        _namespace,
+    )
+    for m in models:
+        # nested decoders are looked up in the namespace, so they are wrapped too
+        _decoders[m] = _namespace[_name(m)] = deduplicated(m, _namespace[_name(m)])
+    return _decoders[model]
+
+
+def fast_parse(model: Type[BaseModel], data: Any) -> Any:
+    if PYDANTIC_V2:
+        return model.model_validate(data)
+    if not is_compilable(model):
+        return model.parse_obj(data)
+    try:
+        return get_decoder(model)(data)
+    except SlowPath:
+        return model.parse_obj(data)
+
+
+__all__ = ("SlowPath", "fast_parse", "generate_source", "get_decoder")
@@ -0,0 +1,141 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Optional, Set
+
+logger = logging.getLogger("telefone_types")
+
+Handler = Callable[[Any], Awaitable[Any]]
+KeyFunc = Callable[[Any], Optional[Hashable]]
+
+
+def state_key(update: Any) -> Optional[Hashable]:
+    """
+    Returns the state key of the typed update, the chat id if the update has no
+    sender (e.g. a channel post).
+    """
+    try:
+        return update.get_state_key()
+    except AttributeError:
+        return chat_key(update)
+
+
+def chat_key(update: Any) -> Optional[Hashable]:
+    """
+    Returns the id of the chat of the update, of the message for callback queries.
+    """
+    chat = getattr(update, "chat", None)
+    if chat is None:
+        chat = getattr(getattr(update, "message", None), "chat", None)
+    return None if chat is None else chat.id
+
+
+class _Lane:
+    __slots__ = ("queue", "size", "worker", "space")
+
+    def __init__(self) -> None:
+        self.queue: Deque[Any] = deque()
+        # queued, waiting for space and running updates
+        self.size = 0
+        self.worker: Optional[asyncio.Task] = None
+        self.space = asyncio.Event()
+
+
+class OrderedDispatcher:
+    """
+    Runs the handler for the updates concurrently, but one at a time and in the
+    order of dispatch for the updates with the same key. The updates without a key
+    are not ordered. At most max_concurrency updates are in flight, and at most
+    max_per_key are queued for one key, dispatch waits for the space otherwise.
+    """
+
+    def __init__(
+        self,
+        handler: Handler,
+        key: KeyFunc = state_key,
+        max_concurrency: int = 256,
+        max_per_key: int = 64,
+    ) -> None:
+        self.handler = handler
+        self.key = key
+        self.max_per_key = max_per_key
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._lanes: Dict[Hashable, _Lane] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def _spawn(self, coro: Awaitable[Any]) -> asyncio.Task:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        self._idle.clear()
+        task.add_done_callback(self._done)
+        return task
+
+    def _done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not self._tasks:
+            self._idle.set()
+
+    async def _run(self, update: Any) -> None:
+        try:
+            await self.handler(update)
+        except Exception:
+            logger.exception("Error while handling %r", update)
+        finally:
+            self._slots.release()
+
+    async def _drain(self, key: Hashable, lane: _Lane) -> None:
+        while lane.queue:
+            update = lane.queue.popleft()
+            lane.space.set()
+            await self._run(update)
+            lane.size -= 1
+        lane.worker = None
+        if not lane.size:
+            del self._lanes[key]
+
+    async def dispatch(self, update: Any) -> None:
+        """
+        Schedules the update, returns when it is queued.
+        """
+        key = self.key(update)
+        if key is None:
+            await self._slots.acquire()
+            self._spawn(self._run(update))
+            return
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = _Lane()
+        lane.size += 1
+        try:
+            while len(lane.queue) >= self.max_per_key:
+                lane.space.clear()
+                await lane.space.wait()
+            await self._slots.acquire()
+        except BaseException:
+            lane.size -= 1
+            if not lane.size:
+                del self._lanes[key]
+            raise
+        lane.queue.append(update)
+        if lane.worker is None:
+            lane.worker = self._spawn(self._drain(key, lane))
+
+    async def join(self) -> None:
+        """
+        Waits until all the dispatched updates are handled.
+        """
+        await self._idle.wait()
+
+    async def close(self) -> None:
+        """
+        Cancels the handling of the dispatched updates.
+        """
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._lanes.clear()
+
+
+__all__ = ("OrderedDispatcher", "chat_key", "state_key")
@@ -0,0 +1,148 @@
+from enum import Enum
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple, Type
+from urllib.parse import quote_plus
+
+from pydantic import BaseModel
+
+from telefone_types import jsonlib
+from telefone_types._compat import PYDANTIC_V2, field_aliases, model_dump
+from telefone_types.limits import Stub
+
+Encoder = Callable[[Any], Dict[str, Any]]
+
+JSON_CONTENT_TYPE = "application/json"
+FORM_CONTENT_TYPE = "application/x-www-form-urlencoded"
+
+_missing = object()
+
+
+class PreSerialized:
+    """
+    Base of the values which keep their own JSON in `json`, it is put into the
+    request bodies as is.
+    """
+
+    __slots__ = ()
+    json: bytes
+
+
+_encoders: Dict[Type[BaseModel], Encoder] = {}
+
+
+def model_encoder(model: Type[BaseModel]) -> Encoder:
+    """
+    Returns the function converting the model to a dict by field aliases, without
+    None fields. It is created once per model and does the work of
+    `dict(by_alias=True, exclude_none=True)` without going through pydantic. On
+    pydantic v2 the compiled serializer is faster, so it is used instead.
+    """
+    encoder = _encoders.get(model)
+    if encoder is not None:
+        return encoder
+    if PYDANTIC_V2:
+        encoder = _encoders[model] = model_dump
+        return encoder
+    plan: List[Tuple[str, str]] = list(field_aliases(model).items())
+
+    def encode(obj: Any) -> Dict[str, Any]:
+        data = {}
+        values = obj.__dict__
+        for name, alias in plan:
+            value = values.get(name, _missing)
+            if value is _missing:
+                # not loaded yet by a lazy model
+                value = getattr(obj, name)
+            if value is not None:
+                data[alias] = encode_value(value)
+        return data
+
+    _encoders[model] = encode
+    return encode
+
+
+def encode_value(value: Any) -> Any:
+    """
+    Converts models, enums and stubs, also inside lists and dicts, to JSON-ready
+    values. Pre-serialized values are kept as they are.
+    """
+    if isinstance(value, BaseModel):
+        return model_encoder(type(value))(value)
+    if isinstance(value, (list, tuple)):
+        return [encode_value(v) for v in value]
+    if isinstance(value, dict) and not isinstance(value, PreSerialized):
+        return {k: encode_value(v) for k, v in value.items()}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Stub):
+        return value.raw
+    return value
+
+
+def encode_json(params: Dict[str, Any]) -> bytes:
+    serialized = [
+        jsonlib.dumps(k) + b":" + v.json
+        for k, v in params.items()
+        if isinstance(v, PreSerialized)
+    ]
+    if not serialized:
+        return jsonlib.dumps({k: encode_value(v) for k, v in params.items()})
+    body = jsonlib.dumps(
+        {
+            k: encode_value(v)
+            for k, v in params.items()
+            if not isinstance(v, PreSerialized)
+        }
+    )
+    if body != b"{}":
+        serialized.insert(0, body[1:-1])
+    return b"{" + b",".join(serialized) + b"}"
+
+
+def _form_value(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, PreSerialized):
+        return value.json.decode()
+    # numbers and booleans are JSON literals too, as the Bot API expects
+    return jsonlib.dumps(value).decode()
+
+
+def encode_form(params: Dict[str, Any]) -> bytes:
+    """
+    Encodes the params as urlencoded form fields, nested objects and arrays are
+    JSON-serialized.
+    """
+    return "&".join(
+        f"{quote_plus(k)}={quote_plus(_form_value(encode_value(v)))}"
+        for k, v in params.items()
+        if v is not None
+    ).encode()
+
+
+class EncodedRequest(NamedTuple):
+    method: str
+    content_type: str
+    body: bytes
+
+
+def encode_request(
+    method: str, params: Dict[str, Any], form: bool = False
+) -> EncodedRequest:
+    """
+    Returns the body of the method call, a JSON object or urlencoded form fields.
+    Files are not handled here, uploads are sent by the transport as multipart.
+    """
+    if form:
+        return EncodedRequest(method, FORM_CONTENT_TYPE, encode_form(params))
+    return EncodedRequest(method, JSON_CONTENT_TYPE, encode_json(params))
+
+
+__all__ = (
+    "EncodedRequest",
+    "PreSerialized",
+    "encode_form",
+    "encode_json",
+    "encode_request",
+    "encode_value",
+    "model_encoder",
+)
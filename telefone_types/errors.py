@@ -0,0 +1,225 @@
+import random
+from typing import Any, Collection, Dict, Optional, Type
+
+from telefone_types.adapters import get_adapter
+from telefone_types.objects import ResponseParameters
+
+
+class APIError(Exception):
+    """
+    Unsuccessful response of the Bot API.
+    """
+
+    def __init__(
+        self,
+        error_code: int,
+        description: str,
+        parameters: Optional[ResponseParameters] = None,
+        method: Optional[str] = None,
+    ) -> None:
+        super().__init__(f"[{error_code}] {description}")
+        self.error_code = error_code
+        self.description = description
+        self.parameters = parameters
+        self.method = method
+
+
+class BadRequest(APIError):
+    pass
+
+
+class Unauthorized(APIError):
+    pass
+
+
+class Forbidden(APIError):
+    pass
+
+
+class NotFound(APIError):
+    pass
+
+
+class Conflict(APIError):
+    pass
+
+
+class ServerError(APIError):
+    pass
+
+
+class FloodWait(APIError):
+    @property
+    def retry_after(self) -> int:
+        return (self.parameters and self.parameters.retry_after) or 1
+
+
+class ChatMigrated(BadRequest):
+    @property
+    def migrate_to_chat_id(self) -> int:
+        return self.parameters.migrate_to_chat_id
+
+
+class ChatNotFound(BadRequest):
+    pass
+
+
+class MessageNotModified(BadRequest):
+    pass
+
+
+class BotBlocked(Forbidden):
+    pass
+
+
+ERRORS_BY_CODE: Dict[int, Type[APIError]] = {
+    400: BadRequest,
+    401: Unauthorized,
+    403: Forbidden,
+    404: NotFound,
+    409: Conflict,
+    429: FloodWait,
+}
+
+# the errors which are told apart by the start of the description
+ERRORS_BY_DESCRIPTION: Dict[str, Type[APIError]] = {
+    "bad request: chat not found": ChatNotFound,
+    "bad request: message is not modified": MessageNotModified,
+    "forbidden: bot was blocked by the user": BotBlocked,
+}
+
+
+def error_from_response(
+    response: Dict[str, Any], method: Optional[str] = None
+) -> APIError:
+    """
+    Returns the typed error of the unsuccessful response object.
+    """
+    error_code = response.get("error_code") or 0
+    description = response.get("description") or ""
+    parameters = response.get("parameters")
+    if parameters is not None:
+        parameters = get_adapter(ResponseParameters).validate(parameters)
+    if parameters is not None and parameters.migrate_to_chat_id is not None:
+        error_cls: Type[APIError] = ChatMigrated
+    elif error_code >= 500:
+        error_cls = ServerError
+    else:
+        error_cls = ERRORS_BY_CODE.get(error_code, APIError)
+        lowered = description.lower()
+        for start, cls in ERRORS_BY_DESCRIPTION.items():
+            if lowered.startswith(start):
+                error_cls = cls
+                break
+    return error_cls(error_code, description, parameters, method)
+
+
+def check_response(response: Any, method: Optional[str] = None) -> Any:
+    """
+    Returns the result of the response object, raises the typed error if the
+    request was unsuccessful. Other responses are returned as they are.
+    """
+    if isinstance(response, dict) and "ok" in response:
+        if response["ok"] is False:
+            raise error_from_response(response, method)
+        if "result" in response:
+            return response["result"]
+    return response
+
+
+# the methods which have the same effect if they are sent twice, by their prefixes
+IDEMPOTENT_PREFIXES = (
+    "approve",
+    "ban",
+    "decline",
+    "delete",
+    "edit",
+    "get",
+    "leave",
+    "pin",
+    "promote",
+    "restrict",
+    "set",
+    "unban",
+    "unpin",
+)
+
+
+def is_idempotent(method: str) -> bool:
+    return method.startswith(IDEMPOTENT_PREFIXES)
+
+
+class RetryPolicy:
+    """
+    Tells how long to wait before the failed request is sent again: the retry_after
+    of flood waits, no wait for the chats migrated to a supergroup and an
+    exponential backoff for the server errors. The delays are increased by a random
+    part of up to jitter of them, so the retries of many calls are spread.
+
+    The server may fail after the request took effect, so the server errors are
+    retried only for the idempotent methods, or for the given server_error_methods.
+    Flood waits and migrations are retried for any method, as the request was
+    rejected.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: float = 0.5,
+        max_delay: float = 60.0,
+        jitter: float = 0.1,
+        server_error_methods: Optional[Collection[str]] = None,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.server_error_methods = server_error_methods
+
+    def retries_server_errors(self, method: Optional[str]) -> bool:
+        if method is None:
+            return False
+        if self.server_error_methods is not None:
+            return method in self.server_error_methods
+        return is_idempotent(method)
+
+    def delay(self, error: APIError, attempt: int) -> Optional[float]:
+        """
+        Returns the delay before the next attempt after the error of the attempt
+        (counted from 0), None if the request should not be sent again.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+        if isinstance(error, ChatMigrated):
+            return 0.0
+        if isinstance(error, FloodWait):
+            delay = float(error.retry_after)
+        elif isinstance(error, ServerError) and self.retries_server_errors(
+            error.method
+        ):
+            delay = min(self.backoff * 2**attempt, self.max_delay)
+        else:
+            return None
+        if delay > self.max_delay:
+            return None
+        return delay * (1 + random.uniform(0, self.jitter))
+
+
+__all__ = (
+    "APIError",
+    "BadRequest",
+    "BotBlocked",
+    "ChatMigrated",
+    "ChatNotFound",
+    "Conflict",
+    "FloodWait",
+    "Forbidden",
+    "MessageNotModified",
+    "NotFound",
+    "RetryPolicy",
+    "ServerError",
+    "Unauthorized",
+    "check_response",
+    "error_from_response",
+    "is_idempotent",
+)
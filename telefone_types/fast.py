@@ -0,0 +1,174 @@
+import typing
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from telefone_types import objects
+from telefone_types._compat import (
+    field_aliases,
+    field_annotation,
+    lenient_issubclass,
+    literal_values,
+    model_dump,
+)
+from telefone_types.unions import UnionDispatcher, get_dispatcher
+
+try:
+    import msgspec
+except ImportError as e:
+    raise ImportError(
+        "telefone_types.fast requires msgspec, install telefone-types[msgspec]"
+    ) from e
+
+MODULE = __name__
+
+_structs: Dict[Type[BaseModel], Type[msgspec.Struct]] = {}
+_models: Dict[Type[msgspec.Struct], Type[BaseModel]] = {}
+_tags: Dict[Type[BaseModel], Tuple[str, str]] = {}
+_decoders: Dict[Any, msgspec.json.Decoder] = {}
+
+
+def _union_tags(dispatcher: UnionDispatcher) -> Optional[Dict[Type[BaseModel], str]]:
+    """
+    Returns the tag of every variant if the union can be tagged by msgspec, that is
+    if each variant has its own value of the discriminator.
+    """
+    if dispatcher.discriminator is None:
+        return None
+    tags = {}
+    for variant in dispatcher.variants:
+        values = literal_values(field_annotation(variant, dispatcher.discriminator))
+        if len(values) != 1 or values[0] in tags.values():
+            return None
+        tags[variant] = values[0]
+    return tags
+
+
+def _struct_type(tp: Any) -> Any:
+    """
+    Translates the annotation of a model field into the annotation of the struct
+    field. Models are referenced by name as the structs are created one by one.
+    """
+    if lenient_issubclass(tp, BaseModel):
+        return tp.__name__
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if origin is typing.Annotated:
+        dispatcher = get_dispatcher(tp)
+        if dispatcher is None:
+            return _struct_type(args[0])
+        if _union_tags(dispatcher) is None:
+            # unions which msgspec can't tell apart stay raw objects
+            return Dict[str, Any]
+        return Union[tuple(v.__name__ for v in dispatcher.variants)]
+    if origin is Union:
+        return Union[tuple(_struct_type(arg) for arg in args)]
+    if origin is list:
+        return List[_struct_type(args[0])]
+    if origin is typing.Literal or tp in (int, str, bool, float, type(None)):
+        return tp
+    return Any
+
+
+def _define(model: Type[BaseModel]) -> Type[msgspec.Struct]:
+    hints = typing.get_type_hints(model, include_extras=True)
+    aliases = field_aliases(model)
+    tag_field, tag = _tags.get(model, (None, None))
+    fields = []
+    for name, alias in aliases.items():
+        if alias == tag_field:
+            continue
+        fields.append((name, Optional[_struct_type(hints[name])], None))
+    struct = msgspec.defstruct(
+        model.__name__,
+        fields,
+        module=MODULE,
+        kw_only=True,
+        omit_defaults=True,
+        rename={name: alias for name, alias in aliases.items() if name != alias},
+        tag_field=tag_field,
+        tag=tag,
+        # decoded objects never reference each other in cycles
+        gc=False,
+    )
+    _structs[model] = struct
+    _models[struct] = model
+    return struct
+
+
+def _define_all() -> Dict[str, Any]:
+    models = []
+    unions = {}
+    for name in objects.__all__:
+        value = getattr(objects, name)
+        if lenient_issubclass(value, BaseModel):
+            models.append(value)
+        elif get_dispatcher(value) is not None:
+            unions[name] = get_dispatcher(value)
+
+    for dispatcher in unions.values():
+        tags = _union_tags(dispatcher)
+        if tags is not None:
+            tag_field = field_aliases(dispatcher.variants[0])[dispatcher.discriminator]
+            _tags.update((variant, (tag_field, tag)) for variant, tag in tags.items())
+
+    namespace: Dict[str, Any] = {m.__name__: _define(m) for m in models}
+    for name, dispatcher in unions.items():
+        if _union_tags(dispatcher) is None:
+            namespace[name] = Dict[str, Any]
+        else:
+            namespace[name] = Union[tuple(_structs[v] for v in dispatcher.variants)]
+    return namespace
+
+
+globals().update(_define_all())
+
+
+def struct_type(model: Type[BaseModel]) -> Type[msgspec.Struct]:
+    """
+    Returns the struct mirroring the model.
+    """
+    return _structs[model]
+
+
+def get_decoder(tp: Any = None) -> msgspec.json.Decoder:
+    """
+    Returns the JSON decoder of the type, by default of `Update`. Decoders are cached,
+    create them once and reuse them for the whole stream.
+    """
+    tp = globals()["Update"] if tp is None else tp
+    decoder = _decoders.get(tp)
+    if decoder is None:
+        decoder = _decoders[tp] = msgspec.json.Decoder(tp)
+    return decoder
+
+
+def decode(body: Union[bytes, str], tp: Any = None) -> Any:
+    """
+    Decodes the raw JSON into structs, by default into an `Update`.
+    """
+    return get_decoder(tp).decode(body)
+
+
+def to_model(obj: msgspec.Struct) -> BaseModel:
+    """
+    Converts the struct into the pydantic model of the same name.
+    """
+    return _models[type(obj)].fast_parse(msgspec.to_builtins(obj))
+
+
+def from_model(obj: BaseModel) -> msgspec.Struct:
+    """
+    Converts the pydantic model into its struct.
+    """
+    return msgspec.convert(model_dump(obj), _structs[type(obj)])
+
+
+__all__ = (
+    *(name for name in objects.__all__ if name in globals()),
+    "decode",
+    "from_model",
+    "get_decoder",
+    "struct_type",
+    "to_model",
+)
@@ -0,0 +1,86 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional, Type
+
+from pydantic import BaseModel
+
+from telefone_types.objects import Chat, User
+
+Factory = Callable[[Any], Any]
+
+DEDUPLICATED_MODELS = frozenset((User, Chat))
+
+_current: ContextVar[Optional["IdentityMap"]] = ContextVar(
+    "telefone_types_identity_map", default=None
+)
+
+
+class IdentityMap:
+    """
+    Shares the instances of the objects which repeat in the responses, e.g. the same
+    `User` as the sender of many messages. Objects are the same if they have the same
+    id and the same content. Without maxsize the map is meant for one batch of
+    updates, with it the recently used objects are kept across batches.
+
+    The shared instances must not be mutated.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None) -> None:
+        self.maxsize = maxsize
+        self.objects: "OrderedDict[Any, Any]" = OrderedDict()
+
+    def get(self, model: Type[BaseModel], data: Any, factory: Factory) -> Any:
+        try:
+            key = (model, data.get("id"), frozenset(data.items()))
+        except (AttributeError, TypeError):
+            # not an object or it has nested objects
+            return factory(data)
+        obj = self.objects.get(key)
+        if obj is not None:
+            if self.maxsize is not None:
+                self.objects.move_to_end(key)
+            return obj
+        obj = self.objects[key] = factory(data)
+        if self.maxsize is not None and len(self.objects) > self.maxsize:
+            self.objects.popitem(last=False)
+        return obj
+
+    def clear(self) -> None:
+        self.objects.clear()
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+
+@contextmanager
+def identity_scope(identity_map: Optional[IdentityMap] = None) -> Iterator[IdentityMap]:
+    """
+    Deduplicates the objects parsed inside the block.
+    """
+    identity_map = IdentityMap() if identity_map is None else identity_map
+    token = _current.set(identity_map)
+    try:
+        yield identity_map
+    finally:
+        _current.reset(token)
+
+
+def deduplicated(model: Type[BaseModel], factory: Factory) -> Factory:
+    """
+    Wraps the function creating the model from raw data to look the object up in the
+    current identity map, if the model is deduplicated.
+    """
+    if model not in DEDUPLICATED_MODELS:
+        return factory
+
+    def create(data: Any) -> Any:
+        identity_map = _current.get()
+        if identity_map is None:
+            return factory(data)
+        return identity_map.get(model, data, factory)
+
+    return create
+
+
+__all__ = ("IdentityMap", "deduplicated", "identity_scope")
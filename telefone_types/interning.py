@@ -0,0 +1,54 @@
+import sys
+import typing
+from typing import Any, Callable, Dict, Optional
+
+# string fields with few distinct values, their values are shared between objects
+INTERNED_FIELDS = frozenset(
+    (
+        "currency",
+        "language",
+        "language_code",
+        "mime_type",
+        "set_name",
+        "sticker_set_name",
+    )
+)
+
+intern = sys.intern
+
+
+def literal_table(annotation: Any) -> Optional[Dict[str, str]]:
+    """
+    Returns the table mapping the values of a `Literal` of strings to the constants
+    of the annotation, None if the annotation is not such a `Literal`.
+    """
+    if typing.get_origin(annotation) is not typing.Literal:
+        return None
+    values = typing.get_args(annotation)
+    if not all(v.__class__ is str for v in values):
+        return None
+    return {v: v for v in values}
+
+
+def str_interner(name: str, annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """
+    Returns the function replacing the value of the field with the shared string,
+    None if the values of the field are not interned.
+    """
+    args = typing.get_args(annotation)
+    if typing.get_origin(annotation) is typing.Union and type(None) in args:
+        args = tuple(a for a in args if a is not type(None))
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    table = literal_table(annotation)
+    if table is not None:
+        return lambda value: (
+            table.get(value, value) if value.__class__ is str else value
+        )
+    if annotation is str and name in INTERNED_FIELDS:
+        return lambda value: intern(value) if value.__class__ is str else value
+    return None
+
+
+__all__ = ("INTERNED_FIELDS", "literal_table", "str_interner")
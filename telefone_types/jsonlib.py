@@ -0,0 +1,144 @@
+import json
+import re
+from typing import Any, Callable, Iterator, List, Optional, Union
+
+from telefone_types.errors import check_response, error_from_response
+from telefone_types.objects import Update
+
+Loads = Callable[[Union[bytes, str]], Any]
+Dumps = Callable[[Any], bytes]
+
+_decoder = json.JSONDecoder()
+_whitespace = re.compile(r"[ \t\n\r]*")
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _load_backend(name: str) -> Optional[tuple]:
+    if name == "orjson":
+        try:
+            import orjson
+        except ImportError:
+            return None
+        return orjson.loads, orjson.dumps
+    if name == "msgspec":
+        try:
+            import msgspec
+        except ImportError:
+            return None
+        return msgspec.json.decode, msgspec.json.encode
+    if name == "json":
+        return json.loads, _stdlib_dumps
+    raise ValueError(f"Unknown JSON backend `{name}`")
+
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+backend: str = "json"
+loads: Loads = json.loads
+dumps: Dumps = _stdlib_dumps
+
+
+def set_backend(name: Optional[str] = None) -> str:
+    """
+    Selects the JSON library used to decode and encode the raw bodies. Without a name
+    the fastest installed one is picked: orjson, msgspec, then the standard library.
+    """
+    global backend, loads, dumps
+    for candidate in BACKENDS if name is None else (name,):
+        functions = _load_backend(candidate)
+        if functions is not None:
+            backend = candidate
+            loads, dumps = functions
+            return backend
+    raise ImportError(f"JSON backend `{name}` is not installed")
+
+
+set_backend()
+
+
+def parse_update_bytes(body: Union[bytes, str]) -> Update:
+    """
+    Parses the body of a webhook request.
+    """
+    return Update.fast_parse(loads(body))
+
+
+def parse_updates_bytes(body: Union[bytes, str]) -> List[Update]:
+    """
+    Parses the body of a getUpdates response, either the whole response object or the
+    bare array of updates.
+    """
+    data = check_response(loads(body), "getUpdates")
+    return [Update.fast_parse(update) for update in data]
+
+
+def _skip(text: str, pos: int, char: Optional[str] = None) -> int:
+    pos = _whitespace.match(text, pos).end()
+    if char is not None:
+        if text[pos : pos + 1] != char:
+            raise ValueError(f"Expected {char!r} at position {pos}")
+        pos = _whitespace.match(text, pos + 1).end()
+    return pos
+
+
+def _result_start(text: str) -> int:
+    """
+    Returns the position of the first item of the updates array, skipping the other
+    keys of the response object. The error of an unsuccessful response is raised.
+    """
+    pos = _skip(text, 0)
+    if text[pos : pos + 1] == "[":
+        return _skip(text, pos, "[")
+    pos = _skip(text, pos, "{")
+    response = {}
+    while text[pos : pos + 1] != "}":
+        key, pos = _decoder.raw_decode(text, pos)
+        pos = _skip(text, pos, ":")
+        if key == "result":
+            return _skip(text, pos, "[")
+        response[key], pos = _decoder.raw_decode(text, pos)
+        pos = _skip(text, pos)
+        if text[pos : pos + 1] == ",":
+            pos = _skip(text, pos, ",")
+    if response.get("ok") is False:
+        raise error_from_response(response, "getUpdates")
+    raise ValueError("The response has no result")
+
+
+def iter_raw_updates(body: Union[bytes, str]) -> Iterator[Any]:
+    """
+    Decodes the updates of a getUpdates response one by one, each update is yielded
+    as soon as it is decoded without decoding the rest of the array. The error of an
+    unsuccessful response is raised before the first update.
+    """
+    text = body.decode() if isinstance(body, (bytes, bytearray)) else body
+    pos = _result_start(text)
+    while text[pos : pos + 1] != "]":
+        update, pos = _decoder.raw_decode(text, pos)
+        yield update
+        pos = _skip(text, pos)
+        if text[pos : pos + 1] == ",":
+            pos = _skip(text, pos, ",")
+
+
+def iter_updates_bytes(body: Union[bytes, str]) -> Iterator[Update]:
+    """
+    Parses the body of a getUpdates response lazily, yielding every update once it
+    is parsed.
+    """
+    for update in iter_raw_updates(body):
+        yield Update.fast_parse(update)
+
+
+__all__ = (
+    "dumps",
+    "iter_raw_updates",
+    "iter_updates_bytes",
+    "loads",
+    "parse_update_bytes",
+    "parse_updates_bytes",
+    "set_backend",
+)
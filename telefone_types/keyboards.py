@@ -0,0 +1,154 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import BaseModel
+
+from telefone_types import jsonlib
+from telefone_types.encoding import PreSerialized, encode_value
+
+Markup = Union[BaseModel, Dict[str, Any]]
+
+
+def _readonly(self, *args: Any, **kwargs: Any) -> None:
+    raise TypeError(f"{type(self).__name__} is immutable")
+
+
+class FrozenDict(dict):
+    """
+    Immutable and hashable JSON object, it is still a dict for the JSON encoders.
+    """
+
+    __slots__ = ("_hash",)
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore
+    __ior__ = _readonly  # type: ignore
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(frozenset(self.items()))
+            return self._hash
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+def freeze_value(value: Any) -> Any:
+    """
+    Converts the JSON value to an immutable one: objects to `FrozenDict`s and arrays
+    to tuples.
+    """
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze_value(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_value(v) for v in value)
+    return value
+
+
+class Keyboard(FrozenDict, PreSerialized):
+    """
+    Frozen reply markup serialized once, the JSON is kept in `json`. It can be passed
+    as `reply_markup` to any method instead of the markup models.
+    """
+
+    __slots__ = ("json",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        markup = encode_value(dict(*args, **kwargs))
+        super().__init__((k, freeze_value(v)) for k, v in markup.items())
+        self.json: bytes = jsonlib.dumps(self)
+
+
+class KeyboardCache:
+    """
+    Bounded LRU of keyboards by their structure, so markups which are built again and
+    again are serialized only once.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self.keyboards: "OrderedDict[FrozenDict, Keyboard]" = OrderedDict()
+
+    def get(self, markup: Markup) -> Keyboard:
+        if isinstance(markup, Keyboard):
+            return markup
+        key = freeze_value(encode_value(markup))
+        keyboard = self.keyboards.get(key)
+        if keyboard is not None:
+            self.keyboards.move_to_end(key)
+            return keyboard
+        keyboard = self.keyboards[key] = Keyboard(key)
+        if len(self.keyboards) > self.maxsize:
+            self.keyboards.popitem(last=False)
+        return keyboard
+
+
+keyboard_cache = KeyboardCache()
+
+
+def freeze(markup: Markup) -> Keyboard:
+    """
+    Returns the frozen keyboard of the markup model or dict, shared through the
+    default cache.
+    """
+    return keyboard_cache.get(markup)
+
+
+class KeyboardBuilder:
+    key: str
+
+    def __init__(self, **options: Any) -> None:
+        self.options = options
+        self.rows: List[List[Dict[str, Any]]] = [[]]
+
+    def add(self, text: str, **params: Any) -> "KeyboardBuilder":
+        """
+        Adds the button to the current row.
+        """
+        self.rows[-1].append({"text": text, **params})
+        return self
+
+    def row(self) -> "KeyboardBuilder":
+        """
+        Starts a new row.
+        """
+        if self.rows[-1]:
+            self.rows.append([])
+        return self
+
+    def build(self, cache: Optional[KeyboardCache] = None) -> Keyboard:
+        rows = [row for row in self.rows if row]
+        options = {k: v for k, v in self.options.items() if v is not None}
+        return (cache or keyboard_cache).get({self.key: rows, **options})
+
+
+class InlineKeyboardBuilder(KeyboardBuilder):
+    """
+    Builds an inline keyboard, e.g.
+    `InlineKeyboardBuilder().add("Yes", callback_data="y").row().add("No", url=url)`.
+    """
+
+    key = "inline_keyboard"
+
+
+class ReplyKeyboardBuilder(KeyboardBuilder):
+    """
+    Builds a reply keyboard, the options like `resize_keyboard` are passed to the
+    constructor.
+    """
+
+    key = "keyboard"
+
+
+__all__ = (
+    "FrozenDict",
+    "InlineKeyboardBuilder",
+    "Keyboard",
+    "KeyboardCache",
+    "ReplyKeyboardBuilder",
+    "freeze",
+    "freeze_value",
+    "keyboard_cache",
+)
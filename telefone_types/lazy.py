@@ -0,0 +1,175 @@
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from telefone_types._compat import PYDANTIC_V2, lenient_issubclass
+from telefone_types.base import pack
+
+if not PYDANTIC_V2:
+    from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+
+Model = TypeVar("Model", bound=BaseModel)
+
+FIELD_OTHER = 0
+FIELD_MODEL = 1
+FIELD_MODEL_LIST = 2
+
+_lazy_classes: Dict[Type[BaseModel], Type[BaseModel]] = {}
+
+
+def _field_kind(field: "ModelField") -> Tuple[int, Optional[Type[BaseModel]]]:
+    if field.shape == SHAPE_SINGLETON and lenient_issubclass(field.type_, BaseModel):
+        return FIELD_MODEL, field.type_
+    if (
+        field.shape == SHAPE_LIST
+        and field.sub_fields
+        and field.sub_fields[0].shape == SHAPE_SINGLETON
+        and lenient_issubclass(field.type_, BaseModel)
+    ):
+        return FIELD_MODEL_LIST, field.type_
+    return FIELD_OTHER, None
+
+
+class LazyModelMixin:
+    """
+    Keeps the raw payload next to the model and validates every field only when it is
+    read for the first time. Nested models are created lazily as well, so only the
+    branches of the tree that are actually used get validated.
+    """
+
+    __slots__ = ()
+    __lazy_base__: Type[BaseModel]
+    __lazy_plan__: Dict[str, Tuple[str, int, Optional[Type[BaseModel]]]]
+
+    def __getattr__(self, name: str) -> Any:
+        plan = type(self).__lazy_plan__.get(name)
+        try:
+            raw = object.__getattribute__(self, "_raw")
+        except AttributeError:
+            raw = None
+        if plan is None or raw is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        value = self._load_field(name, plan, raw.get(plan[0]))
+        self.__dict__[name] = value
+        return value
+
+    def _load_field(
+        self,
+        name: str,
+        plan: Tuple[str, int, Optional[Type[BaseModel]]],
+        value: Any,
+    ) -> Any:
+        if value is None:
+            return None
+        alias, kind, type_ = plan
+        if kind == FIELD_MODEL and isinstance(value, dict):
+            return parse_lazy(type_, value)
+        if kind == FIELD_MODEL_LIST and isinstance(value, list):
+            if all(isinstance(v, dict) for v in value):
+                return [parse_lazy(type_, v) for v in value]
+        field = self.__fields__[name]
+        value, errors = field.validate(value, {}, loc=alias, cls=type(self))
+        if errors:
+            raise ValidationError([errors], type(self))
+        return value
+
+    def _materialize(self) -> None:
+        try:
+            raw = object.__getattribute__(self, "_raw")
+        except AttributeError:
+            return
+        if raw is None:
+            # already materialized
+            return
+        values = self.__dict__
+        object.__setattr__(
+            self,
+            "__dict__",
+            {
+                name: values[name] if name in values else getattr(self, name)
+                for name in self.__fields__
+            },
+        )
+        object.__setattr__(self, "_raw", None)
+
+    def _copy_and_set_values(self, values, fields_set, *, deep):
+        # validating a model instance copies its __dict__, which misses the fields
+        # not loaded yet
+        if values is self.__dict__:
+            self._materialize()
+            values = self.__dict__
+        return super()._copy_and_set_values(values, fields_set, deep=deep)
+
+    def _iter(self, *args, **kwargs):
+        self._materialize()
+        return super()._iter(*args, **kwargs)
+
+    def __iter__(self):
+        self._materialize()
+        return super().__iter__()
+
+    def __repr_args__(self):
+        self._materialize()
+        return super().__repr_args__()
+
+    def __reduce__(self):
+        self._materialize()
+        return pack(self, self.__lazy_base__)
+
+
+def lazy_model(cls: Type[Model]) -> Type[Model]:
+    """
+    Returns the lazy counterpart of the model class. It is a subclass of the given
+    class, so `isinstance` checks keep working.
+    """
+    lazy_cls = _lazy_classes.get(cls)
+    if lazy_cls is None:
+        lazy_cls = type(
+            cls.__name__,
+            (LazyModelMixin, cls),
+            {
+                "__module__": cls.__module__,
+                "__qualname__": cls.__qualname__,
+                "__slots__": ("_raw",),
+            },
+        )
+        lazy_cls.__lazy_base__ = cls
+        lazy_cls.__lazy_plan__ = {
+            name: (field.alias, *_field_kind(field))
+            for name, field in cls.__fields__.items()
+        }
+        _lazy_classes[cls] = lazy_cls
+    return lazy_cls
+
+
+def parse_lazy(cls: Type[Model], data: Any) -> Model:
+    """
+    Wraps the raw object into a lazy model without validating it. Every field is
+    validated and cached on first access, the error is raised at that moment if the
+    data is malformed. On pydantic v2 the model is validated eagerly, its core is
+    fast enough for that.
+    """
+    if PYDANTIC_V2:
+        return cls.model_validate(data)
+    if not isinstance(data, dict):
+        return cls.parse_obj(data)
+    lazy_cls = lazy_model(cls)
+    m = lazy_cls.__new__(lazy_cls)
+    plan = lazy_cls.__lazy_plan__
+    object.__setattr__(m, "__dict__", {})
+    object.__setattr__(
+        m,
+        "__fields_set__",
+        {name for name, (alias, *_) in plan.items() if alias in data},
+    )
+    object.__setattr__(m, "_raw", data)
+    return m
+
+
+def parse_lazy_list(cls: Type[Model], data: List[Any]) -> List[Model]:
+    return [parse_lazy(cls, obj) for obj in data]
+
+
+__all__ = ("lazy_model", "parse_lazy", "parse_lazy_list")
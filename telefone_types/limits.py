@@ -0,0 +1,178 @@
+import typing
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from telefone_types._compat import (
+    copy_model,
+    field_aliases,
+    fields_set,
+    lenient_issubclass,
+)
+from telefone_types.adapters import get_adapter
+from telefone_types.base import Stub
+from telefone_types.identity import DEDUPLICATED_MODELS
+from telefone_types.unions import get_dispatcher
+
+Path = Tuple[Union[str, int], ...]
+
+_schemas: Dict[Type[BaseModel], List[Tuple[str, str, Any]]] = {}
+
+
+def _schema(model: Type[BaseModel]) -> List[Tuple[str, str, Any]]:
+    schema = _schemas.get(model)
+    if schema is None:
+        hints = typing.get_type_hints(model, include_extras=True)
+        schema = _schemas[model] = [
+            (name, alias, hints[name]) for name, alias in field_aliases(model).items()
+        ]
+    return schema
+
+
+def _unwrap(tp: Any) -> Any:
+    args = typing.get_args(tp)
+    if typing.get_origin(tp) is Union and len(args) == 2 and args[-1] is type(None):
+        return _unwrap(args[0])
+    return tp
+
+
+def _model(tp: Any, value: Any) -> Optional[Type[BaseModel]]:
+    if not isinstance(value, dict):
+        return None
+    if lenient_issubclass(tp, BaseModel):
+        return tp
+    dispatcher = get_dispatcher(tp)
+    return None if dispatcher is None else dispatcher.resolve(value)
+
+
+def _get(obj: Any, key: Union[str, int]) -> Any:
+    return obj[key] if isinstance(key, int) else getattr(obj, key)
+
+
+def _set(obj: Any, key: Union[str, int], value: Any) -> None:
+    if isinstance(key, int):
+        obj[key] = value
+    else:
+        obj.__dict__[key] = value
+        fields_set(obj).add(key)
+
+
+def _copy(obj: Any) -> Any:
+    return list(obj) if isinstance(obj, list) else copy_model(obj)
+
+
+class ParseLimits:
+    """
+    Bounds the work done on a response. Objects nested into an object of the same
+    type deeper than max_depth (e.g. a reply to a reply of a message) and arrays
+    longer than max_items are left unparsed as `Stub`s.
+    """
+
+    def __init__(
+        self, max_depth: Optional[int] = None, max_items: Optional[int] = None
+    ) -> None:
+        self.max_depth = max_depth
+        self.max_items = max_items
+
+    def _exceeds(self, tp: Any, value: Any, levels: Counter) -> bool:
+        if isinstance(value, list):
+            return self.max_items is not None and len(value) > self.max_items
+        model = _model(tp, value)
+        return (
+            model is not None
+            and self.max_depth is not None
+            and levels[model] >= self.max_depth
+        )
+
+    def _trim(
+        self,
+        tp: Any,
+        value: Any,
+        levels: Counter,
+        path: Path,
+        stubs: List[Tuple[Path, Stub]],
+    ) -> Any:
+        """
+        Returns the value without the fields beyond the limits, the objects are copied
+        only if something is cut from them.
+        """
+        tp = _unwrap(tp)
+        if typing.get_origin(tp) is list and isinstance(value, list):
+            item_type = typing.get_args(tp)[0]
+            items = None
+            for i, item in enumerate(value):
+                trimmed = self._trim(item_type, item, levels, path + (i,), stubs)
+                if trimmed is not item:
+                    items = list(value) if items is None else items
+                    items[i] = trimmed
+            return value if items is None else items
+
+        model = _model(tp, value)
+        if model is None:
+            return value
+        levels[model] += 1
+        obj = None
+        for name, alias, field_type in _schema(model):
+            field_value = value.get(alias)
+            if field_value is None:
+                continue
+            if self._exceeds(_unwrap(field_type), field_value, levels):
+                stubs.append((path + (name,), Stub(field_type, field_value)))
+                obj = dict(value) if obj is None else obj
+                del obj[alias]
+                continue
+            trimmed = self._trim(field_type, field_value, levels, path + (name,), stubs)
+            if trimmed is not field_value:
+                obj = dict(value) if obj is None else obj
+                obj[alias] = trimmed
+        levels[model] -= 1
+        return value if obj is None else obj
+
+    def trim(self, tp: Any, data: Any) -> Tuple[Any, List[Tuple[Path, Stub]]]:
+        """
+        Returns the data without the parts beyond the limits and the stubs of these
+        parts by their paths in the parsed object.
+        """
+        stubs: List[Tuple[Path, Stub]] = []
+        return self._trim(tp, data, Counter(), (), stubs), stubs
+
+    def parse(
+        self, tp: Any, data: Any, parser: Optional[Callable[[Any], Any]] = None
+    ) -> Any:
+        """
+        Parses the data within the limits, by default with the adapter of the type.
+        """
+        data, stubs = self.trim(tp, data)
+        obj = (parser or get_adapter(tp).validate)(data)
+        copies: Dict[Path, Any] = {}
+        for path, stub in stubs:
+            obj = _attach(obj, path, stub, copies)
+        return obj
+
+
+def _attach(obj: Any, path: Path, stub: Stub, copies: Dict[Path, Any]) -> Any:
+    """
+    Puts the stub at the path of the parsed object and returns the object. The objects
+    shared by the identity map are copied on the way, with everything below them, so
+    the stub is seen only in this response.
+    """
+    shared = type(obj) in DEDUPLICATED_MODELS
+    if shared:
+        copy = copies.get(())
+        if copy is None:
+            copy = copies[()] = _copy(obj)
+        obj = copy
+    node = obj
+    for i, key in enumerate(path[:-1]):
+        child = _get(node, key)
+        shared = shared or type(child) in DEDUPLICATED_MODELS
+        if shared and copies.get(path[: i + 1]) is not child:
+            child = copies[path[: i + 1]] = _copy(child)
+            _set(node, key, child)
+        node = child
+    _set(node, path[-1], stub)
+    return obj
+
+
+__all__ = ("ParseLimits", "Stub")
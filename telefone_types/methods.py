@@ -1,7 +1,18 @@
+import asyncio
+import logging
 from typing import *
 
-from pydantic import parse_obj_as
-
+from pydantic import ValidationError
+
+from telefone_types.adapters import get_adapter
+from telefone_types.errors import APIError, ChatMigrated, RetryPolicy, check_response
+from telefone_types.identity import IdentityMap, identity_scope
+from telefone_types.jsonlib import iter_raw_updates
+from telefone_types.keyboards import freeze_value
+from telefone_types.lazy import parse_lazy, parse_lazy_list
+from telefone_types.limits import ParseLimits
+from telefone_types.params import api_method
+from telefone_types.ratelimit import RateLimiter
 from telefone_types.objects import *
 
 if TYPE_CHECKING:
@@ -9,10 +20,86 @@ if TYPE_CHECKING:
 
 InputFile = TypeVar("InputFile", "File", str)
 
+logger = logging.getLogger("telefone_types")
+
+# read-only methods, the same calls of them in flight at once share one request
+COALESCED_METHODS = frozenset(
+    (
+        "getChat",
+        "getChatAdministrators",
+        "getChatMember",
+        "getChatMemberCount",
+        "getChatMenuButton",
+        "getFile",
+        "getGameHighScores",
+        "getMe",
+        "getMyCommands",
+        "getMyDefaultAdministratorRights",
+        "getStickerSet",
+        "getUserProfilePhotos",
+        "getWebhookInfo",
+    )
+)
+
 
 class APIMethods:
-    def __init__(self, api: Union["ABCAPI", "API"]) -> None:
+    # the defaults for the clients which mix the methods in without calling __init__
+    lazy_updates: bool = False
+    trusted: bool = False
+    validate_every: Optional[int] = None
+    identity_map: Union[bool, IdentityMap] = False
+    limits: Optional[ParseLimits] = None
+    rate_limiter: Optional[RateLimiter] = None
+    retry: Optional[RetryPolicy] = None
+    coalesce: bool = False
+    _in_flight: Optional[Dict[Hashable, "asyncio.Future[Any]"]] = None
+    _responses_count: int = 0
+
+    def __init__(
+        self,
+        api: Union["ABCAPI", "API"],
+        lazy_updates: bool = False,
+        trusted: bool = False,
+        validate_every: Optional[int] = None,
+        identity_map: Union[bool, IdentityMap] = False,
+        limits: Optional[ParseLimits] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        coalesce: bool = False,
+    ) -> None:
+        """
+        In trusted mode the responses of the Bot API server are assumed to match the
+        schema and the returned objects are built without validation. Set
+        validate_every to still validate every n-th response and log the ones that
+        don't match.
+
+        With identity_map the repeated users and chats of a response share one
+        instance, pass an `IdentityMap` with maxsize to share them across responses.
+        It is not applied to lazy updates, their fields are parsed on access.
+
+        With limits too deeply nested objects and too long arrays of the responses are
+        left unparsed.
+
+        With rate_limiter the methods sending messages wait for their turn by the
+        flood limits of the Bot API.
+
+        The unsuccessful responses are raised as `APIError`s, with retry the flood
+        waits and server errors are retried and the calls to a chat migrated to a
+        supergroup are sent to the new chat.
+
+        With coalesce the calls of the read-only methods with the same params made
+        while such a call is in flight wait for its result instead of sending the
+        request again, they get the same objects.
+        """
         self.api = api
+        self.lazy_updates = lazy_updates
+        self.trusted = trusted
+        self.validate_every = validate_every
+        self.identity_map = identity_map
+        self.limits = limits
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.coalesce = coalesce
 
     @staticmethod
     def get_params(loc: dict) -> dict:
@@ -24,6 +111,114 @@ class APIMethods:
         n.update(loc["kwargs"])
         return n
 
+    async def call_method(self, method: str, params: dict, tp: Any = None) -> Any:
+        """
+        Calls the method by its name with the params, e.g. the calls prepared in
+        another process. The result is parsed into the type, if it is given.
+        """
+        return await self._call_method(method, params, tp)
+
+    async def _call_method(self, method: str, params: dict, tp: Any = None) -> Any:
+        """
+        Sends the method with the prepared payload and parses the result into the
+        type, if it is given. It is private, as `request` of the API clients which
+        mix the methods in is their raw transport call.
+        """
+        if not self.coalesce or method not in COALESCED_METHODS:
+            return await self._request(method, params, tp)
+        in_flight = self._in_flight
+        if in_flight is None:
+            in_flight = self._in_flight = {}
+        key = (method, freeze_value(params))
+        future = in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._request(method, params, tp))
+            in_flight[key] = future
+            future.add_done_callback(lambda _: in_flight.pop(key, None))
+        # the request goes on for the other callers if this one is cancelled
+        return await asyncio.shield(future)
+
+    async def _request(self, method: str, params: dict, tp: Any = None) -> Any:
+        response = await self._send(method, params)
+        if tp is None:
+            return response
+        return self.parse_response(tp, response)
+
+    async def _send(self, method: str, params: dict) -> Any:
+        """
+        Sends the method through the rate limiter and the retries, returns the result
+        of the response unparsed.
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.limit(method, params)
+            try:
+                response = check_response(
+                    await self.api.request(method, params), method
+                )
+                break
+            except APIError as e:
+                if e.method is None:
+                    e.method = method
+                delay = None if self.retry is None else self.retry.delay(e, attempt)
+                if delay is None:
+                    raise
+                if isinstance(e, ChatMigrated):
+                    if "chat_id" not in params:
+                        raise
+                    params = {**params, "chat_id": e.migrate_to_chat_id}
+                attempt += 1
+                await asyncio.sleep(delay)
+        return response
+
+    def new_identity_map(self) -> Optional[IdentityMap]:
+        if self.identity_map is False:
+            return None
+        return IdentityMap() if self.identity_map is True else self.identity_map
+
+    def parse_response(
+        self, tp: Any, response: Any, identity_map: Optional[IdentityMap] = None
+    ) -> Any:
+        lazy_parser = self._lazy_parser(tp)
+        if lazy_parser is not None:
+            if self.limits is not None:
+                return self.limits.parse(tp, response, lazy_parser)
+            return lazy_parser(response)
+        if identity_map is None:
+            identity_map = self.new_identity_map()
+        if identity_map is None:
+            return self._parse_response(tp, response)
+        with identity_scope(identity_map):
+            return self._parse_response(tp, response)
+
+    def _lazy_parser(self, tp: Any) -> Optional[Callable[[Any], Any]]:
+        if not self.lazy_updates:
+            return None
+        if tp is Update:
+            return lambda data: parse_lazy(Update, data)
+        if tp == List[Update]:
+            return lambda data: parse_lazy_list(Update, data)
+        return None
+
+    def _parse_response(self, tp: Any, response: Any) -> Any:
+        if self.limits is not None:
+            return self.limits.parse(tp, response, lambda data: self._parse(tp, data))
+        return self._parse(tp, response)
+
+    def _parse(self, tp: Any, response: Any) -> Any:
+        adapter = get_adapter(tp)
+        if not self.trusted:
+            return adapter.validate(response)
+        self._responses_count += 1
+        if self.validate_every and self._responses_count % self.validate_every == 0:
+            try:
+                return adapter.validate(response)
+            except ValidationError as e:
+                logger.warning("Response does not match the schema of %s: %s", tp, e)
+        return adapter.construct(response)
+
+    @api_method("getUpdates")
     async def get_updates(
         self,
         offset: Optional[int] = None,
@@ -36,9 +231,31 @@ class APIMethods:
         Use this method to receive incoming updates using long polling (wiki). An Array of
         Update objects is returned.
         """
-        response = await self.api.request("getUpdates", self.get_params(locals()))
-        return parse_obj_as(List[Update], response)
 
+    async def iter_updates(
+        self,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        timeout: Optional[int] = None,
+        allowed_updates: Optional[List[str]] = None,
+        **kwargs
+    ) -> AsyncIterator[Update]:
+        """
+        Same as get_updates, but yields every update as soon as it is parsed instead of
+        parsing the whole batch first. If the API returns the raw body, the updates are
+        also decoded one by one.
+        """
+        params = self.get_updates.spec.build(
+            (offset, limit, timeout, allowed_updates), kwargs
+        )
+        response = await self._send("getUpdates", params)
+        if isinstance(response, (bytes, bytearray, str)):
+            response = iter_raw_updates(response)
+        identity_map = self.new_identity_map()
+        for update in response:
+            yield self.parse_response(Update, update, identity_map)
+
+    @api_method("setWebhook")
     async def set_webhook(
         self,
         url: Optional[str] = None,
@@ -59,9 +276,8 @@ class APIMethods:
         specify secret data in the parameter secret_token. If specified, the request will
         contain a header “X-Telegram-Bot-Api-Secret-Token” with the secret token as content.
         """
-        response = await self.api.request("setWebhook", self.get_params(locals()))
-        return response
 
+    @api_method("deleteWebhook")
     async def delete_webhook(
         self, drop_pending_updates: Optional[bool] = None, **kwargs
     ) -> bool:
@@ -69,26 +285,23 @@ class APIMethods:
         Use this method to remove webhook integration if you decide to switch back to
         getUpdates. Returns True on success.
         """
-        response = await self.api.request("deleteWebhook", self.get_params(locals()))
-        return response
 
+    @api_method("getWebhookInfo")
     async def get_webhook_info(self, **kwargs) -> WebhookInfo:
         """
         Use this method to get current webhook status. Requires no parameters. On success,
         returns a WebhookInfo object. If the bot is using getUpdates, will return an object
         with the url field empty.
         """
-        response = await self.api.request("getWebhookInfo", self.get_params(locals()))
-        return WebhookInfo(**response)
 
+    @api_method("getMe")
     async def get_me(self, **kwargs) -> User:
         """
         A simple method for testing your bot's authentication token. Requires no parameters.
         Returns basic information about the bot in form of a User object.
         """
-        response = await self.api.request("getMe", self.get_params(locals()))
-        return User(**response)
 
+    @api_method("logOut")
     async def log_out(self, **kwargs) -> bool:
         """
         Use this method to log out from the cloud Bot API server before launching the bot
@@ -98,9 +311,8 @@ class APIMethods:
         cloud Bot API server for 10 minutes. Returns True on success. Requires no
         parameters.
         """
-        response = await self.api.request("logOut", self.get_params(locals()))
-        return response
 
+    @api_method("close")
     async def close(self, **kwargs) -> bool:
         """
         Use this method to close the bot instance before moving it from one local server to
@@ -109,9 +321,8 @@ class APIMethods:
         in the first 10 minutes after the bot is launched. Returns True on success. Requires
         no parameters.
         """
-        response = await self.api.request("close", self.get_params(locals()))
-        return response
 
+    @api_method("sendMessage")
     async def send_message(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -136,9 +347,8 @@ class APIMethods:
         """
         Use this method to send text messages. On success, the sent Message is returned.
         """
-        response = await self.api.request("sendMessage", self.get_params(locals()))
-        return Message(**response)
 
+    @api_method("forwardMessage")
     async def forward_message(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -152,9 +362,8 @@ class APIMethods:
         Use this method to forward messages of any kind. Service messages can't be
         forwarded. On success, the sent Message is returned.
         """
-        response = await self.api.request("forwardMessage", self.get_params(locals()))
-        return Message(**response)
 
+    @api_method("copyMessage")
     async def copy_message(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -183,9 +392,8 @@ class APIMethods:
         copied message doesn't have a link to the original message. Returns the MessageId of
         the sent message on success.
         """
-        response = await self.api.request("copyMessage", self.get_params(locals()))
-        return MessageId(**response)
 
+    @api_method("sendPhoto")
     async def send_photo(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -210,9 +418,8 @@ class APIMethods:
         """
         Use this method to send photos. On success, the sent Message is returned.
         """
-        response = await self.api.request("sendPhoto", self.get_params(locals()))
-        return Message(**response)
 
+    @api_method("sendAudio")
     async def send_audio(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -245,9 +452,8 @@ class APIMethods:
         size, this limit may be changed in the future. For sending voice messages, use the
         sendVoice method instead.
         """
-        response = await self.api.request("sendAudio", self.get_params(locals()))
-        return Message(**response)
 
+    @api_method("sendDocument")
     async def send_document(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -276,9 +482,8 @@ class APIMethods:
         Bots can currently send files of any type of up to 50 MB in size, this limit may be
         changed in the future.
         """
-        response = await self.api.request("sendDocument", self.get_params(locals()))
-        return Message(**response)
 
+    @api_method("sendVideo")
     async def send_video(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -311,9 +516,8 @@ class APIMethods:
         currently send video files of up to 50 MB in size, this limit may be changed in the
         future.
         """
-        response = await self.api.request("sendVideo", self.get_params(locals()))
-        return Message(**response)
 
+    @api_method("sendAnimation")
     async def send_animation(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -344,9 +548,8 @@ class APIMethods:
         sound). On success, the sent Message is returned. Bots can currently send animation
         files of up to 50 MB in size, this limit may be changed in the future.
         """
-        response = await self.api.request("sendAnimation", self.get_params(locals()))
-        return Message(**response)
 
+    @api_method("sendVoice")
     async def send_voice(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -376,9 +579,8 @@ class APIMethods:
         the sent Message is returned. Bots can currently send voice messages of up to 50 MB
         in size, this limit may be changed in the future.
         """
-        response = await self.api.request("sendVoice", self.get_params(locals()))
-        return Message(**response)
 
+    @api_method("sendVideoNote")
     async def send_video_note(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -405,9 +607,8 @@ class APIMethods:
         long. Use this method to send video messages. On success, the sent Message is
         returned.
         """
-        response = await self.api.request("sendVideoNote", self.get_params(locals()))
-        return Message(**response)
 
+    @api_method("sendMediaGroup")
     async def send_media_group(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -432,9 +633,8 @@ class APIMethods:
         Documents and audio files can be only grouped in an album with messages of the same
         type. On success, an array of Messages that were sent is returned.
         """
-        response = await self.api.request("sendMediaGroup", self.get_params(locals()))
-        return parse_obj_as(List[Message], response)
 
+    @api_method("sendLocation")
     async def send_location(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -461,9 +661,8 @@ class APIMethods:
         """
         Use this method to send point on the map. On success, the sent Message is returned.
         """
-        response = await self.api.request("sendLocation", self.get_params(locals()))
-        return Message(**response)
 
+    @api_method("editMessageLiveLocation")
     async def edit_message_live_location(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -483,11 +682,8 @@ class APIMethods:
         stopMessageLiveLocation. On success, if the edited message is not an inline message,
         the edited Message is returned, otherwise True is returned.
         """
-        response = await self.api.request(
-            "editMessageLiveLocation", self.get_params(locals())
-        )
-        return parse_obj_as(Union[Message, bool], response)
 
+    @api_method("stopMessageLiveLocation")
     async def stop_message_live_location(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -501,11 +697,8 @@ class APIMethods:
         On success, if the message is not an inline message, the edited Message is returned,
         otherwise True is returned.
         """
-        response = await self.api.request(
-            "stopMessageLiveLocation", self.get_params(locals())
-        )
-        return parse_obj_as(Union[Message, bool], response)
 
+    @api_method("sendVenue")
     async def send_venue(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -535,9 +728,8 @@ class APIMethods:
         Use this method to send information about a venue. On success, the sent Message is
         returned.
         """
-        response = await self.api.request("sendVenue", self.get_params(locals()))
-        return Message(**response)
 
+    @api_method("sendContact")
     async def send_contact(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -562,9 +754,8 @@ class APIMethods:
         """
         Use this method to send phone contacts. On success, the sent Message is returned.
         """
-        response = await self.api.request("sendContact", self.get_params(locals()))
-        return Message(**response)
 
+    @api_method("sendPoll")
     async def send_poll(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -597,9 +788,8 @@ class APIMethods:
         """
         Use this method to send a native poll. On success, the sent Message is returned.
         """
-        response = await self.api.request("sendPoll", self.get_params(locals()))
-        return Message(**response)
 
+    @api_method("sendDice")
     async def send_dice(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -622,9 +812,8 @@ class APIMethods:
         Use this method to send an animated emoji that will display a random value. On
         success, the sent Message is returned.
         """
-        response = await self.api.request("sendDice", self.get_params(locals()))
-        return Message(**response)
 
+    @api_method("sendChatAction")
     async def send_chat_action(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -641,9 +830,8 @@ class APIMethods:
         a “sending photo” status for the bot. We only recommend using this method when a
         response from the bot will take a noticeable amount of time to arrive.
         """
-        response = await self.api.request("sendChatAction", self.get_params(locals()))
-        return response
 
+    @api_method("getUserProfilePhotos")
     async def get_user_profile_photos(
         self,
         user_id: Optional[int] = None,
@@ -655,11 +843,8 @@ class APIMethods:
         Use this method to get a list of profile pictures for a user. Returns a
         UserProfilePhotos object.
         """
-        response = await self.api.request(
-            "getUserProfilePhotos", self.get_params(locals())
-        )
-        return UserProfilePhotos(**response)
 
+    @api_method("getFile")
     async def get_file(self, file_id: Optional[str] = None, **kwargs) -> File:
         """
         Use this method to get basic information about a file and prepare it for
@@ -670,9 +855,8 @@ class APIMethods:
         valid for at least 1 hour. When the link expires, a new one can be requested by
         calling getFile again.
         """
-        response = await self.api.request("getFile", self.get_params(locals()))
-        return File(**response)
 
+    @api_method("banChatMember")
     async def ban_chat_member(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -688,9 +872,8 @@ class APIMethods:
         administrator in the chat for this to work and must have the appropriate
         administrator rights. Returns True on success.
         """
-        response = await self.api.request("banChatMember", self.get_params(locals()))
-        return response
 
+    @api_method("unbanChatMember")
     async def unban_chat_member(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -707,9 +890,8 @@ class APIMethods:
         from the chat. If you don't want this, use the parameter only_if_banned. Returns
         True on success.
         """
-        response = await self.api.request("unbanChatMember", self.get_params(locals()))
-        return response
 
+    @api_method("restrictChatMember")
     async def restrict_chat_member(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -724,11 +906,8 @@ class APIMethods:
         rights. Pass True for all permissions to lift restrictions from a user. Returns True
         on success.
         """
-        response = await self.api.request(
-            "restrictChatMember", self.get_params(locals())
-        )
-        return response
 
+    @api_method("promoteChatMember")
     async def promote_chat_member(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -752,11 +931,8 @@ class APIMethods:
         administrator rights. Pass False for all boolean parameters to demote a user.
         Returns True on success.
         """
-        response = await self.api.request(
-            "promoteChatMember", self.get_params(locals())
-        )
-        return response
 
+    @api_method("setChatAdministratorCustomTitle")
     async def set_chat_administrator_custom_title(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -768,11 +944,8 @@ class APIMethods:
         Use this method to set a custom title for an administrator in a supergroup promoted
         by the bot. Returns True on success.
         """
-        response = await self.api.request(
-            "setChatAdministratorCustomTitle", self.get_params(locals())
-        )
-        return response
 
+    @api_method("banChatSenderChat")
     async def ban_chat_sender_chat(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -786,11 +959,8 @@ class APIMethods:
         channel for this to work and must have the appropriate administrator rights. Returns
         True on success.
         """
-        response = await self.api.request(
-            "banChatSenderChat", self.get_params(locals())
-        )
-        return response
 
+    @api_method("unbanChatSenderChat")
     async def unban_chat_sender_chat(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -802,11 +972,8 @@ class APIMethods:
         channel. The bot must be an administrator for this to work and must have the
         appropriate administrator rights. Returns True on success.
         """
-        response = await self.api.request(
-            "unbanChatSenderChat", self.get_params(locals())
-        )
-        return response
 
+    @api_method("setChatPermissions")
     async def set_chat_permissions(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -818,11 +985,8 @@ class APIMethods:
         administrator in the group or a supergroup for this to work and must have the
         can_restrict_members administrator rights. Returns True on success.
         """
-        response = await self.api.request(
-            "setChatPermissions", self.get_params(locals())
-        )
-        return response
 
+    @api_method("exportChatInviteLink")
     async def export_chat_invite_link(
         self, chat_id: Optional[Union[int, str]] = None, **kwargs
     ) -> str:
@@ -832,11 +996,8 @@ class APIMethods:
         this to work and must have the appropriate administrator rights. Returns the new
         invite link as String on success.
         """
-        response = await self.api.request(
-            "exportChatInviteLink", self.get_params(locals())
-        )
-        return response
 
+    @api_method("createChatInviteLink")
     async def create_chat_invite_link(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -852,11 +1013,8 @@ class APIMethods:
         administrator rights. The link can be revoked using the method revokeChatInviteLink.
         Returns the new invite link as ChatInviteLink object.
         """
-        response = await self.api.request(
-            "createChatInviteLink", self.get_params(locals())
-        )
-        return ChatInviteLink(**response)
 
+    @api_method("editChatInviteLink")
     async def edit_chat_invite_link(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -872,11 +1030,8 @@ class APIMethods:
         be an administrator in the chat for this to work and must have the appropriate
         administrator rights. Returns the edited invite link as a ChatInviteLink object.
         """
-        response = await self.api.request(
-            "editChatInviteLink", self.get_params(locals())
-        )
-        return ChatInviteLink(**response)
 
+    @api_method("revokeChatInviteLink")
     async def revoke_chat_invite_link(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -889,11 +1044,8 @@ class APIMethods:
         the chat for this to work and must have the appropriate administrator rights.
         Returns the revoked invite link as ChatInviteLink object.
         """
-        response = await self.api.request(
-            "revokeChatInviteLink", self.get_params(locals())
-        )
-        return ChatInviteLink(**response)
 
+    @api_method("approveChatJoinRequest")
     async def approve_chat_join_request(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -905,11 +1057,8 @@ class APIMethods:
         the chat for this to work and must have the can_invite_users administrator right.
         Returns True on success.
         """
-        response = await self.api.request(
-            "approveChatJoinRequest", self.get_params(locals())
-        )
-        return response
 
+    @api_method("declineChatJoinRequest")
     async def decline_chat_join_request(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -921,11 +1070,8 @@ class APIMethods:
         the chat for this to work and must have the can_invite_users administrator right.
         Returns True on success.
         """
-        response = await self.api.request(
-            "declineChatJoinRequest", self.get_params(locals())
-        )
-        return response
 
+    @api_method("setChatPhoto")
     async def set_chat_photo(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -937,9 +1083,8 @@ class APIMethods:
         private chats. The bot must be an administrator in the chat for this to work and
         must have the appropriate administrator rights. Returns True on success.
         """
-        response = await self.api.request("setChatPhoto", self.get_params(locals()))
-        return response
 
+    @api_method("deleteChatPhoto")
     async def delete_chat_photo(
         self, chat_id: Optional[Union[int, str]] = None, **kwargs
     ) -> bool:
@@ -948,9 +1093,8 @@ class APIMethods:
         The bot must be an administrator in the chat for this to work and must have the
         appropriate administrator rights. Returns True on success.
         """
-        response = await self.api.request("deleteChatPhoto", self.get_params(locals()))
-        return response
 
+    @api_method("setChatTitle")
     async def set_chat_title(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -962,9 +1106,8 @@ class APIMethods:
         chats. The bot must be an administrator in the chat for this to work and must have
         the appropriate administrator rights. Returns True on success.
         """
-        response = await self.api.request("setChatTitle", self.get_params(locals()))
-        return response
 
+    @api_method("setChatDescription")
     async def set_chat_description(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -976,11 +1119,8 @@ class APIMethods:
         bot must be an administrator in the chat for this to work and must have the
         appropriate administrator rights. Returns True on success.
         """
-        response = await self.api.request(
-            "setChatDescription", self.get_params(locals())
-        )
-        return response
 
+    @api_method("pinChatMessage")
     async def pin_chat_message(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -994,9 +1134,8 @@ class APIMethods:
         work and must have the 'can_pin_messages' administrator right in a supergroup or
         'can_edit_messages' administrator right in a channel. Returns True on success.
         """
-        response = await self.api.request("pinChatMessage", self.get_params(locals()))
-        return response
 
+    @api_method("unpinChatMessage")
     async def unpin_chat_message(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -1010,9 +1149,8 @@ class APIMethods:
         supergroup or 'can_edit_messages' administrator right in a channel. Returns True on
         success.
         """
-        response = await self.api.request("unpinChatMessage", self.get_params(locals()))
-        return response
 
+    @api_method("unpinAllChatMessages")
     async def unpin_all_chat_messages(
         self, chat_id: Optional[Union[int, str]] = None, **kwargs
     ) -> bool:
@@ -1022,11 +1160,8 @@ class APIMethods:
         have the 'can_pin_messages' administrator right in a supergroup or
         'can_edit_messages' administrator right in a channel. Returns True on success.
         """
-        response = await self.api.request(
-            "unpinAllChatMessages", self.get_params(locals())
-        )
-        return response
 
+    @api_method("leaveChat")
     async def leave_chat(
         self, chat_id: Optional[Union[int, str]] = None, **kwargs
     ) -> bool:
@@ -1034,9 +1169,8 @@ class APIMethods:
         Use this method for your bot to leave a group, supergroup or channel. Returns True
         on success.
         """
-        response = await self.api.request("leaveChat", self.get_params(locals()))
-        return response
 
+    @api_method("getChat")
     async def get_chat(
         self, chat_id: Optional[Union[int, str]] = None, **kwargs
     ) -> Chat:
@@ -1045,9 +1179,8 @@ class APIMethods:
         user for one-on-one conversations, current username of a user, group or channel,
         etc.). Returns a Chat object on success.
         """
-        response = await self.api.request("getChat", self.get_params(locals()))
-        return Chat(**response)
 
+    @api_method("getChatAdministrators")
     async def get_chat_administrators(
         self, chat_id: Optional[Union[int, str]] = None, **kwargs
     ) -> List[ChatMember]:
@@ -1057,22 +1190,16 @@ class APIMethods:
         except other bots. If the chat is a group or a supergroup and no administrators were
         appointed, only the creator will be returned.
         """
-        response = await self.api.request(
-            "getChatAdministrators", self.get_params(locals())
-        )
-        return parse_obj_as(List[ChatMember], response)
 
+    @api_method("getChatMemberCount")
     async def get_chat_member_count(
         self, chat_id: Optional[Union[int, str]] = None, **kwargs
     ) -> int:
         """
         Use this method to get the number of members in a chat. Returns Int on success.
         """
-        response = await self.api.request(
-            "getChatMemberCount", self.get_params(locals())
-        )
-        return response
 
+    @api_method("getChatMember")
     async def get_chat_member(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -1083,9 +1210,8 @@ class APIMethods:
         Use this method to get information about a member of a chat. Returns a ChatMember
         object on success.
         """
-        response = await self.api.request("getChatMember", self.get_params(locals()))
-        return parse_obj_as(ChatMember, response)
 
+    @api_method("setChatStickerSet")
     async def set_chat_sticker_set(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -1098,11 +1224,8 @@ class APIMethods:
         administrator rights. Use the field can_set_sticker_set optionally returned in
         getChat requests to check if the bot can use this method. Returns True on success.
         """
-        response = await self.api.request(
-            "setChatStickerSet", self.get_params(locals())
-        )
-        return response
 
+    @api_method("deleteChatStickerSet")
     async def delete_chat_sticker_set(
         self, chat_id: Optional[Union[int, str]] = None, **kwargs
     ) -> bool:
@@ -1112,11 +1235,8 @@ class APIMethods:
         administrator rights. Use the field can_set_sticker_set optionally returned in
         getChat requests to check if the bot can use this method. Returns True on success.
         """
-        response = await self.api.request(
-            "deleteChatStickerSet", self.get_params(locals())
-        )
-        return response
 
+    @api_method("answerCallbackQuery")
     async def answer_callback_query(
         self,
         callback_query_id: Optional[str] = None,
@@ -1134,11 +1254,8 @@ class APIMethods:
         a game for your bot via @BotFather and accept the terms. Otherwise, you may use
         links like t.me/your_bot?start=XXXX that open your bot with a parameter.
         """
-        response = await self.api.request(
-            "answerCallbackQuery", self.get_params(locals())
-        )
-        return response
 
+    @api_method("setMyCommands")
     async def set_my_commands(
         self,
         commands: Optional[List[BotCommand]] = None,
@@ -1151,9 +1268,8 @@ class APIMethods:
         https://core.telegram.org/bots#commands for more details about bot commands. Returns
         True on success.
         """
-        response = await self.api.request("setMyCommands", self.get_params(locals()))
-        return response
 
+    @api_method("deleteMyCommands")
     async def delete_my_commands(
         self,
         scope: Optional[BotCommandScope] = None,
@@ -1165,9 +1281,8 @@ class APIMethods:
         user language. After deletion, higher level commands will be shown to affected
         users. Returns True on success.
         """
-        response = await self.api.request("deleteMyCommands", self.get_params(locals()))
-        return response
 
+    @api_method("getMyCommands")
     async def get_my_commands(
         self,
         scope: Optional[BotCommandScope] = None,
@@ -1179,9 +1294,8 @@ class APIMethods:
         and user language. Returns Array of BotCommand on success. If commands aren't set,
         an empty list is returned.
         """
-        response = await self.api.request("getMyCommands", self.get_params(locals()))
-        return parse_obj_as(List[BotCommand], response)
 
+    @api_method("setChatMenuButton")
     async def set_chat_menu_button(
         self,
         chat_id: Optional[int] = None,
@@ -1192,11 +1306,8 @@ class APIMethods:
         Use this method to change the bot's menu button in a private chat, or the default
         menu button. Returns True on success.
         """
-        response = await self.api.request(
-            "setChatMenuButton", self.get_params(locals())
-        )
-        return response
 
+    @api_method("getChatMenuButton")
     async def get_chat_menu_button(
         self, chat_id: Optional[int] = None, **kwargs
     ) -> MenuButton:
@@ -1204,11 +1315,8 @@ class APIMethods:
         Use this method to get the current value of the bot's menu button in a private chat,
         or the default menu button. Returns MenuButton on success.
         """
-        response = await self.api.request(
-            "getChatMenuButton", self.get_params(locals())
-        )
-        return parse_obj_as(MenuButton, response)
 
+    @api_method("setMyDefaultAdministratorRights")
     async def set_my_default_administrator_rights(
         self,
         rights: Optional[ChatAdministratorRights] = None,
@@ -1221,11 +1329,8 @@ class APIMethods:
         to users, but they are are free to modify the list before adding the bot. Returns
         True on success.
         """
-        response = await self.api.request(
-            "setMyDefaultAdministratorRights", self.get_params(locals())
-        )
-        return response
 
+    @api_method("getMyDefaultAdministratorRights")
     async def get_my_default_administrator_rights(
         self, for_channels: Optional[bool] = None, **kwargs
     ) -> ChatAdministratorRights:
@@ -1233,11 +1338,8 @@ class APIMethods:
         Use this method to get the current default administrator rights of the bot. Returns
         ChatAdministratorRights on success.
         """
-        response = await self.api.request(
-            "getMyDefaultAdministratorRights", self.get_params(locals())
-        )
-        return ChatAdministratorRights(**response)
 
+    @api_method("editMessageText")
     async def edit_message_text(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -1254,9 +1356,8 @@ class APIMethods:
         Use this method to edit text and game messages. On success, if the edited message is
         not an inline message, the edited Message is returned, otherwise True is returned.
         """
-        response = await self.api.request("editMessageText", self.get_params(locals()))
-        return parse_obj_as(Union[Message, bool], response)
 
+    @api_method("editMessageCaption")
     async def edit_message_caption(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -1272,11 +1373,8 @@ class APIMethods:
         Use this method to edit captions of messages. On success, if the edited message is
         not an inline message, the edited Message is returned, otherwise True is returned.
         """
-        response = await self.api.request(
-            "editMessageCaption", self.get_params(locals())
-        )
-        return parse_obj_as(Union[Message, bool], response)
 
+    @api_method("editMessageMedia")
     async def edit_message_media(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -1294,9 +1392,8 @@ class APIMethods:
         uploaded file via its file_id or specify a URL. On success, if the edited message is
         not an inline message, the edited Message is returned, otherwise True is returned.
         """
-        response = await self.api.request("editMessageMedia", self.get_params(locals()))
-        return parse_obj_as(Union[Message, bool], response)
 
+    @api_method("editMessageReplyMarkup")
     async def edit_message_reply_markup(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -1310,11 +1407,8 @@ class APIMethods:
         message is not an inline message, the edited Message is returned, otherwise True is
         returned.
         """
-        response = await self.api.request(
-            "editMessageReplyMarkup", self.get_params(locals())
-        )
-        return parse_obj_as(Union[Message, bool], response)
 
+    @api_method("stopPoll")
     async def stop_poll(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -1326,9 +1420,8 @@ class APIMethods:
         Use this method to stop a poll which was sent by the bot. On success, the stopped
         Poll is returned.
         """
-        response = await self.api.request("stopPoll", self.get_params(locals()))
-        return Poll(**response)
 
+    @api_method("deleteMessage")
     async def delete_message(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -1346,9 +1439,8 @@ class APIMethods:
         can_delete_messages permission in a supergroup or a channel, it can delete any
         message there. Returns True on success.
         """
-        response = await self.api.request("deleteMessage", self.get_params(locals()))
-        return response
 
+    @api_method("sendSticker")
     async def send_sticker(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -1371,16 +1463,14 @@ class APIMethods:
         Use this method to send static .WEBP, animated .TGS, or video .WEBM stickers. On
         success, the sent Message is returned.
         """
-        response = await self.api.request("sendSticker", self.get_params(locals()))
-        return Message(**response)
 
+    @api_method("getStickerSet")
     async def get_sticker_set(self, name: Optional[str] = None, **kwargs) -> StickerSet:
         """
         Use this method to get a sticker set. On success, a StickerSet object is returned.
         """
-        response = await self.api.request("getStickerSet", self.get_params(locals()))
-        return StickerSet(**response)
 
+    @api_method("uploadStickerFile")
     async def upload_sticker_file(
         self,
         user_id: Optional[int] = None,
@@ -1392,11 +1482,8 @@ class APIMethods:
         createNewStickerSet and addStickerToSet methods (can be used multiple times).
         Returns the uploaded File on success.
         """
-        response = await self.api.request(
-            "uploadStickerFile", self.get_params(locals())
-        )
-        return File(**response)
 
+    @api_method("createNewStickerSet")
     async def create_new_sticker_set(
         self,
         user_id: Optional[int] = None,
@@ -1415,11 +1502,8 @@ class APIMethods:
         edit the sticker set thus created. You must use exactly one of the fields
         png_sticker, tgs_sticker, or webm_sticker. Returns True on success.
         """
-        response = await self.api.request(
-            "createNewStickerSet", self.get_params(locals())
-        )
-        return response
 
+    @api_method("addStickerToSet")
     async def add_sticker_to_set(
         self,
         user_id: Optional[int] = None,
@@ -1438,9 +1522,8 @@ class APIMethods:
         sets can have up to 50 stickers. Static sticker sets can have up to 120 stickers.
         Returns True on success.
         """
-        response = await self.api.request("addStickerToSet", self.get_params(locals()))
-        return response
 
+    @api_method("setStickerPositionInSet")
     async def set_sticker_position_in_set(
         self, sticker: Optional[str] = None, position: Optional[int] = None, **kwargs
     ) -> bool:
@@ -1448,11 +1531,8 @@ class APIMethods:
         Use this method to move a sticker in a set created by the bot to a specific
         position. Returns True on success.
         """
-        response = await self.api.request(
-            "setStickerPositionInSet", self.get_params(locals())
-        )
-        return response
 
+    @api_method("deleteStickerFromSet")
     async def delete_sticker_from_set(
         self, sticker: Optional[str] = None, **kwargs
     ) -> bool:
@@ -1460,11 +1540,8 @@ class APIMethods:
         Use this method to delete a sticker from a set created by the bot. Returns True on
         success.
         """
-        response = await self.api.request(
-            "deleteStickerFromSet", self.get_params(locals())
-        )
-        return response
 
+    @api_method("setStickerSetThumb")
     async def set_sticker_set_thumb(
         self,
         name: Optional[str] = None,
@@ -1477,11 +1554,8 @@ class APIMethods:
         set for animated sticker sets only. Video thumbnails can be set only for video
         sticker sets only. Returns True on success.
         """
-        response = await self.api.request(
-            "setStickerSetThumb", self.get_params(locals())
-        )
-        return response
 
+    @api_method("answerInlineQuery")
     async def answer_inline_query(
         self,
         inline_query_id: Optional[str] = None,
@@ -1497,11 +1571,8 @@ class APIMethods:
         Use this method to send answers to an inline query. On success, True is returned. No
         more than 50 results per query are allowed.
         """
-        response = await self.api.request(
-            "answerInlineQuery", self.get_params(locals())
-        )
-        return response
 
+    @api_method("answerWebAppQuery")
     async def answer_web_app_query(
         self,
         web_app_query_id: Optional[str] = None,
@@ -1513,11 +1584,8 @@ class APIMethods:
         corresponding message on behalf of the user to the chat from which the query
         originated. On success, a SentWebAppMessage object is returned.
         """
-        response = await self.api.request(
-            "answerWebAppQuery", self.get_params(locals())
-        )
-        return SentWebAppMessage(**response)
 
+    @api_method("sendInvoice")
     async def send_invoice(
         self,
         chat_id: Optional[Union[int, str]] = None,
@@ -1552,9 +1620,8 @@ class APIMethods:
         """
         Use this method to send invoices. On success, the sent Message is returned.
         """
-        response = await self.api.request("sendInvoice", self.get_params(locals()))
-        return Message(**response)
 
+    @api_method("createInvoiceLink")
     async def create_invoice_link(
         self,
         title: Optional[str] = None,
@@ -1583,11 +1650,8 @@ class APIMethods:
         Use this method to create a link for an invoice. Returns the created invoice link as
         String on success.
         """
-        response = await self.api.request(
-            "createInvoiceLink", self.get_params(locals())
-        )
-        return response
 
+    @api_method("answerShippingQuery")
     async def answer_shipping_query(
         self,
         shipping_query_id: Optional[str] = None,
@@ -1601,11 +1665,8 @@ class APIMethods:
         was specified, the Bot API will send an Update with a shipping_query field to the
         bot. Use this method to reply to shipping queries. On success, True is returned.
         """
-        response = await self.api.request(
-            "answerShippingQuery", self.get_params(locals())
-        )
-        return response
 
+    @api_method("answerPreCheckoutQuery")
     async def answer_pre_checkout_query(
         self,
         pre_checkout_query_id: Optional[str] = None,
@@ -1620,11 +1681,8 @@ class APIMethods:
         returned. Note: The Bot API must receive an answer within 10 seconds after the pre-
         checkout query was sent.
         """
-        response = await self.api.request(
-            "answerPreCheckoutQuery", self.get_params(locals())
-        )
-        return response
 
+    @api_method("setPassportDataErrors")
     async def set_passport_data_errors(
         self,
         user_id: Optional[int] = None,
@@ -1641,11 +1699,8 @@ class APIMethods:
         of tampering, etc. Supply some details in the error message to make sure the user
         knows how to correct the issues.
         """
-        response = await self.api.request(
-            "setPassportDataErrors", self.get_params(locals())
-        )
-        return response
 
+    @api_method("sendGame")
     async def send_game(
         self,
         chat_id: Optional[int] = None,
@@ -1660,9 +1715,8 @@ class APIMethods:
         """
         Use this method to send a game. On success, the sent Message is returned.
         """
-        response = await self.api.request("sendGame", self.get_params(locals()))
-        return Message(**response)
 
+    @api_method("setGameScore")
     async def set_game_score(
         self,
         user_id: Optional[int] = None,
@@ -1680,9 +1734,8 @@ class APIMethods:
         True is returned. Returns an error, if the new score is not greater than the user's
         current score in the chat and force is False.
         """
-        response = await self.api.request("setGameScore", self.get_params(locals()))
-        return parse_obj_as(Union[Message, bool], response)
 
+    @api_method("getGameHighScores")
     async def get_game_high_scores(
         self,
         user_id: Optional[int] = None,
@@ -1699,7 +1752,3 @@ class APIMethods:
         top three users if the user and their neighbors are not among them. Please note that
         this behavior is subject to change.
         """
-        response = await self.api.request(
-            "getGameHighScores", self.get_params(locals())
-        )
-        return parse_obj_as(List[GameHighScore], response)
@@ -4,8 +4,12 @@ from typing import *
 
 from pydantic import BaseModel, Field
 
+from telefone_types._compat import rebuild_model
+from telefone_types.base import Model
+from telefone_types.unions import discriminated_union, dispatch_fields
 
-class Update(BaseModel):
+
+class Update(Model):
     """
     This object represents an incoming update. At most one of the optional parameters
     can be present in any given update.
@@ -28,7 +32,7 @@ class Update(BaseModel):
     chat_join_request: Optional["ChatJoinRequest"] = Field(default=None)
 
 
-class WebhookInfo(BaseModel):
+class WebhookInfo(Model):
     """
     Describes the current status of a webhook.
     """
@@ -44,7 +48,7 @@ class WebhookInfo(BaseModel):
     allowed_updates: Optional[List[str]] = Field(default=None)
 
 
-class User(BaseModel):
+class User(Model):
     """
     This object represents a Telegram user or bot.
     """
@@ -62,7 +66,7 @@ class User(BaseModel):
     supports_inline_queries: Optional[bool] = Field(default=None)
 
 
-class Chat(BaseModel):
+class Chat(Model):
     """
     This object represents a chat.
     """
@@ -93,7 +97,7 @@ class Chat(BaseModel):
     location: Optional["ChatLocation"] = Field(default=None)
 
 
-class Message(BaseModel):
+class Message(Model):
     """
     This object represents a message.
     """
@@ -163,7 +167,7 @@ class Message(BaseModel):
     reply_markup: Optional["InlineKeyboardMarkup"] = Field(default=None)
 
 
-class MessageId(BaseModel):
+class MessageId(Model):
     """
     This object represents a unique message identifier.
     """
@@ -171,7 +175,7 @@ class MessageId(BaseModel):
     message_id: Optional[int] = Field(default=None)
 
 
-class MessageEntity(BaseModel):
+class MessageEntity(Model):
     """
     This object represents one special entity in a text message. For example, hashtags,
     usernames, URLs, etc.
@@ -204,7 +208,7 @@ class MessageEntity(BaseModel):
     language: Optional[str] = Field(default=None)
 
 
-class PhotoSize(BaseModel):
+class PhotoSize(Model):
     """
     This object represents one size of a photo or a file / sticker thumbnail.
     """
@@ -216,7 +220,7 @@ class PhotoSize(BaseModel):
     file_size: Optional[int] = Field(default=None)
 
 
-class Animation(BaseModel):
+class Animation(Model):
     """
     This object represents an animation file (GIF or H.264/MPEG-4 AVC video without
     sound).
@@ -233,7 +237,7 @@ class Animation(BaseModel):
     file_size: Optional[int] = Field(default=None)
 
 
-class Audio(BaseModel):
+class Audio(Model):
     """
     This object represents an audio file to be treated as music by the Telegram clients.
     """
@@ -249,7 +253,7 @@ class Audio(BaseModel):
     thumb: Optional["PhotoSize"] = Field(default=None)
 
 
-class Document(BaseModel):
+class Document(Model):
     """
     This object represents a general file (as opposed to photos, voice messages and
     audio files).
@@ -263,7 +267,7 @@ class Document(BaseModel):
     file_size: Optional[int] = Field(default=None)
 
 
-class Video(BaseModel):
+class Video(Model):
     """
     This object represents a video file.
     """
@@ -279,7 +283,7 @@ class Video(BaseModel):
     file_size: Optional[int] = Field(default=None)
 
 
-class VideoNote(BaseModel):
+class VideoNote(Model):
     """
     This object represents a video message (available in Telegram apps as of v.4.0).
     """
@@ -292,7 +296,7 @@ class VideoNote(BaseModel):
     file_size: Optional[int] = Field(default=None)
 
 
-class Voice(BaseModel):
+class Voice(Model):
     """
     This object represents a voice note.
     """
@@ -304,7 +308,7 @@ class Voice(BaseModel):
     file_size: Optional[int] = Field(default=None)
 
 
-class Contact(BaseModel):
+class Contact(Model):
     """
     This object represents a phone contact.
     """
@@ -316,7 +320,7 @@ class Contact(BaseModel):
     vcard: Optional[str] = Field(default=None)
 
 
-class Dice(BaseModel):
+class Dice(Model):
     """
     This object represents an animated emoji that displays a random value.
     """
@@ -325,7 +329,7 @@ class Dice(BaseModel):
     value: Optional[int] = Field(default=None)
 
 
-class PollOption(BaseModel):
+class PollOption(Model):
     """
     This object contains information about one answer option in a poll.
     """
@@ -334,7 +338,7 @@ class PollOption(BaseModel):
     voter_count: Optional[int] = Field(default=None)
 
 
-class PollAnswer(BaseModel):
+class PollAnswer(Model):
     """
     This object represents an answer of a user in a non-anonymous poll.
     """
@@ -344,7 +348,7 @@ class PollAnswer(BaseModel):
     option_ids: Optional[List[int]] = Field(default=None)
 
 
-class Poll(BaseModel):
+class Poll(Model):
     """
     This object contains information about a poll.
     """
@@ -364,7 +368,7 @@ class Poll(BaseModel):
     close_date: Optional[int] = Field(default=None)
 
 
-class Location(BaseModel):
+class Location(Model):
     """
     This object represents a point on the map.
     """
@@ -377,7 +381,7 @@ class Location(BaseModel):
     proximity_alert_radius: Optional[int] = Field(default=None)
 
 
-class Venue(BaseModel):
+class Venue(Model):
     """
     This object represents a venue.
     """
@@ -391,7 +395,7 @@ class Venue(BaseModel):
     google_place_type: Optional[str] = Field(default=None)
 
 
-class WebAppData(BaseModel):
+class WebAppData(Model):
     """
     Describes data sent from a Web App to the bot.
     """
@@ -400,7 +404,7 @@ class WebAppData(BaseModel):
     button_text: Optional[str] = Field(default=None)
 
 
-class ProximityAlertTriggered(BaseModel):
+class ProximityAlertTriggered(Model):
     """
     This object represents the content of a service message, sent whenever a user in the
     chat triggers a proximity alert set by another user.
@@ -411,7 +415,7 @@ class ProximityAlertTriggered(BaseModel):
     distance: Optional[int] = Field(default=None)
 
 
-class MessageAutoDeleteTimerChanged(BaseModel):
+class MessageAutoDeleteTimerChanged(Model):
     """
     This object represents a service message about a change in auto-delete timer
     settings.
@@ -420,7 +424,7 @@ class MessageAutoDeleteTimerChanged(BaseModel):
     message_auto_delete_time: Optional[int] = Field(default=None)
 
 
-class VideoChatScheduled(BaseModel):
+class VideoChatScheduled(Model):
     """
     This object represents a service message about a video chat scheduled in the chat.
     """
@@ -428,7 +432,7 @@ class VideoChatScheduled(BaseModel):
     start_date: Optional[int] = Field(default=None)
 
 
-class VideoChatStarted(BaseModel):
+class VideoChatStarted(Model):
     """
     This object represents a service message about a video chat started in the chat.
     Currently holds no information.
@@ -437,7 +441,7 @@ class VideoChatStarted(BaseModel):
     pass
 
 
-class VideoChatEnded(BaseModel):
+class VideoChatEnded(Model):
     """
     This object represents a service message about a video chat ended in the chat.
     """
@@ -445,7 +449,7 @@ class VideoChatEnded(BaseModel):
     duration: Optional[int] = Field(default=None)
 
 
-class VideoChatParticipantsInvited(BaseModel):
+class VideoChatParticipantsInvited(Model):
     """
     This object represents a service message about new members invited to a video chat.
     """
@@ -453,7 +457,7 @@ class VideoChatParticipantsInvited(BaseModel):
     users: Optional[List["User"]] = Field(default=None)
 
 
-class UserProfilePhotos(BaseModel):
+class UserProfilePhotos(Model):
     """
     This object represent a user's profile pictures.
     """
@@ -462,7 +466,7 @@ class UserProfilePhotos(BaseModel):
     photos: Optional[List[List["PhotoSize"]]] = Field(default=None)
 
 
-class File(BaseModel):
+class File(Model):
     """
     This object represents a file ready to be downloaded. The file can be downloaded via
     the link https://api.telegram.org/file/bot&lt;token&gt;/&lt;file_path&gt;. It is
@@ -477,7 +481,7 @@ class File(BaseModel):
     file_path: Optional[str] = Field(default=None)
 
 
-class WebAppInfo(BaseModel):
+class WebAppInfo(Model):
     """
     Describes a Web App.
     """
@@ -485,7 +489,7 @@ class WebAppInfo(BaseModel):
     url: Optional[str] = Field(default=None)
 
 
-class ReplyKeyboardMarkup(BaseModel):
+class ReplyKeyboardMarkup(Model):
     """
     This object represents a custom keyboard with reply options (see Introduction to
     bots for details and examples).
@@ -498,7 +502,7 @@ class ReplyKeyboardMarkup(BaseModel):
     selective: Optional[bool] = Field(default=None)
 
 
-class KeyboardButton(BaseModel):
+class KeyboardButton(Model):
     """
     This object represents one button of the reply keyboard. For simple text buttons
     String can be used instead of this object to specify text of the button. Optional
@@ -513,7 +517,7 @@ class KeyboardButton(BaseModel):
     web_app: Optional["WebAppInfo"] = Field(default=None)
 
 
-class KeyboardButtonPollType(BaseModel):
+class KeyboardButtonPollType(Model):
     """
     This object represents type of a poll, which is allowed to be created and sent when
     the corresponding button is pressed.
@@ -522,7 +526,7 @@ class KeyboardButtonPollType(BaseModel):
     type: Optional[str] = Field(default=None)
 
 
-class ReplyKeyboardRemove(BaseModel):
+class ReplyKeyboardRemove(Model):
     """
     Upon receiving a message with this object, Telegram clients will remove the current
     custom keyboard and display the default letter-keyboard. By default, custom
@@ -535,7 +539,7 @@ class ReplyKeyboardRemove(BaseModel):
     selective: Optional[bool] = Field(default=None)
 
 
-class InlineKeyboardMarkup(BaseModel):
+class InlineKeyboardMarkup(Model):
     """
     This object represents an inline keyboard that appears right next to the message it
     belongs to.
@@ -544,7 +548,7 @@ class InlineKeyboardMarkup(BaseModel):
     inline_keyboard: Optional[List[List["InlineKeyboardButton"]]] = Field(default=None)
 
 
-class InlineKeyboardButton(BaseModel):
+class InlineKeyboardButton(Model):
     """
     This object represents one button of an inline keyboard. You must use exactly one of
     the optional fields.
@@ -561,7 +565,7 @@ class InlineKeyboardButton(BaseModel):
     pay: Optional[bool] = Field(default=None)
 
 
-class LoginUrl(BaseModel):
+class LoginUrl(Model):
     """
     This object represents a parameter of the inline keyboard button used to
     automatically authorize a user. Serves as a great replacement for the Telegram Login
@@ -576,7 +580,7 @@ class LoginUrl(BaseModel):
     request_write_access: Optional[bool] = Field(default=None)
 
 
-class CallbackQuery(BaseModel):
+class CallbackQuery(Model):
     """
     This object represents an incoming callback query from a callback button in an
     inline keyboard. If the button that originated the query was attached to a message
@@ -594,7 +598,7 @@ class CallbackQuery(BaseModel):
     game_short_name: Optional[str] = Field(default=None)
 
 
-class ForceReply(BaseModel):
+class ForceReply(Model):
     """
     Upon receiving a message with this object, Telegram clients will display a reply
     interface to the user (act as if the user has selected the bot's message and tapped
@@ -607,7 +611,7 @@ class ForceReply(BaseModel):
     selective: Optional[bool] = Field(default=None)
 
 
-class ChatPhoto(BaseModel):
+class ChatPhoto(Model):
     """
     This object represents a chat photo.
     """
@@ -618,7 +622,7 @@ class ChatPhoto(BaseModel):
     big_file_unique_id: Optional[str] = Field(default=None)
 
 
-class ChatInviteLink(BaseModel):
+class ChatInviteLink(Model):
     """
     Represents an invite link for a chat.
     """
@@ -634,7 +638,7 @@ class ChatInviteLink(BaseModel):
     pending_join_request_count: Optional[int] = Field(default=None)
 
 
-class ChatAdministratorRights(BaseModel):
+class ChatAdministratorRights(Model):
     """
     Represents the rights of an administrator in a chat.
     """
@@ -652,7 +656,7 @@ class ChatAdministratorRights(BaseModel):
     can_pin_messages: Optional[bool] = Field(default=None)
 
 
-class ChatMemberOwner(BaseModel):
+class ChatMemberOwner(Model):
     """
     Represents a chat member that owns the chat and has all administrator privileges.
     """
@@ -663,7 +667,7 @@ class ChatMemberOwner(BaseModel):
     custom_title: Optional[str] = Field(default=None)
 
 
-class ChatMemberAdministrator(BaseModel):
+class ChatMemberAdministrator(Model):
     """
     Represents a chat member that has some additional privileges.
     """
@@ -685,7 +689,7 @@ class ChatMemberAdministrator(BaseModel):
     custom_title: Optional[str] = Field(default=None)
 
 
-class ChatMemberMember(BaseModel):
+class ChatMemberMember(Model):
     """
     Represents a chat member that has no additional privileges or restrictions.
     """
@@ -694,7 +698,7 @@ class ChatMemberMember(BaseModel):
     user: Optional["User"] = Field(default=None)
 
 
-class ChatMemberRestricted(BaseModel):
+class ChatMemberRestricted(Model):
     """
     Represents a chat member that is under certain restrictions in the chat. Supergroups
     only.
@@ -714,7 +718,7 @@ class ChatMemberRestricted(BaseModel):
     until_date: Optional[int] = Field(default=None)
 
 
-class ChatMemberLeft(BaseModel):
+class ChatMemberLeft(Model):
     """
     Represents a chat member that isn't currently a member of the chat, but may join it
     themselves.
@@ -724,7 +728,7 @@ class ChatMemberLeft(BaseModel):
     user: Optional["User"] = Field(default=None)
 
 
-class ChatMemberBanned(BaseModel):
+class ChatMemberBanned(Model):
     """
     Represents a chat member that was banned in the chat and can't return to the chat or
     view chat messages.
@@ -735,7 +739,7 @@ class ChatMemberBanned(BaseModel):
     until_date: Optional[int] = Field(default=None)
 
 
-class ChatMemberUpdated(BaseModel):
+class ChatMemberUpdated(Model):
     """
     This object represents changes in the status of a chat member.
     """
@@ -748,7 +752,7 @@ class ChatMemberUpdated(BaseModel):
     invite_link: Optional["ChatInviteLink"] = Field(default=None)
 
 
-class ChatJoinRequest(BaseModel):
+class ChatJoinRequest(Model):
     """
     Represents a join request sent to a chat.
     """
@@ -760,7 +764,7 @@ class ChatJoinRequest(BaseModel):
     invite_link: Optional["ChatInviteLink"] = Field(default=None)
 
 
-class ChatPermissions(BaseModel):
+class ChatPermissions(Model):
     """
     Describes actions that a non-administrator user is allowed to take in a chat.
     """
@@ -775,7 +779,7 @@ class ChatPermissions(BaseModel):
     can_pin_messages: Optional[bool] = Field(default=None)
 
 
-class ChatLocation(BaseModel):
+class ChatLocation(Model):
     """
     Represents a location to which a chat is connected.
     """
@@ -784,7 +788,7 @@ class ChatLocation(BaseModel):
     address: Optional[str] = Field(default=None)
 
 
-class BotCommand(BaseModel):
+class BotCommand(Model):
     """
     This object represents a bot command.
     """
@@ -793,7 +797,7 @@ class BotCommand(BaseModel):
     description: Optional[str] = Field(default=None)
 
 
-class BotCommandScopeDefault(BaseModel):
+class BotCommandScopeDefault(Model):
     """
     Represents the default scope of bot commands. Default commands are used if no
     commands with a narrower scope are specified for the user.
@@ -802,7 +806,7 @@ class BotCommandScopeDefault(BaseModel):
     type: Optional[Literal["default"]] = Field(default=None)
 
 
-class BotCommandScopeAllPrivateChats(BaseModel):
+class BotCommandScopeAllPrivateChats(Model):
     """
     Represents the scope of bot commands, covering all private chats.
     """
@@ -810,7 +814,7 @@ class BotCommandScopeAllPrivateChats(BaseModel):
     type: Optional[Literal["all_private_chats"]] = Field(default=None)
 
 
-class BotCommandScopeAllGroupChats(BaseModel):
+class BotCommandScopeAllGroupChats(Model):
     """
     Represents the scope of bot commands, covering all group and supergroup chats.
     """
@@ -818,7 +822,7 @@ class BotCommandScopeAllGroupChats(BaseModel):
     type: Optional[Literal["all_group_chats"]] = Field(default=None)
 
 
-class BotCommandScopeAllChatAdministrators(BaseModel):
+class BotCommandScopeAllChatAdministrators(Model):
     """
     Represents the scope of bot commands, covering all group and supergroup chat
     administrators.
@@ -827,7 +831,7 @@ class BotCommandScopeAllChatAdministrators(BaseModel):
     type: Optional[Literal["all_chat_administrators"]] = Field(default=None)
 
 
-class BotCommandScopeChat(BaseModel):
+class BotCommandScopeChat(Model):
     """
     Represents the scope of bot commands, covering a specific chat.
     """
@@ -836,7 +840,7 @@ class BotCommandScopeChat(BaseModel):
     chat_id: Optional[Union[int, str]] = Field(default=None)
 
 
-class BotCommandScopeChatAdministrators(BaseModel):
+class BotCommandScopeChatAdministrators(Model):
     """
     Represents the scope of bot commands, covering all administrators of a specific
     group or supergroup chat.
@@ -846,7 +850,7 @@ class BotCommandScopeChatAdministrators(BaseModel):
     chat_id: Optional[Union[int, str]] = Field(default=None)
 
 
-class BotCommandScopeChatMember(BaseModel):
+class BotCommandScopeChatMember(Model):
     """
     Represents the scope of bot commands, covering a specific member of a group or
     supergroup chat.
@@ -857,7 +861,7 @@ class BotCommandScopeChatMember(BaseModel):
     user_id: Optional[int] = Field(default=None)
 
 
-class MenuButtonCommands(BaseModel):
+class MenuButtonCommands(Model):
     """
     Represents a menu button, which opens the bot's list of commands.
     """
@@ -865,7 +869,7 @@ class MenuButtonCommands(BaseModel):
     type: Optional[Literal["commands"]] = Field(default=None)
 
 
-class MenuButtonWebApp(BaseModel):
+class MenuButtonWebApp(Model):
     """
     Represents a menu button, which launches a Web App.
     """
@@ -875,7 +879,7 @@ class MenuButtonWebApp(BaseModel):
     web_app: Optional["WebAppInfo"] = Field(default=None)
 
 
-class MenuButtonDefault(BaseModel):
+class MenuButtonDefault(Model):
     """
     Describes that no specific value for the menu button was set.
     """
@@ -883,7 +887,7 @@ class MenuButtonDefault(BaseModel):
     type: Optional[Literal["default"]] = Field(default=None)
 
 
-class ResponseParameters(BaseModel):
+class ResponseParameters(Model):
     """
     Describes why a request was unsuccessful.
     """
@@ -892,7 +896,7 @@ class ResponseParameters(BaseModel):
     retry_after: Optional[int] = Field(default=None)
 
 
-class InputMediaPhoto(BaseModel):
+class InputMediaPhoto(Model):
     """
     Represents a photo to be sent.
     """
@@ -904,7 +908,7 @@ class InputMediaPhoto(BaseModel):
     caption_entities: Optional[List["MessageEntity"]] = Field(default=None)
 
 
-class InputMediaVideo(BaseModel):
+class InputMediaVideo(Model):
     """
     Represents a video to be sent.
     """
@@ -921,7 +925,7 @@ class InputMediaVideo(BaseModel):
     supports_streaming: Optional[bool] = Field(default=None)
 
 
-class InputMediaAnimation(BaseModel):
+class InputMediaAnimation(Model):
     """
     Represents an animation file (GIF or H.264/MPEG-4 AVC video without sound) to be
     sent.
@@ -938,7 +942,7 @@ class InputMediaAnimation(BaseModel):
     duration: Optional[int] = Field(default=None)
 
 
-class InputMediaAudio(BaseModel):
+class InputMediaAudio(Model):
     """
     Represents an audio file to be treated as music to be sent.
     """
@@ -954,7 +958,7 @@ class InputMediaAudio(BaseModel):
     title: Optional[str] = Field(default=None)
 
 
-class InputMediaDocument(BaseModel):
+class InputMediaDocument(Model):
     """
     Represents a general file to be sent.
     """
@@ -968,7 +972,7 @@ class InputMediaDocument(BaseModel):
     disable_content_type_detection: Optional[bool] = Field(default=None)
 
 
-class InputFile(BaseModel):
+class InputFile(Model):
     """
     This object represents the contents of a file to be uploaded. Must be posted using
     multipart/form-data in the usual way that files are uploaded via the browser.
@@ -977,7 +981,7 @@ class InputFile(BaseModel):
     pass
 
 
-class Sticker(BaseModel):
+class Sticker(Model):
     """
     This object represents a sticker.
     """
@@ -996,7 +1000,7 @@ class Sticker(BaseModel):
     file_size: Optional[int] = Field(default=None)
 
 
-class StickerSet(BaseModel):
+class StickerSet(Model):
     """
     This object represents a sticker set.
     """
@@ -1010,7 +1014,7 @@ class StickerSet(BaseModel):
     thumb: Optional["PhotoSize"] = Field(default=None)
 
 
-class MaskPosition(BaseModel):
+class MaskPosition(Model):
     """
     This object describes the position on faces where a mask should be placed by
     default.
@@ -1022,7 +1026,7 @@ class MaskPosition(BaseModel):
     scale: Optional[float] = Field(default=None)
 
 
-class InlineQuery(BaseModel):
+class InlineQuery(Model):
     """
     This object represents an incoming inline query. When the user sends an empty query,
     your bot could return some default or trending results.
@@ -1038,7 +1042,7 @@ class InlineQuery(BaseModel):
     location: Optional["Location"] = Field(default=None)
 
 
-class InlineQueryResultArticle(BaseModel):
+class InlineQueryResultArticle(Model):
     """
     Represents a link to an article or web page.
     """
@@ -1056,7 +1060,7 @@ class InlineQueryResultArticle(BaseModel):
     thumb_height: Optional[int] = Field(default=None)
 
 
-class InlineQueryResultPhoto(BaseModel):
+class InlineQueryResultPhoto(Model):
     """
     Represents a link to a photo. By default, this photo will be sent by the user with
     optional caption. Alternatively, you can use input_message_content to send a message
@@ -1078,7 +1082,7 @@ class InlineQueryResultPhoto(BaseModel):
     input_message_content: Optional["InputMessageContent"] = Field(default=None)
 
 
-class InlineQueryResultGif(BaseModel):
+class InlineQueryResultGif(Model):
     """
     Represents a link to an animated GIF file. By default, this animated GIF file will
     be sent by the user with optional caption. Alternatively, you can use
@@ -1104,7 +1108,7 @@ class InlineQueryResultGif(BaseModel):
     input_message_content: Optional["InputMessageContent"] = Field(default=None)
 
 
-class InlineQueryResultMpeg4Gif(BaseModel):
+class InlineQueryResultMpeg4Gif(Model):
     """
     Represents a link to a video animation (H.264/MPEG-4 AVC video without sound). By
     default, this animated MPEG-4 file will be sent by the user with optional caption.
@@ -1130,7 +1134,7 @@ class InlineQueryResultMpeg4Gif(BaseModel):
     input_message_content: Optional["InputMessageContent"] = Field(default=None)
 
 
-class InlineQueryResultVideo(BaseModel):
+class InlineQueryResultVideo(Model):
     """
     Represents a link to a page containing an embedded video player or a video file. By
     default, this video file will be sent by the user with an optional caption.
@@ -1157,7 +1161,7 @@ class InlineQueryResultVideo(BaseModel):
     input_message_content: Optional["InputMessageContent"] = Field(default=None)
 
 
-class InlineQueryResultAudio(BaseModel):
+class InlineQueryResultAudio(Model):
     """
     Represents a link to an MP3 audio file. By default, this audio file will be sent by
     the user. Alternatively, you can use input_message_content to send a message with
@@ -1177,7 +1181,7 @@ class InlineQueryResultAudio(BaseModel):
     input_message_content: Optional["InputMessageContent"] = Field(default=None)
 
 
-class InlineQueryResultVoice(BaseModel):
+class InlineQueryResultVoice(Model):
     """
     Represents a link to a voice recording in an .OGG container encoded with OPUS. By
     default, this voice recording will be sent by the user. Alternatively, you can use
@@ -1197,7 +1201,7 @@ class InlineQueryResultVoice(BaseModel):
     input_message_content: Optional["InputMessageContent"] = Field(default=None)
 
 
-class InlineQueryResultDocument(BaseModel):
+class InlineQueryResultDocument(Model):
     """
     Represents a link to a file. By default, this file will be sent by the user with an
     optional caption. Alternatively, you can use input_message_content to send a message
@@ -1223,7 +1227,7 @@ class InlineQueryResultDocument(BaseModel):
     thumb_height: Optional[int] = Field(default=None)
 
 
-class InlineQueryResultLocation(BaseModel):
+class InlineQueryResultLocation(Model):
     """
     Represents a location on a map. By default, the location will be sent by the user.
     Alternatively, you can use input_message_content to send a message with the
@@ -1246,7 +1250,7 @@ class InlineQueryResultLocation(BaseModel):
     thumb_height: Optional[int] = Field(default=None)
 
 
-class InlineQueryResultVenue(BaseModel):
+class InlineQueryResultVenue(Model):
     """
     Represents a venue. By default, the venue will be sent by the user. Alternatively,
     you can use input_message_content to send a message with the specified content
@@ -1270,7 +1274,7 @@ class InlineQueryResultVenue(BaseModel):
     thumb_height: Optional[int] = Field(default=None)
 
 
-class InlineQueryResultContact(BaseModel):
+class InlineQueryResultContact(Model):
     """
     Represents a contact with a phone number. By default, this contact will be sent by
     the user. Alternatively, you can use input_message_content to send a message with
@@ -1290,7 +1294,7 @@ class InlineQueryResultContact(BaseModel):
     thumb_height: Optional[int] = Field(default=None)
 
 
-class InlineQueryResultGame(BaseModel):
+class InlineQueryResultGame(Model):
     """
     Represents a Game.
     """
@@ -1301,7 +1305,7 @@ class InlineQueryResultGame(BaseModel):
     reply_markup: Optional["InlineKeyboardMarkup"] = Field(default=None)
 
 
-class InlineQueryResultCachedPhoto(BaseModel):
+class InlineQueryResultCachedPhoto(Model):
     """
     Represents a link to a photo stored on the Telegram servers. By default, this photo
     will be sent by the user with an optional caption. Alternatively, you can use
@@ -1321,7 +1325,7 @@ class InlineQueryResultCachedPhoto(BaseModel):
     input_message_content: Optional["InputMessageContent"] = Field(default=None)
 
 
-class InlineQueryResultCachedGif(BaseModel):
+class InlineQueryResultCachedGif(Model):
     """
     Represents a link to an animated GIF file stored on the Telegram servers. By
     default, this animated GIF file will be sent by the user with an optional caption.
@@ -1340,7 +1344,7 @@ class InlineQueryResultCachedGif(BaseModel):
     input_message_content: Optional["InputMessageContent"] = Field(default=None)
 
 
-class InlineQueryResultCachedMpeg4Gif(BaseModel):
+class InlineQueryResultCachedMpeg4Gif(Model):
     """
     Represents a link to a video animation (H.264/MPEG-4 AVC video without sound) stored
     on the Telegram servers. By default, this animated MPEG-4 file will be sent by the
@@ -1359,7 +1363,7 @@ class InlineQueryResultCachedMpeg4Gif(BaseModel):
     input_message_content: Optional["InputMessageContent"] = Field(default=None)
 
 
-class InlineQueryResultCachedSticker(BaseModel):
+class InlineQueryResultCachedSticker(Model):
     """
     Represents a link to a sticker stored on the Telegram servers. By default, this
     sticker will be sent by the user. Alternatively, you can use input_message_content
@@ -1373,7 +1377,7 @@ class InlineQueryResultCachedSticker(BaseModel):
     input_message_content: Optional["InputMessageContent"] = Field(default=None)
 
 
-class InlineQueryResultCachedDocument(BaseModel):
+class InlineQueryResultCachedDocument(Model):
     """
     Represents a link to a file stored on the Telegram servers. By default, this file
     will be sent by the user with an optional caption. Alternatively, you can use
@@ -1393,7 +1397,7 @@ class InlineQueryResultCachedDocument(BaseModel):
     input_message_content: Optional["InputMessageContent"] = Field(default=None)
 
 
-class InlineQueryResultCachedVideo(BaseModel):
+class InlineQueryResultCachedVideo(Model):
     """
     Represents a link to a video file stored on the Telegram servers. By default, this
     video file will be sent by the user with an optional caption. Alternatively, you can
@@ -1413,7 +1417,7 @@ class InlineQueryResultCachedVideo(BaseModel):
     input_message_content: Optional["InputMessageContent"] = Field(default=None)
 
 
-class InlineQueryResultCachedVoice(BaseModel):
+class InlineQueryResultCachedVoice(Model):
     """
     Represents a link to a voice message stored on the Telegram servers. By default,
     this voice message will be sent by the user. Alternatively, you can use
@@ -1432,7 +1436,7 @@ class InlineQueryResultCachedVoice(BaseModel):
     input_message_content: Optional["InputMessageContent"] = Field(default=None)
 
 
-class InlineQueryResultCachedAudio(BaseModel):
+class InlineQueryResultCachedAudio(Model):
     """
     Represents a link to an MP3 audio file stored on the Telegram servers. By default,
     this audio file will be sent by the user. Alternatively, you can use
@@ -1450,7 +1454,7 @@ class InlineQueryResultCachedAudio(BaseModel):
     input_message_content: Optional["InputMessageContent"] = Field(default=None)
 
 
-class InputTextMessageContent(BaseModel):
+class InputTextMessageContent(Model):
     """
     Represents the content of a text message to be sent as the result of an inline
     query.
@@ -1462,7 +1466,7 @@ class InputTextMessageContent(BaseModel):
     disable_web_page_preview: Optional[bool] = Field(default=None)
 
 
-class InputLocationMessageContent(BaseModel):
+class InputLocationMessageContent(Model):
     """
     Represents the content of a location message to be sent as the result of an inline
     query.
@@ -1476,7 +1480,7 @@ class InputLocationMessageContent(BaseModel):
     proximity_alert_radius: Optional[int] = Field(default=None)
 
 
-class InputVenueMessageContent(BaseModel):
+class InputVenueMessageContent(Model):
     """
     Represents the content of a venue message to be sent as the result of an inline
     query.
@@ -1492,7 +1496,7 @@ class InputVenueMessageContent(BaseModel):
     google_place_type: Optional[str] = Field(default=None)
 
 
-class InputContactMessageContent(BaseModel):
+class InputContactMessageContent(Model):
     """
     Represents the content of a contact message to be sent as the result of an inline
     query.
@@ -1504,7 +1508,7 @@ class InputContactMessageContent(BaseModel):
     vcard: Optional[str] = Field(default=None)
 
 
-class InputInvoiceMessageContent(BaseModel):
+class InputInvoiceMessageContent(Model):
     """
     Represents the content of an invoice message to be sent as the result of an inline
     query.
@@ -1532,7 +1536,7 @@ class InputInvoiceMessageContent(BaseModel):
     is_flexible: Optional[bool] = Field(default=None)
 
 
-class ChosenInlineResult(BaseModel):
+class ChosenInlineResult(Model):
     """
     Represents a result of an inline query that was chosen by the user and sent to their
     chat partner.
@@ -1545,7 +1549,7 @@ class ChosenInlineResult(BaseModel):
     query: Optional[str] = Field(default=None)
 
 
-class SentWebAppMessage(BaseModel):
+class SentWebAppMessage(Model):
     """
     Describes an inline message sent by a Web App on behalf of a user.
     """
@@ -1553,7 +1557,7 @@ class SentWebAppMessage(BaseModel):
     inline_message_id: Optional[str] = Field(default=None)
 
 
-class LabeledPrice(BaseModel):
+class LabeledPrice(Model):
     """
     This object represents a portion of the price for goods or services.
     """
@@ -1562,7 +1566,7 @@ class LabeledPrice(BaseModel):
     amount: Optional[int] = Field(default=None)
 
 
-class Invoice(BaseModel):
+class Invoice(Model):
     """
     This object contains basic information about an invoice.
     """
@@ -1574,7 +1578,7 @@ class Invoice(BaseModel):
     total_amount: Optional[int] = Field(default=None)
 
 
-class ShippingAddress(BaseModel):
+class ShippingAddress(Model):
     """
     This object represents a shipping address.
     """
@@ -1587,7 +1591,7 @@ class ShippingAddress(BaseModel):
     post_code: Optional[str] = Field(default=None)
 
 
-class OrderInfo(BaseModel):
+class OrderInfo(Model):
     """
     This object represents information about an order.
     """
@@ -1598,7 +1602,7 @@ class OrderInfo(BaseModel):
     shipping_address: Optional["ShippingAddress"] = Field(default=None)
 
 
-class ShippingOption(BaseModel):
+class ShippingOption(Model):
     """
     This object represents one shipping option.
     """
@@ -1608,7 +1612,7 @@ class ShippingOption(BaseModel):
     prices: Optional[List["LabeledPrice"]] = Field(default=None)
 
 
-class SuccessfulPayment(BaseModel):
+class SuccessfulPayment(Model):
     """
     This object contains basic information about a successful payment.
     """
@@ -1622,7 +1626,7 @@ class SuccessfulPayment(BaseModel):
     provider_payment_charge_id: Optional[str] = Field(default=None)
 
 
-class ShippingQuery(BaseModel):
+class ShippingQuery(Model):
     """
     This object contains information about an incoming shipping query.
     """
@@ -1633,7 +1637,7 @@ class ShippingQuery(BaseModel):
     shipping_address: Optional["ShippingAddress"] = Field(default=None)
 
 
-class PreCheckoutQuery(BaseModel):
+class PreCheckoutQuery(Model):
     """
     This object contains information about an incoming pre-checkout query.
     """
@@ -1647,7 +1651,7 @@ class PreCheckoutQuery(BaseModel):
     order_info: Optional["OrderInfo"] = Field(default=None)
 
 
-class PassportData(BaseModel):
+class PassportData(Model):
     """
     Describes Telegram Passport data shared with the bot by the user.
     """
@@ -1656,7 +1660,7 @@ class PassportData(BaseModel):
     credentials: Optional["EncryptedCredentials"] = Field(default=None)
 
 
-class PassportFile(BaseModel):
+class PassportFile(Model):
     """
     This object represents a file uploaded to Telegram Passport. Currently all Telegram
     Passport files are in JPEG format when decrypted and don't exceed 10MB.
@@ -1668,7 +1672,7 @@ class PassportFile(BaseModel):
     file_date: Optional[int] = Field(default=None)
 
 
-class EncryptedPassportElement(BaseModel):
+class EncryptedPassportElement(Model):
     """
     Describes documents or other Telegram Passport elements shared with the bot by the
     user.
@@ -1702,7 +1706,7 @@ class EncryptedPassportElement(BaseModel):
     hash: Optional[str] = Field(default=None)
 
 
-class EncryptedCredentials(BaseModel):
+class EncryptedCredentials(Model):
     """
     Describes data required for decrypting and authenticating EncryptedPassportElement.
     See the Telegram Passport Documentation for a complete description of the data
@@ -1714,7 +1718,7 @@ class EncryptedCredentials(BaseModel):
     secret: Optional[str] = Field(default=None)
 
 
-class PassportElementErrorDataField(BaseModel):
+class PassportElementErrorDataField(Model):
     """
     Represents an issue in one of the data fields that was provided by the user. The
     error is considered resolved when the field's value changes.
@@ -1736,7 +1740,7 @@ class PassportElementErrorDataField(BaseModel):
     message: Optional[str] = Field(default=None)
 
 
-class PassportElementErrorFrontSide(BaseModel):
+class PassportElementErrorFrontSide(Model):
     """
     Represents an issue with the front side of a document. The error is considered
     resolved when the file with the front side of the document changes.
@@ -1750,7 +1754,7 @@ class PassportElementErrorFrontSide(BaseModel):
     message: Optional[str] = Field(default=None)
 
 
-class PassportElementErrorReverseSide(BaseModel):
+class PassportElementErrorReverseSide(Model):
     """
     Represents an issue with the reverse side of a document. The error is considered
     resolved when the file with reverse side of the document changes.
@@ -1762,7 +1766,7 @@ class PassportElementErrorReverseSide(BaseModel):
     message: Optional[str] = Field(default=None)
 
 
-class PassportElementErrorSelfie(BaseModel):
+class PassportElementErrorSelfie(Model):
     """
     Represents an issue with the selfie with a document. The error is considered
     resolved when the file with the selfie changes.
@@ -1776,7 +1780,7 @@ class PassportElementErrorSelfie(BaseModel):
     message: Optional[str] = Field(default=None)
 
 
-class PassportElementErrorFile(BaseModel):
+class PassportElementErrorFile(Model):
     """
     Represents an issue with a document scan. The error is considered resolved when the
     file with the document scan changes.
@@ -1796,7 +1800,7 @@ class PassportElementErrorFile(BaseModel):
     message: Optional[str] = Field(default=None)
 
 
-class PassportElementErrorFiles(BaseModel):
+class PassportElementErrorFiles(Model):
     """
     Represents an issue with a list of scans. The error is considered resolved when the
     list of files containing the scans changes.
@@ -1816,7 +1820,7 @@ class PassportElementErrorFiles(BaseModel):
     message: Optional[str] = Field(default=None)
 
 
-class PassportElementErrorTranslationFile(BaseModel):
+class PassportElementErrorTranslationFile(Model):
     """
     Represents an issue with one of the files that constitute the translation of a
     document. The error is considered resolved when the file changes.
@@ -1840,7 +1844,7 @@ class PassportElementErrorTranslationFile(BaseModel):
     message: Optional[str] = Field(default=None)
 
 
-class PassportElementErrorTranslationFiles(BaseModel):
+class PassportElementErrorTranslationFiles(Model):
     """
     Represents an issue with the translated version of a document. The error is
     considered resolved when a file with the document translation change.
@@ -1864,7 +1868,7 @@ class PassportElementErrorTranslationFiles(BaseModel):
     message: Optional[str] = Field(default=None)
 
 
-class PassportElementErrorUnspecified(BaseModel):
+class PassportElementErrorUnspecified(Model):
     """
     Represents an issue in an unspecified place. The error is considered resolved when
     new data is added.
@@ -1876,7 +1880,7 @@ class PassportElementErrorUnspecified(BaseModel):
     message: Optional[str] = Field(default=None)
 
 
-class Game(BaseModel):
+class Game(Model):
     """
     This object represents a game. Use BotFather to create and edit games, their short
     names will act as unique identifiers.
@@ -1890,7 +1894,7 @@ class Game(BaseModel):
     animation: Optional["Animation"] = Field(default=None)
 
 
-class CallbackGame(BaseModel):
+class CallbackGame(Model):
     """
     A placeholder, currently holds no information. Use BotFather to set up your game.
     """
@@ -1898,7 +1902,7 @@ class CallbackGame(BaseModel):
     pass
 
 
-class GameHighScore(BaseModel):
+class GameHighScore(Model):
     """
     This object represents one row of the high scores table for a game.
     """
@@ -1908,7 +1912,7 @@ class GameHighScore(BaseModel):
     score: Optional[int] = Field(default=None)
 
 
-ChatMember = Annotated[
+ChatMember = discriminated_union(
     Union[
         ChatMemberOwner,
         ChatMemberAdministrator,
@@ -1917,11 +1921,11 @@ ChatMember = Annotated[
         ChatMemberLeft,
         ChatMemberBanned,
     ],
-    Field(discriminator="status"),
-]
+    "status",
+)
 
 
-BotCommandScope = Annotated[
+BotCommandScope = discriminated_union(
     Union[
         BotCommandScopeDefault,
         BotCommandScopeAllPrivateChats,
@@ -1931,21 +1935,21 @@ BotCommandScope = Annotated[
         BotCommandScopeChatAdministrators,
         BotCommandScopeChatMember,
     ],
-    Field(discriminator="type"),
-]
+    "type",
+)
 
 
-MenuButton = Annotated[
+MenuButton = discriminated_union(
     Union[
         MenuButtonCommands,
         MenuButtonWebApp,
         MenuButtonDefault,
     ],
-    Field(discriminator="type"),
-]
+    "type",
+)
 
 
-InputMedia = Annotated[
+InputMedia = discriminated_union(
     Union[
         InputMediaAnimation,
         InputMediaDocument,
@@ -1953,11 +1957,11 @@ InputMedia = Annotated[
         InputMediaPhoto,
         InputMediaVideo,
     ],
-    Field(discriminator="type"),
-]
+    "type",
+)
 
 
-InlineQueryResult = Annotated[
+InlineQueryResult = discriminated_union(
     Union[
         InlineQueryResultCachedAudio,
         InlineQueryResultCachedDocument,
@@ -1980,11 +1984,11 @@ InlineQueryResult = Annotated[
         InlineQueryResultVideo,
         InlineQueryResultVoice,
     ],
-    Field(discriminator="type"),
-]
+    "type",
+)
 
 
-InputMessageContent = Annotated[
+InputMessageContent = discriminated_union(
     Union[
         InputTextMessageContent,
         InputLocationMessageContent,
@@ -1992,11 +1996,11 @@ InputMessageContent = Annotated[
         InputContactMessageContent,
         InputInvoiceMessageContent,
     ],
-    Field(discriminator=None),
-]
+    None,
+)
 
 
-PassportElementError = Annotated[
+PassportElementError = discriminated_union(
     Union[
         PassportElementErrorDataField,
         PassportElementErrorFrontSide,
@@ -2008,13 +2012,14 @@ PassportElementError = Annotated[
         PassportElementErrorTranslationFiles,
         PassportElementErrorUnspecified,
     ],
-    Field(discriminator="source"),
-]
+    "source",
+)
 
 
 for v in locals().copy().values():
     if inspect.isclass(v) and issubclass(v, BaseModel):
-        v.update_forward_refs()
+        rebuild_model(v)
+        dispatch_fields(v)
 
 __all__ = (
     "Update",
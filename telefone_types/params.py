@@ -0,0 +1,112 @@
+import functools
+import inspect
+import typing
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+from telefone_types._compat import lenient_issubclass
+from telefone_types.encoding import encode_value
+
+Converter = Callable[[Any], Any]
+
+# the results of these types are returned as they are
+PLAIN_TYPES = (bool, int, str, Any)
+
+
+def _has_models(tp: Any) -> bool:
+    if lenient_issubclass(tp, BaseModel):
+        return True
+    return any(_has_models(arg) for arg in typing.get_args(tp))
+
+
+class ParamSpec:
+    """
+    Ordered parameters of an API method, read from its signature once. It builds the
+    request payload from the arguments of a call: None values are skipped and models
+    are converted to dicts, the extra keyword arguments are sent too.
+    """
+
+    def __init__(self, func: Callable) -> None:
+        self.func = func
+        parameters = [
+            p
+            for p in inspect.signature(func).parameters.values()
+            if p.kind is p.POSITIONAL_OR_KEYWORD and p.name != "self"
+        ]
+        self.names: Tuple[str, ...] = tuple(p.name for p in parameters)
+        self.defaults: Tuple[Any, ...] = tuple(
+            None if p.default is p.empty else p.default for p in parameters
+        )
+        self._converters: Optional[Tuple[Optional[Converter], ...]] = None
+        self._return_type: Any = None
+
+    def _prepare(self) -> Tuple[Optional[Converter], ...]:
+        # annotations are resolved on first use as they may refer to later names
+        hints = typing.get_type_hints(self.func, include_extras=True)
+        self._converters = tuple(
+            encode_value if _has_models(hints.get(name)) else None
+            for name in self.names
+        )
+        tp = hints.get("return")
+        self._return_type = None if tp in PLAIN_TYPES else tp
+        return self._converters
+
+    @property
+    def return_type(self) -> Any:
+        """
+        The type the result is parsed into, None if it is returned as is.
+        """
+        if self._converters is None:
+            self._prepare()
+        return self._return_type
+
+    def build(self, args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        converters = self._converters or self._prepare()
+        if len(args) > len(self.names):
+            raise TypeError(
+                f"{self.func.__name__}() takes {len(self.names)} positional "
+                f"arguments but {len(args)} were given"
+            )
+        payload = {}
+        for i, name in enumerate(self.names):
+            if i < len(args):
+                value = args[i]
+                if name in kwargs:
+                    raise TypeError(
+                        f"{self.func.__name__}() got multiple values for argument "
+                        f"{name!r}"
+                    )
+            else:
+                value = kwargs.pop(name, self.defaults[i])
+            if value is not None:
+                convert = converters[i]
+                payload[name] = value if convert is None else convert(value)
+        for name, value in kwargs.items():
+            payload[name] = encode_value(value)
+        return payload
+
+
+def api_method(method: str) -> Callable[[Callable], Callable]:
+    """
+    Makes the decorated function send the Bot API method with the payload built
+    from its arguments and parse the result into its return type. The body of the
+    function is not used.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        spec = ParamSpec(func)
+
+        @functools.wraps(func)
+        async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            return await self._call_method(
+                method, spec.build(args, kwargs), spec.return_type
+            )
+
+        wrapper.spec = spec
+        return wrapper
+
+    return decorator
+
+
+__all__ = ("ParamSpec", "api_method")
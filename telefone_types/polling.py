@@ -0,0 +1,83 @@
+import asyncio
+import contextlib
+from collections import deque
+from typing import Any, Deque, List, Optional
+
+from telefone_types.methods import APIMethods
+from telefone_types.objects import Update
+
+
+class UpdateSource:
+    """
+    Async iterator of the updates received by long polling. The offset is moved past
+    the received updates by itself, and the next getUpdates request is sent as soon
+    as a batch arrives, so it waits for the new updates while the batch is handled.
+
+    The request with the new offset confirms the batch to the API, so the updates
+    being handled when the process stops are not received again.
+    """
+
+    def __init__(
+        self,
+        methods: APIMethods,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        timeout: Optional[int] = 30,
+        allowed_updates: Optional[List[str]] = None,
+        **kwargs: Any
+    ) -> None:
+        self.methods = methods
+        self.offset = offset
+        # read for every request, so they can be changed while polling
+        self.limit = limit
+        self.timeout = timeout
+        self.allowed_updates = allowed_updates
+        self.kwargs = kwargs
+        self._buffer: Deque[Update] = deque()
+        self._pending: Optional["asyncio.Task[List[Update]]"] = None
+
+    def _request(self) -> "asyncio.Task[List[Update]]":
+        return asyncio.ensure_future(
+            self.methods.get_updates(
+                self.offset,
+                self.limit,
+                self.timeout,
+                self.allowed_updates,
+                **self.kwargs,
+            )
+        )
+
+    async def fetch(self) -> List[Update]:
+        """
+        Returns the next batch of updates, the request for the batch after it is
+        already sent when this returns.
+        """
+        pending, self._pending = self._pending or self._request(), None
+        updates = await pending
+        if updates:
+            self.offset = updates[-1].update_id + 1
+        self._pending = self._request()
+        return updates
+
+    def __aiter__(self) -> "UpdateSource":
+        return self
+
+    async def __anext__(self) -> Update:
+        while not self._buffer:
+            self._buffer.extend(await self.fetch())
+        return self._buffer.popleft()
+
+    async def close(self) -> None:
+        """
+        Cancels the request in flight, the updates left in the buffer are dropped.
+        """
+        pending, self._pending = self._pending, None
+        self._buffer.clear()
+        if pending is not None:
+            pending.cancel()
+            # the result or the error of the request is not needed anymore
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await pending
+
+
+__all__ = ("UpdateSource",)
@@ -0,0 +1,164 @@
+import asyncio
+import heapq
+import itertools
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# the methods sending messages to chats, which count towards the flood limits
+SENDING_METHODS = frozenset(
+    (
+        "copyMessage",
+        "forwardMessage",
+        "sendAnimation",
+        "sendAudio",
+        "sendContact",
+        "sendDice",
+        "sendDocument",
+        "sendGame",
+        "sendInvoice",
+        "sendLocation",
+        "sendMediaGroup",
+        "sendMessage",
+        "sendPhoto",
+        "sendPoll",
+        "sendSticker",
+        "sendVenue",
+        "sendVideo",
+        "sendVideoNote",
+        "sendVoice",
+    )
+)
+
+# rate in messages per second and burst size
+Limit = Tuple[float, int]
+
+
+class TokenBucket:
+    """
+    Bucket of `capacity` tokens refilled at `rate` tokens per second. It is kept as
+    the time when the bucket would be full again, so it is updated in constant time
+    and a token can be taken in advance.
+    """
+
+    __slots__ = ("interval", "tolerance", "full_at")
+
+    def __init__(self, rate: float, capacity: int = 1) -> None:
+        self.interval = 1 / rate
+        self.tolerance = self.interval * (capacity - 1)
+        self.full_at = 0.0
+
+    def available_at(self, now: float) -> float:
+        """
+        Returns the earliest time a token can be taken at.
+        """
+        return max(now, self.full_at - self.tolerance)
+
+    def reserve(self, now: float) -> float:
+        """
+        Takes a token, returns the time it is available at.
+        """
+        at = self.available_at(now)
+        self.full_at = max(self.full_at, at) + self.interval
+        return at
+
+
+def chat_type(chat_id: Union[int, str]) -> str:
+    """
+    Returns "private" for the ids of users and "group" for groups and channels.
+    """
+    if isinstance(chat_id, int) and chat_id > 0:
+        return "private"
+    return "group"
+
+
+class RateLimiter:
+    """
+    Paces the sending methods by the limits of the Bot API: about 30 messages per
+    second in total, one per second to a private chat and 20 per minute to a group.
+    The calls get the time slots of a chat in the order they come, the waiting ones
+    are kept in a heap by their time and woken by one timer.
+    """
+
+    def __init__(
+        self,
+        global_limit: Optional[Limit] = (30.0, 30),
+        chat_limits: Optional[Dict[str, Limit]] = None,
+        max_chats: int = 10000,
+    ) -> None:
+        self.global_bucket = (
+            None if global_limit is None else TokenBucket(*global_limit)
+        )
+        self.chat_limits = (
+            {"private": (1.0, 1), "group": (20 / 60, 1)}
+            if chat_limits is None
+            else chat_limits
+        )
+        self.max_chats = max_chats
+        self.chats: Dict[Union[int, str], TokenBucket] = {}
+        self._waiters: List[Tuple[float, int, "asyncio.Future[None]"]] = []
+        self._counter = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_at = 0.0
+
+    def _chat_bucket(
+        self, chat_id: Union[int, str], now: float
+    ) -> Optional[TokenBucket]:
+        bucket = self.chats.get(chat_id)
+        if bucket is None:
+            limit = self.chat_limits.get(chat_type(chat_id))
+            if limit is None:
+                return None
+            if len(self.chats) >= self.max_chats:
+                # the buckets which are full again are the same as new ones
+                self.chats = {k: b for k, b in self.chats.items() if b.full_at > now}
+            bucket = self.chats[chat_id] = TokenBucket(*limit)
+        return bucket
+
+    async def acquire(self, chat_id: Optional[Union[int, str]] = None) -> None:
+        """
+        Waits until the message to the chat can be sent.
+        """
+        loop = asyncio.get_running_loop()
+        if chat_id is not None:
+            bucket = self._chat_bucket(chat_id, loop.time())
+            if bucket is not None:
+                await self._wait(loop, bucket.reserve(loop.time()))
+        # the global slots are taken in the order of time, once the chat is ready
+        if self.global_bucket is not None:
+            await self._wait(loop, self.global_bucket.reserve(loop.time()))
+
+    async def _wait(self, loop: asyncio.AbstractEventLoop, at: float) -> None:
+        if at <= loop.time():
+            return
+        waiter = loop.create_future()
+        heapq.heappush(self._waiters, (at, next(self._counter), waiter))
+        self._schedule(loop)
+        await waiter
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop) -> None:
+        at = self._waiters[0][0]
+        if self._timer is not None:
+            if self._timer_at <= at:
+                return
+            self._timer.cancel()
+        self._timer = loop.call_at(at, self._wake, loop)
+        self._timer_at = at
+
+    def _wake(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._timer = None
+        now = loop.time()
+        while self._waiters and self._waiters[0][0] <= now:
+            waiter = heapq.heappop(self._waiters)[2]
+            if not waiter.done():
+                waiter.set_result(None)
+        if self._waiters:
+            self._schedule(loop)
+
+    async def limit(self, method: str, params: Dict[str, Any]) -> None:
+        """
+        Waits for the slot of the call if the method sends a message.
+        """
+        if method in SENDING_METHODS:
+            await self.acquire(params.get("chat_id"))
+
+
+__all__ = ("RateLimiter", "SENDING_METHODS", "TokenBucket", "chat_type")
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Tuple, Union
+
+from telefone_types import jsonlib
+from telefone_types._compat import fields_set
+from telefone_types.dispatch import chat_key
+from telefone_types.encoding import encode_value
+from telefone_types.methods import APIMethods
+from telefone_types.objects import Update
+
+logger = logging.getLogger("telefone_types")
+
+Reply = Tuple[str, dict]
+# runs in the worker process, returns the method calls to send
+ShardHandler = Callable[[Update], Optional[Iterable[Reply]]]
+
+
+def shard_key(update: Update) -> Hashable:
+    """
+    Returns the id of the sender of the update, the id of its chat if there is no
+    sender, or the update id.
+    """
+    for name in fields_set(update):
+        payload = getattr(update, name)
+        if name == "update_id" or payload is None:
+            continue
+        user = getattr(payload, "from_", None) or getattr(payload, "user", None)
+        if user is not None:
+            return user.id
+        chat_id = chat_key(payload)
+        if chat_id is not None:
+            return chat_id
+    return update.update_id
+
+
+def _work(handler: ShardHandler, inbox: Any, outbox: Any) -> None:
+    while True:
+        body = inbox.get()
+        if body is None:
+            break
+        try:
+            replies = handler(jsonlib.parse_update_bytes(body))
+        except Exception:
+            logger.exception("Error while handling the update in %d", os.getpid())
+            continue
+        if replies:
+            outbox.put(
+                jsonlib.dumps([[method, encode_value(p)] for method, p in replies])
+            )
+
+
+class ShardedRunner:
+    """
+    Handles the updates in a pool of processes. The updates with the same key (the
+    sender by default) always go to the same process, so the state kept by the
+    handler for a user is local to one process. The updates are sent to the
+    processes as JSON, the handler returns the method calls, which are sent to the
+    API by this process in the order they come.
+    """
+
+    def __init__(
+        self,
+        handler: ShardHandler,
+        methods: APIMethods,
+        processes: Optional[int] = None,
+        key: Callable[[Update], Hashable] = shard_key,
+        mp_context: Optional[Any] = None,
+    ) -> None:
+        self.handler = handler
+        self.methods = methods
+        self.processes = processes or os.cpu_count() or 1
+        self.key = key
+        self._context = mp_context or multiprocessing.get_context()
+        self._inboxes: List[Any] = []
+        self._workers: List[Any] = []
+        self._outbox: Any = None
+        self._sender: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._outbox = self._context.Queue()
+        for _ in range(self.processes):
+            inbox = self._context.Queue()
+            worker = self._context.Process(
+                target=_work, args=(self.handler, inbox, self._outbox), daemon=True
+            )
+            worker.start()
+            self._inboxes.append(inbox)
+            self._workers.append(worker)
+        self._sender = asyncio.ensure_future(self._send())
+
+    def submit(self, update: Update, body: Optional[Union[bytes, str]] = None) -> None:
+        """
+        Routes the update to its process, the raw JSON of the update is sent as is if
+        given.
+        """
+        if body is None:
+            body = jsonlib.dumps(encode_value(update))
+        self._inboxes[hash(self.key(update)) % len(self._inboxes)].put(body)
+
+    async def _send(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            body = await loop.run_in_executor(None, self._outbox.get)
+            if body is None:
+                break
+            for method, params in jsonlib.loads(body):
+                try:
+                    await self.methods.call_method(method, params)
+                except Exception:
+                    logger.exception("Error while sending %s", method)
+
+    async def close(self) -> None:
+        """
+        Waits until the processes handle the submitted updates and their replies are
+        sent, then stops the processes.
+        """
+        loop = asyncio.get_running_loop()
+        for inbox in self._inboxes:
+            inbox.put(None)
+        for worker in self._workers:
+            await loop.run_in_executor(None, worker.join)
+        self._outbox.put(None)
+        if self._sender is not None:
+            await self._sender
+        self._inboxes.clear()
+        self._workers.clear()
+
+
+__all__ = ("ShardedRunner", "shard_key")
@@ -1,7 +1,9 @@
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, validator
+from pydantic import BaseModel
+
+from telefone_types._compat import before_validator
 
 
 class BaseStateGroup(str, Enum):
@@ -17,7 +19,7 @@ class StatePeer(BaseModel):
     state: str
     payload: dict = {}
 
-    @validator("state", pre=True)
+    @before_validator("state")
     def validate_state(cls, v: Any) -> str:
         if isinstance(v, BaseStateGroup):
             return get_state_repr(v)
@@ -0,0 +1,136 @@
+import typing
+from typing import Any, Callable, Dict, Optional, Type
+
+from pydantic import BaseModel
+
+from telefone_types._compat import PYDANTIC_V2, construct, lenient_issubclass
+from telefone_types.identity import deduplicated
+from telefone_types.interning import str_interner
+from telefone_types.unions import get_dispatcher
+
+if not PYDANTIC_V2:
+    from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+
+Builder = Callable[[Any], Any]
+
+_model_builders: Dict[Type[BaseModel], Builder] = {}
+_type_builders: Dict[Any, Optional[Builder]] = {}
+
+
+def _union_builder(tp: Any) -> Optional[Builder]:
+    dispatcher = get_dispatcher(tp)
+    if dispatcher is None:
+        return None
+    builders = {model: model_builder(model) for model in dispatcher.variants}
+    default = builders[dispatcher.variants[0]]
+
+    def build(value: Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+        variant = dispatcher.resolve(value)
+        return default(value) if variant is None else builders[variant](value)
+
+    return build
+
+
+def _list_builder(item: Optional[Builder]) -> Optional[Builder]:
+    if item is None:
+        return None
+
+    def build(value: Any) -> Any:
+        if not isinstance(value, list):
+            return value
+        return [v if v is None else item(v) for v in value]
+
+    return build
+
+
+def _field_builder(field: "ModelField") -> Optional[Builder]:
+    if field.shape == SHAPE_LIST and field.sub_fields:
+        return _list_builder(_field_builder(field.sub_fields[0]))
+    if field.shape != SHAPE_SINGLETON:
+        return None
+    if field.sub_fields:
+        return _union_builder(field.outer_type_)
+    if lenient_issubclass(field.type_, BaseModel):
+        return model_builder(field.type_)
+    return None
+
+
+def model_builder(model: Type[BaseModel]) -> Builder:
+    """
+    Returns a function that creates the model from a trusted payload without
+    validation, nested models are created the same way.
+    """
+    builder = _model_builders.get(model)
+    if builder is not None:
+        return builder
+
+    plan = []
+    defaults = {}
+
+    def build(data: Any) -> Any:
+        if not isinstance(data, dict):
+            return data
+        values = dict(defaults)
+        fields_set = set()
+        for name, alias, field_builder in plan:
+            if alias in data:
+                value = data[alias]
+                if value is not None and field_builder is not None:
+                    value = field_builder(value)
+                values[name] = value
+                fields_set.add(name)
+        return construct(model, values, fields_set)
+
+    # registered before the plan is filled to let recursive models reference it
+    _model_builders[model] = deduplicated(model, build)
+    if PYDANTIC_V2:
+        for name, field in model.model_fields.items():
+            builder = type_builder(field.annotation) or str_interner(
+                name, field.annotation
+            )
+            plan.append((name, field.alias or name, builder))
+            defaults[name] = field.get_default(call_default_factory=True)
+    else:
+        for name, field in model.__fields__.items():
+            builder = _field_builder(field) or str_interner(name, field.outer_type_)
+            plan.append((name, field.alias, builder))
+            defaults[name] = field.get_default()
+    return _model_builders[model]
+
+
+def type_builder(tp: Any) -> Optional[Builder]:
+    if tp in _type_builders:
+        return _type_builders[tp]
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if lenient_issubclass(tp, BaseModel):
+        builder = model_builder(tp)
+    elif origin is list:
+        builder = _list_builder(type_builder(args[0]))
+    elif origin is typing.Annotated:
+        builder = _union_builder(tp) or type_builder(args[0])
+    elif origin is typing.Union and args[-1] is type(None) and len(args) == 2:
+        builder = type_builder(args[0])
+    elif origin is typing.Union:
+        builder = _union_builder(tp)
+    else:
+        builder = None
+    _type_builders[tp] = builder
+    return builder
+
+
+def construct_trusted(tp: Any, data: Any) -> Any:
+    """
+    Builds an object of the given type from the data received from the Bot API
+    server, skipping validation. Nested models, lists and unions are constructed
+    recursively.
+    """
+    builder = type_builder(tp)
+    if builder is None or data is None:
+        return data
+    return builder(data)
+
+
+__all__ = ("construct_trusted", "model_builder")
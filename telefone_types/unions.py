@@ -0,0 +1,220 @@
+import typing
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, Field
+from pydantic.fields import FieldInfo
+
+from telefone_types._compat import (
+    PYDANTIC_V2,
+    field_aliases,
+    field_annotation,
+    lenient_issubclass,
+    literal_values,
+)
+
+if PYDANTIC_V2:
+    from pydantic import Discriminator, Tag
+
+
+class UnionDispatcher:
+    """
+    Picks the variant of a union of models for a raw object in O(1): by the value of
+    the discriminator field, or, for unions without one, by the keys which are
+    specific to a single variant. Variants sharing a discriminator value (e.g. the
+    cached and the regular audio results) are told apart the same way.
+    """
+
+    def __init__(
+        self, variants: Tuple[Type[BaseModel], ...], discriminator: Optional[str]
+    ) -> None:
+        self.variants = variants
+        self.discriminator = discriminator
+        self.alias: Optional[str] = None
+        self.table: Optional[Dict[Any, Tuple[Type[BaseModel], ...]]] = None
+        self.markers: Dict[Tuple[Type[BaseModel], ...], List[tuple]] = {}
+        # pydantic v2 expects the callable discriminator to have a name
+        self.__name__ = f"{type(self).__name__}.__call__"
+
+    def _prepare(self) -> Dict[Any, Tuple[Type[BaseModel], ...]]:
+        table: Dict[Any, Tuple[Type[BaseModel], ...]] = {}
+        if self.discriminator is not None:
+            for variant in self.variants:
+                self.alias = field_aliases(variant)[self.discriminator]
+                annotation = field_annotation(variant, self.discriminator)
+                for value in literal_values(annotation):
+                    table[value] = table.get(value, ()) + (variant,)
+        for group in {*table.values(), self.variants}:
+            if len(group) > 1:
+                self.markers[group] = self._markers(group)
+        self.table = table
+        return table
+
+    @staticmethod
+    def _markers(group: Tuple[Type[BaseModel], ...]) -> List[tuple]:
+        keys = {
+            variant: frozenset(field_aliases(variant).values()) for variant in group
+        }
+        markers = []
+        for variant, own in keys.items():
+            others = frozenset().union(
+                *(k for v, k in keys.items() if v is not variant)
+            )
+            markers.append((own - others, own, variant))
+        return markers
+
+    def _by_keys(
+        self, group: Tuple[Type[BaseModel], ...], data: dict
+    ) -> Type[BaseModel]:
+        fallback: Optional[Tuple[int, Type[BaseModel]]] = None
+        for unique, own, variant in self.markers[group]:
+            if not unique.isdisjoint(data):
+                return variant
+            if own.issuperset(data) and (fallback is None or len(own) < fallback[0]):
+                fallback = (len(own), variant)
+        return fallback[1] if fallback is not None else group[-1]
+
+    def resolve(self, data: dict) -> Optional[Type[BaseModel]]:
+        """
+        Returns the variant for the object or None if its discriminator is missing or
+        unknown.
+        """
+        table = self.table if self.table is not None else self._prepare()
+        if self.alias is None:
+            group = self.variants
+        else:
+            try:
+                group = table.get(data[self.alias])
+            except (KeyError, TypeError):
+                return None
+            if group is None:
+                return None
+        if len(group) == 1:
+            return group[0]
+        return self._by_keys(group, data)
+
+    def __call__(self, value: Any) -> Optional[str]:
+        """
+        Returns the tag of the variant, used as the discriminator on pydantic v2.
+        """
+        if isinstance(value, dict):
+            variant = self.resolve(value)
+            return None if variant is None else variant.__name__
+        for variant in self.variants:
+            if isinstance(value, variant):
+                return variant.__name__
+        return None
+
+
+_dispatchers: Dict[Any, Optional[UnionDispatcher]] = {}
+
+
+def _split_annotated(tp: Any) -> Tuple[Any, Any]:
+    discriminator = None
+    if typing.get_origin(tp) is typing.Annotated:
+        tp, *metadata = typing.get_args(tp)
+        for meta in metadata:
+            if isinstance(meta, FieldInfo) and meta.discriminator is not None:
+                discriminator = meta.discriminator
+            elif isinstance(getattr(meta, "discriminator", None), UnionDispatcher):
+                discriminator = meta.discriminator
+    return tp, discriminator
+
+
+def discriminated_union(union: Any, discriminator: Optional[str]) -> Any:
+    """
+    Annotates the union of models to be parsed by the discriminator field or, if it
+    is None, by the keys of the object. On pydantic v2 the variant is picked by the
+    dispatcher of this module, as the discriminator fields are `Optional`.
+    """
+    if not PYDANTIC_V2:
+        return typing.Annotated[union, Field(discriminator=discriminator)]
+    variants = typing.get_args(union)
+    dispatcher = UnionDispatcher(variants, discriminator)
+    tagged = tuple(typing.Annotated[v, Tag(v.__name__)] for v in variants)
+    annotated = typing.Annotated[Union[tagged], Discriminator(dispatcher)]
+    _dispatchers[annotated] = dispatcher
+    return annotated
+
+
+def get_dispatcher(tp: Any) -> Optional[UnionDispatcher]:
+    """
+    Returns the dispatcher of a union of models, e.g. `ChatMember` or
+    `InputMessageContent`. Variants which are not models are left out, None is
+    returned if there are no models in the type.
+    """
+    try:
+        return _dispatchers[tp]
+    except KeyError:
+        pass
+    except TypeError:
+        return None
+    union, discriminator = _split_annotated(tp)
+    dispatcher = None
+    args = [a for a in typing.get_args(union) if a is not type(None)]
+    if isinstance(discriminator, UnionDispatcher):
+        dispatcher = discriminator
+    elif typing.get_origin(union) is Union and len(args) == 1:
+        dispatcher = get_dispatcher(args[0])
+    elif typing.get_origin(union) is Union:
+        variants = tuple(
+            variant
+            for variant in map(lambda a: _split_annotated(a)[0], args)
+            if lenient_issubclass(variant, BaseModel)
+        )
+        if variants:
+            dispatcher = UnionDispatcher(variants, discriminator)
+    _dispatchers[tp] = dispatcher
+    return dispatcher
+
+
+def _dispatch_validator(dispatcher: UnionDispatcher) -> Any:
+    def validate(cls: Any, value: Any, values: Any, field: Any, config: Any) -> Any:
+        if isinstance(value, dict):
+            variant = dispatcher.resolve(value)
+            if variant is not None:
+                return variant.validate(value)
+        return value
+
+    return validate
+
+
+def _dispatch_field(field: Any) -> None:
+    for sub_field in field.sub_fields or ():
+        _dispatch_field(sub_field)
+    if field.sub_fields and all(
+        lenient_issubclass(f.type_, BaseModel) for f in field.sub_fields
+    ):
+        dispatcher = get_dispatcher(field.outer_type_)
+        if dispatcher is not None:
+            field.pre_validators = [
+                _dispatch_validator(dispatcher),
+                *(field.pre_validators or ()),
+            ]
+
+
+def dispatch_fields(model: Type[BaseModel]) -> None:
+    """
+    Makes the union fields of the model pick the variant by the dispatcher on
+    pydantic v1, as the generated decoders do, instead of taking the first variant
+    which validates. Pydantic v2 uses the dispatcher as the discriminator already.
+    """
+    if PYDANTIC_V2:
+        return
+    for field in model.__fields__.values():
+        _dispatch_field(field)
+
+
+def resolve_variant(tp: Any, data: Any) -> Optional[Type[BaseModel]]:
+    dispatcher = get_dispatcher(tp)
+    if dispatcher is None or not isinstance(data, dict):
+        return None
+    return dispatcher.resolve(data)
+
+
+__all__ = (
+    "UnionDispatcher",
+    "discriminated_union",
+    "dispatch_fields",
+    "get_dispatcher",
+    "resolve_variant",
+)
@@ -3,15 +3,89 @@ from abc import abstractmethod
 
 from pydantic import BaseModel
 
+from telefone_types._compat import PYDANTIC_V2
+from telefone_types.adapters import get_adapter
 from telefone_types.states import StatePeer
 
 if typing.TYPE_CHECKING:
     from telefone.api import ABCAPI, API
 
+# the context is kept out of the fields, these names are still accepted by the
+# constructor and assignment
+CONTEXT_NAMES = {"unprepared_ctx_api": "_ctx_api", "state_peer": "_state_peer"}
+
+
+def _state_peer(value: typing.Any) -> typing.Optional[StatePeer]:
+    if value is None or isinstance(value, StatePeer):
+        return value
+    return get_adapter(StatePeer).validate(value)
+
 
 class BaseBotUpdate(BaseModel):
-    state_peer: typing.Optional[StatePeer] = None
-    unprepared_ctx_api: typing.Optional[typing.Any] = None
+    """
+    Base of the typed updates. The API client, the state peer and the scratch data of
+    the request are bound to the update as plain attributes, they are not validated,
+    dumped or compared and the copies of the update share them.
+    """
+
+    __slots__ = ("_ctx_api", "_state_peer", "_context")
+
+    def __init__(self, **data: typing.Any) -> None:
+        ctx_api = data.pop("unprepared_ctx_api", None)
+        state_peer = data.pop("state_peer", None)
+        super().__init__(**data)
+        self.bind(ctx_api, state_peer)
+
+    def bind(
+        self,
+        ctx_api: typing.Optional[typing.Any] = None,
+        state_peer: typing.Optional[StatePeer] = None,
+    ) -> "BaseBotUpdate":
+        """
+        Binds the API client and the state peer to the update, returns the update.
+        The state peer may be given as a dict, it is validated then.
+        """
+        object.__setattr__(self, "_ctx_api", ctx_api)
+        object.__setattr__(self, "_state_peer", _state_peer(state_peer))
+        return self
+
+    def _share_context(self, other: "BaseBotUpdate") -> "BaseBotUpdate":
+        for name in BaseBotUpdate.__slots__:
+            value = getattr(self, name, None)
+            if value is not None:
+                object.__setattr__(other, name, value)
+        return other
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        slot = CONTEXT_NAMES.get(name)
+        if slot is not None:
+            if name == "state_peer":
+                value = _state_peer(value)
+            object.__setattr__(self, slot, value)
+        else:
+            super().__setattr__(name, value)
+
+    def copy(self, *args: typing.Any, **kwargs: typing.Any) -> "BaseBotUpdate":
+        return self._share_context(super().copy(*args, **kwargs))
+
+    if PYDANTIC_V2:
+
+        def model_copy(self, *args: typing.Any, **kwargs: typing.Any):
+            return self._share_context(super().model_copy(*args, **kwargs))
+
+        def __copy__(self):
+            return self._share_context(super().__copy__())
+
+        def __deepcopy__(self, memo=None):
+            return self._share_context(super().__deepcopy__(memo))
+
+    else:
+
+        def __copy__(self):
+            return self.copy()
+
+        def __deepcopy__(self, memo=None):
+            return self.copy(deep=True)
 
     @abstractmethod
     def get_state_key(self) -> typing.Optional[int]:
@@ -19,4 +93,23 @@ class BaseBotUpdate(BaseModel):
 
     @property
     def ctx_api(self) -> typing.Optional[typing.Union["ABCAPI", "API"]]:
-        return getattr(self, "unprepared_ctx_api")
+        return getattr(self, "_ctx_api", None)
+
+    @property
+    def unprepared_ctx_api(self) -> typing.Optional[typing.Any]:
+        return getattr(self, "_ctx_api", None)
+
+    @property
+    def state_peer(self) -> typing.Optional[StatePeer]:
+        return getattr(self, "_state_peer", None)
+
+    @property
+    def context(self) -> typing.Dict[str, typing.Any]:
+        """
+        Scratch data of the request the update is handled in, created on first use.
+        """
+        context = getattr(self, "_context", None)
+        if context is None:
+            context = {}
+            object.__setattr__(self, "_context", context)
+        return context
@@ -1,6 +1,7 @@
 from enum import Enum
-from typing import List, Optional, Union
-from telefone_types.methods import APIMethods
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from telefone_types._compat import construct, fields_set
 
 from telefone_types.objects import (
     CallbackQuery,
@@ -19,6 +20,7 @@ from telefone_types.objects import (
     ReplyKeyboardMarkup,
     ReplyKeyboardRemove,
     ShippingQuery,
+    Update,
 )
 from telefone_types.updates.base import BaseBotUpdate
 
@@ -59,10 +61,21 @@ class MessageUpdate(BaseBotUpdate, Message):
                 "ForceReply",
             ]
         ] = None,
-        **kwargs
+        **kwargs,
     ) -> Message:
-        params = APIMethods.get_params(locals())
-        return await self.ctx_api.send_message(chat_id=self.chat.id, **params)
+        return await self.ctx_api.send_message(
+            chat_id=self.chat.id,
+            text=text,
+            parse_mode=parse_mode,
+            entities=entities,
+            disable_web_page_preview=disable_web_page_preview,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            reply_to_message_id=reply_to_message_id,
+            allow_sending_without_reply=allow_sending_without_reply,
+            reply_markup=reply_markup,
+            **kwargs,
+        )
 
     async def reply(
         self,
@@ -81,11 +94,20 @@ class MessageUpdate(BaseBotUpdate, Message):
                 "ForceReply",
             ]
         ] = None,
-        **kwargs
+        **kwargs,
     ) -> Message:
-        params = APIMethods.get_params(locals())
         return await self.ctx_api.send_message(
-            chat_id=self.chat.id, reply_to_message_id=self.message_id, **params
+            chat_id=self.chat.id,
+            reply_to_message_id=self.message_id,
+            text=text,
+            parse_mode=parse_mode,
+            entities=entities,
+            disable_web_page_preview=disable_web_page_preview,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            allow_sending_without_reply=allow_sending_without_reply,
+            reply_markup=reply_markup,
+            **kwargs,
         )
 
     async def forward(
@@ -93,11 +115,15 @@ class MessageUpdate(BaseBotUpdate, Message):
         chat_id: Union[int, str],
         disable_notification: Optional[bool] = None,
         protect_content: Optional[bool] = None,
-        **kwargs
+        **kwargs,
     ) -> Message:
-        params = APIMethods.get_params(locals())
         return await self.ctx_api.forward_message(
-            from_chat_id=self.chat.id, message_id=self.message_id, **params
+            from_chat_id=self.chat.id,
+            message_id=self.message_id,
+            chat_id=chat_id,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            **kwargs,
         )
 
     def get_state_key(self) -> Optional[int]:
@@ -111,10 +137,16 @@ class CallbackQueryUpdate(BaseBotUpdate, CallbackQuery):
         show_alert: Optional[bool] = None,
         url: Optional[str] = None,
         cache_time: Optional[int] = None,
-        **kwargs
+        **kwargs,
     ) -> bool:
-        params = APIMethods.get_params(locals())
-        return await self.ctx_api.answer_callback_query(self.id, **params)
+        return await self.ctx_api.answer_callback_query(
+            self.id,
+            text=text,
+            show_alert=show_alert,
+            url=url,
+            cache_time=cache_time,
+            **kwargs,
+        )
 
     def get_state_key(self) -> Optional[int]:
         return self.from_.id
@@ -129,10 +161,18 @@ class InlineQueryUpdate(BaseBotUpdate, InlineQuery):
         next_offset: Optional[str] = None,
         switch_pm_text: Optional[str] = None,
         switch_pm_parameter: Optional[str] = None,
-        **kwargs
+        **kwargs,
     ) -> bool:
-        params = APIMethods.get_params(locals())
-        return await self.ctx_api.answer_inline_query(self.id, **params)
+        return await self.ctx_api.answer_inline_query(
+            self.id,
+            results=results,
+            cache_time=cache_time,
+            is_personal=is_personal,
+            next_offset=next_offset,
+            switch_pm_text=switch_pm_text,
+            switch_pm_parameter=switch_pm_parameter,
+            **kwargs,
+        )
 
     def get_state_key(self) -> Optional[int]:
         return self.from_.id
@@ -140,15 +180,13 @@ class InlineQueryUpdate(BaseBotUpdate, InlineQuery):
 
 class ChatJoinRequestUpdate(BaseBotUpdate, ChatJoinRequest):
     async def approve(self, **kwargs) -> bool:
-        params = APIMethods.get_params(locals())
         return await self.ctx_api.approve_chat_join_request(
-            chat_id=self.chat.id, user_id=self.from_.id, **params
+            chat_id=self.chat.id, user_id=self.from_.id, **kwargs
         )
 
     async def decline(self, **kwargs) -> bool:
-        params = APIMethods.get_params(locals())
         return await self.ctx_api.decline_chat_join_request(
-            chat_id=self.chat.id, user_id=self.from_.id, **params
+            chat_id=self.chat.id, user_id=self.from_.id, **kwargs
         )
 
     def get_state_key(self) -> Optional[int]:
@@ -190,6 +228,46 @@ class PollUpdate(BaseBotUpdate, Poll):
         return None
 
 
+UPDATE_TYPES: Dict[str, Tuple[BotUpdateType, Type[BaseBotUpdate]]] = {
+    "message": (BotUpdateType.MESSAGE, MessageUpdate),
+    "edited_message": (BotUpdateType.EDITED_MESSAGE, MessageUpdate),
+    "channel_post": (BotUpdateType.CHANNEL_POST, MessageUpdate),
+    "edited_channel_post": (BotUpdateType.EDITED_CHANNEL_POST, MessageUpdate),
+    "inline_query": (BotUpdateType.INLINE_QUERY, InlineQueryUpdate),
+    "chosen_inline_result": (
+        BotUpdateType.CHOSEN_INLINE_RESULT,
+        ChosenInlineResultUpdate,
+    ),
+    "callback_query": (BotUpdateType.CALLBACK_QUERY, CallbackQueryUpdate),
+    "shipping_query": (BotUpdateType.SHIPPING_QUERY, ShippingQueryUpdate),
+    "pre_checkout_query": (BotUpdateType.PRE_CHECKOUT_QUERY, PreCheckoutQueryUpdate),
+    "poll": (BotUpdateType.POLL, PollUpdate),
+    "poll_answer": (BotUpdateType.POLL_ANSWER, PollAnswerUpdate),
+    "my_chat_member": (BotUpdateType.MY_CHAT_MEMBER, MyChatMemberUpdate),
+    "chat_member": (BotUpdateType.CHAT_MEMBER, ChatMemberUpdate),
+    "chat_join_request": (BotUpdateType.CHAT_JOIN_REQUEST, ChatJoinRequestUpdate),
+}
+
+
+def to_bot_update(
+    update: Update, ctx_api: Optional[Any] = None
+) -> Tuple[BotUpdateType, BaseBotUpdate]:
+    """
+    Returns the type of the update and its payload as the typed update, e.g. a
+    `MessageUpdate` for `Update.message`. The typed update shares the values of the
+    payload, which are not validated again.
+    """
+    for name in fields_set(update):
+        entry = UPDATE_TYPES.get(name)
+        payload = None if entry is None else getattr(update, name)
+        if payload is None:
+            continue
+        update_type, update_cls = entry
+        update_obj = construct(update_cls, dict(payload), set(fields_set(payload)))
+        return update_type, update_obj.bind(ctx_api)
+    raise ValueError(f"Update {update.update_id} has no payload of a known type")
+
+
 __all__ = (
     "BaseBotUpdate",
     "BotUpdateType",
@@ -204,4 +282,6 @@ __all__ = (
     "ShippingQueryUpdate",
     "PollAnswerUpdate",
     "PollUpdate",
+    "UPDATE_TYPES",
+    "to_bot_update",
 )
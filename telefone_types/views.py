@@ -0,0 +1,132 @@
+import typing
+from typing import Any, Callable, Dict, Optional, Type, Union
+
+from pydantic import BaseModel
+
+from telefone_types import objects
+from telefone_types._compat import field_aliases, lenient_issubclass
+from telefone_types.unions import get_dispatcher
+
+Wrapper = Callable[[Any], Any]
+
+_views: Dict[Type[BaseModel], Type["View"]] = {}
+
+
+class View:
+    """
+    Read-only view of a raw Bot API object. It holds the decoded dict without
+    copying it and has the attributes of the model, nested objects are wrapped into
+    views when they are accessed. The data is not validated, use `to_model` to get
+    the validated model.
+    """
+
+    __slots__ = ("_data",)
+    __model__: Type[BaseModel]
+
+    def __init__(self, data: dict) -> None:
+        object.__setattr__(self, "_data", data)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    @property
+    def raw(self) -> dict:
+        return self._data
+
+    def to_model(self) -> BaseModel:
+        return self.__model__.fast_parse(self._data)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, View):
+            return NotImplemented
+        return self.__model__ is other.__model__ and self._data == other._data
+
+    __hash__ = None  # type: ignore
+
+    def __reduce__(self):
+        return type(self), (self._data,)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+
+def _wrapper(tp: Any) -> Optional[Wrapper]:
+    """
+    Returns the function wrapping the raw value of the type, None if the value is
+    returned as is.
+    """
+    if lenient_issubclass(tp, BaseModel):
+        return view_type(tp)
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if origin is list:
+        item = _wrapper(args[0])
+        if item is None:
+            return None
+        return lambda value: [v if v is None else item(v) for v in value]
+    if origin is Union and len(args) == 2 and args[-1] is type(None):
+        return _wrapper(args[0])
+    dispatcher = get_dispatcher(tp)
+    if dispatcher is None:
+        return None
+
+    def wrap_union(value: Any) -> Any:
+        variant = dispatcher.resolve(value) if isinstance(value, dict) else None
+        return value if variant is None else view_type(variant)(value)
+
+    return wrap_union
+
+
+def _field(alias: str, wrapper: Optional[Wrapper]) -> property:
+    if wrapper is None:
+        return property(lambda self: self._data.get(alias))
+
+    def get(self: View) -> Any:
+        value = self._data.get(alias)
+        return None if value is None else wrapper(value)
+
+    return property(get)
+
+
+def view_type(model: Type[BaseModel]) -> Type[View]:
+    """
+    Returns the view class of the model, e.g. `MessageView` for `Message`.
+    """
+    view = _views.get(model)
+    if view is not None:
+        return view
+    view = _views[model] = type(
+        f"{model.__name__}View",
+        (View,),
+        {"__slots__": (), "__model__": model, "__module__": __name__},
+    )
+    hints = typing.get_type_hints(model, include_extras=True)
+    # nested views are created after the class is registered to support recursion
+    for name, alias in field_aliases(model).items():
+        setattr(view, name, _field(alias, _wrapper(hints[name])))
+    return view
+
+
+def view(data: dict, model: Type[BaseModel] = objects.Update) -> View:
+    """
+    Wraps the raw object into the view of the model, by default of `Update`.
+    """
+    return view_type(model)(data)
+
+
+for _name in objects.__all__:
+    _model = getattr(objects, _name)
+    if lenient_issubclass(_model, BaseModel):
+        globals()[f"{_name}View"] = view_type(_model)
+del _name, _model
+
+
+__all__ = (
+    "View",
+    "view",
+    "view_type",
+    *(f"{name}View" for name in objects.__all__ if f"{name}View" in globals()),
+)
@@ -0,0 +1,89 @@
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from telefone_types import APIMethods
+from telefone_types._compat import PYDANTIC_V2
+
+CORPUS = json.loads((Path(__file__).parent / "data" / "updates.json").read_text())
+
+
+class FakeAPI:
+    """
+    Transport returning the queued responses one by one and recording the calls.
+    """
+
+    def __init__(self):
+        self.responses = []
+        self.calls = []
+        # when set, the requests wait for it before responding
+        self.gate = None
+
+    def respond(self, *responses):
+        self.responses.extend(responses)
+        return self
+
+    @property
+    def methods(self):
+        return [method for method, _ in self.calls]
+
+    async def request(self, method, params):
+        self.calls.append((method, params))
+        if self.gate is not None:
+            await self.gate.wait()
+        return self.responses.pop(0)
+
+
+class Client(FakeAPI, APIMethods):
+    """
+    API client which mixes the methods in, its request is the raw transport call.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.api = self
+
+
+def pytest_generate_tests(metafunc):
+    if "update_data" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "update_data",
+            [copy.deepcopy(u) for u in CORPUS],
+            ids=[str(u["update_id"]) for u in CORPUS],
+        )
+
+
+@pytest.fixture
+def updates():
+    return copy.deepcopy(CORPUS)
+
+
+@pytest.fixture
+def message(updates):
+    return updates[0]["message"]
+
+
+@pytest.fixture
+def api():
+    return FakeAPI()
+
+
+@pytest.fixture
+def client():
+    return Client()
+
+
+@pytest.fixture
+def parse_obj():
+    """
+    Validates the data as the model on either pydantic version.
+    """
+
+    def parse(model, data):
+        if PYDANTIC_V2:
+            return model.model_validate(data)
+        return model.parse_obj(data)
+
+    return parse
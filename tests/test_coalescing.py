@@ -0,0 +1,78 @@
+import asyncio
+
+from telefone_types import *
+from telefone_types.errors import ChatNotFound
+
+CHAT_NOT_FOUND = {
+    "ok": False,
+    "error_code": 400,
+    "description": "Bad Request: chat not found",
+}
+
+
+async def gathered(api, *calls):
+    """
+    Starts the calls while the transport is held, then lets it respond.
+    """
+    api.gate = asyncio.Event()
+    tasks = [asyncio.ensure_future(call) for call in calls]
+    await asyncio.sleep(0)
+    api.gate.set()
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def test_identical_calls_are_merged(api, message):
+    methods = APIMethods(api.respond(message["chat"]), coalesce=True)
+    chats = asyncio.run(gathered(api, *(methods.get_chat(chat_id=1) for _ in range(5))))
+    assert api.methods == ["getChat"]
+    assert all(chat is chats[0] for chat in chats)
+    assert isinstance(chats[0], Chat)
+    assert not methods._in_flight
+
+
+def test_different_params_are_not_merged(api, message):
+    methods = APIMethods(api.respond(message["chat"], message["chat"]), coalesce=True)
+    asyncio.run(gathered(api, methods.get_chat(chat_id=1), methods.get_chat(chat_id=2)))
+    assert api.calls == [("getChat", {"chat_id": 1}), ("getChat", {"chat_id": 2})]
+
+
+def test_other_methods_are_not_merged(api, message):
+    methods = APIMethods(api.respond(message, message), coalesce=True)
+    calls = [methods.send_message(chat_id=1, text="hi") for _ in range(2)]
+    asyncio.run(gathered(api, *calls))
+    assert api.methods == ["sendMessage", "sendMessage"]
+
+
+def test_errors_reach_every_caller(api):
+    methods = APIMethods(api.respond(CHAT_NOT_FOUND), coalesce=True)
+    errors = asyncio.run(
+        gathered(api, *(methods.get_chat(chat_id=1) for _ in range(3)))
+    )
+    assert api.methods == ["getChat"]
+    assert all(isinstance(e, ChatNotFound) for e in errors)
+    assert not methods._in_flight
+
+
+def test_cancelled_caller(api, message):
+    methods = APIMethods(api.respond(message["chat"]), coalesce=True)
+
+    async def main():
+        api.gate = asyncio.Event()
+        tasks = [asyncio.ensure_future(methods.get_chat(chat_id=1)) for _ in range(3)]
+        await asyncio.sleep(0)
+        tasks[0].cancel()
+        api.gate.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    cancelled, *chats = asyncio.run(main())
+    assert isinstance(cancelled, asyncio.CancelledError)
+    assert all(isinstance(chat, Chat) for chat in chats)
+    assert api.methods == ["getChat"]
+    assert not methods._in_flight
+
+
+def test_calls_after_completion_are_sent_again(api, message):
+    methods = APIMethods(api.respond(message["chat"], message["chat"]), coalesce=True)
+    for _ in range(2):
+        asyncio.run(methods.get_chat(chat_id=1))
+    assert api.methods == ["getChat", "getChat"]
@@ -0,0 +1,98 @@
+import asyncio
+import random
+
+from telefone_types.dispatch import OrderedDispatcher
+
+
+def by_key(update):
+    return update[0]
+
+
+def test_order_within_key():
+    rng = random.Random(20)
+    handled = []
+
+    async def handler(update):
+        await asyncio.sleep(rng.random() / 1000)
+        handled.append(update)
+
+    async def main():
+        dispatcher = OrderedDispatcher(handler, key=by_key, max_concurrency=8)
+        for i in range(30):
+            for key in "abcd":
+                await dispatcher.dispatch((key, i))
+        await dispatcher.join()
+
+    asyncio.run(main())
+    assert len(handled) == 120
+    for key in "abcd":
+        assert [i for k, i in handled if k == key] == list(range(30))
+
+
+def test_max_concurrency():
+    running = peak = 0
+
+    async def handler(update):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+
+    async def main():
+        dispatcher = OrderedDispatcher(handler, key=by_key, max_concurrency=3)
+        for i in range(20):
+            await dispatcher.dispatch((i % 10, i))
+            await dispatcher.dispatch((None, i))
+        await dispatcher.join()
+
+    asyncio.run(main())
+    assert peak == 3
+
+
+def test_max_per_key():
+    async def main():
+        release = asyncio.Event()
+
+        async def handler(update):
+            await release.wait()
+
+        dispatcher = OrderedDispatcher(handler, key=by_key, max_per_key=2)
+        await dispatcher.dispatch(("a", 0))
+        # the first update is taken from the queue by the lane worker
+        await asyncio.sleep(0)
+        await dispatcher.dispatch(("a", 1))
+        await dispatcher.dispatch(("a", 2))
+        blocked = asyncio.ensure_future(dispatcher.dispatch(("a", 3)))
+        other = asyncio.ensure_future(dispatcher.dispatch(("b", 0)))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        assert other.done()
+        release.set()
+        await asyncio.wait_for(blocked, 1)
+        await dispatcher.join()
+
+    asyncio.run(main())
+
+
+def test_lanes_are_removed_after_errors(caplog):
+    handled = []
+
+    async def handler(update):
+        handled.append(update)
+        if update[1] % 2:
+            raise ValueError(update)
+
+    async def main():
+        dispatcher = OrderedDispatcher(handler, key=by_key)
+        for i in range(4):
+            await dispatcher.dispatch(("a", i))
+        await dispatcher.join()
+        assert dispatcher._lanes == {}
+        await dispatcher.dispatch(("a", 4))
+        await dispatcher.join()
+        assert dispatcher._lanes == {}
+
+    asyncio.run(main())
+    assert handled == [("a", i) for i in range(5)]
+    assert len([r for r in caplog.records if r.levelname == "ERROR"]) == 2
@@ -0,0 +1,41 @@
+import json
+from urllib.parse import parse_qs
+
+from telefone_types import *
+from telefone_types.encoding import encode_form, encode_json, encode_value
+from telefone_types.keyboards import freeze
+
+MARKUP = {"inline_keyboard": [[{"text": "Yes", "callback_data": "y"}]]}
+
+
+def test_models():
+    markup = InlineKeyboardMarkup(
+        inline_keyboard=[[InlineKeyboardButton(text="Yes", callback_data="y")]]
+    )
+    assert encode_value(markup) == MARKUP
+
+
+def test_models_in_dicts():
+    button = InlineKeyboardButton(text="Yes", callback_data="y")
+    value = {"inline_keyboard": [[button]]}
+    assert encode_value(value) == MARKUP
+    body = encode_json({"chat_id": 1, "reply_markup": value})
+    assert json.loads(body) == {"chat_id": 1, "reply_markup": MARKUP}
+
+
+def test_pre_serialized():
+    keyboard = freeze(MARKUP)
+    assert encode_value(keyboard) is keyboard
+    body = encode_json({"chat_id": 1, "text": "hi", "reply_markup": keyboard})
+    assert json.loads(body) == {"chat_id": 1, "text": "hi", "reply_markup": MARKUP}
+    assert json.loads(encode_json({"reply_markup": keyboard})) == {
+        "reply_markup": MARKUP
+    }
+
+
+def test_form():
+    body = encode_form({"chat_id": 1, "text": "hi", "reply_markup": freeze(MARKUP)})
+    fields = parse_qs(body.decode())
+    assert fields["chat_id"] == ["1"]
+    assert fields["text"] == ["hi"]
+    assert json.loads(fields["reply_markup"][0]) == MARKUP
@@ -0,0 +1,60 @@
+import asyncio
+import json
+
+import pytest
+
+from telefone_types import *
+from telefone_types.errors import FloodWait, ServerError
+
+FLOOD = {
+    "ok": False,
+    "error_code": 429,
+    "description": "Too Many Requests: retry after 5",
+    "parameters": {"retry_after": 5},
+}
+SERVER_ERROR = {"ok": False, "error_code": 502, "description": "Bad Gateway"}
+RESPONSES = {
+    "envelope": lambda result: {"ok": True, "result": result},
+    "list": lambda result: result,
+    "bytes": lambda result: json.dumps({"ok": True, "result": result}).encode(),
+}
+
+
+async def collect(methods, **params):
+    return [update async for update in methods.iter_updates(**params)]
+
+
+@pytest.mark.parametrize("form", RESPONSES)
+def test_iter_updates(api, updates, form):
+    api.respond(RESPONSES[form](updates[:3]))
+    collected = asyncio.run(collect(APIMethods(api)))
+    assert [u.update_id for u in collected] == [u["update_id"] for u in updates[:3]]
+
+
+@pytest.mark.parametrize("response", [FLOOD, json.dumps(FLOOD).encode()])
+def test_iter_updates_error(api, response):
+    with pytest.raises(FloodWait) as info:
+        asyncio.run(collect(APIMethods(api.respond(response))))
+    assert info.value.retry_after == 5
+    assert info.value.method == "getUpdates"
+
+
+def test_server_errors_of_idempotent_methods_are_retried(api, message):
+    api.respond(SERVER_ERROR, {"ok": True, "result": message["from"]})
+    methods = APIMethods(api, retry=RetryPolicy(backoff=0))
+    assert isinstance(asyncio.run(methods.get_me()), User)
+    assert api.methods == ["getMe", "getMe"]
+
+
+def test_server_errors_of_sending_methods_are_not_retried(api, message):
+    methods = APIMethods(api.respond(SERVER_ERROR), retry=RetryPolicy(backoff=0))
+    with pytest.raises(ServerError):
+        asyncio.run(methods.send_message(chat_id=1, text="hi"))
+    assert api.methods == ["sendMessage"]
+
+
+def test_server_errors_of_listed_methods_are_retried(api, message):
+    policy = RetryPolicy(backoff=0, server_error_methods={"sendMessage"})
+    methods = APIMethods(api.respond(SERVER_ERROR, message), retry=policy)
+    asyncio.run(methods.send_message(chat_id=1, text="hi"))
+    assert api.methods == ["sendMessage", "sendMessage"]
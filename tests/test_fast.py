@@ -0,0 +1,29 @@
+import json
+
+import pytest
+
+from telefone_types import *
+from telefone_types import objects
+
+fast = pytest.importorskip("telefone_types.fast")
+msgspec = pytest.importorskip("msgspec")
+
+
+@pytest.mark.parametrize("name", [n for n in fast.__all__ if n in objects.__all__])
+def test_decoder(name):
+    fast.get_decoder(getattr(fast, name))
+
+
+def test_update(update_data, parse_obj):
+    update = fast.decode(json.dumps(update_data))
+    assert fast.to_model(update) == parse_obj(Update, update_data)
+
+
+def test_untagged_union():
+    data = {
+        "type": "article",
+        "id": "1",
+        "title": "Title",
+        "input_message_content": {"message_text": "text"},
+    }
+    assert fast.decode(json.dumps(data), fast.InlineQueryResult) == data
@@ -0,0 +1,83 @@
+import copy
+from typing import Any
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from telefone_types import *
+from telefone_types._compat import fields_set
+
+
+def assert_same(a: Any, b: Any) -> None:
+    """
+    Checks that the objects are equal down to the types of the nested models and
+    the fields which are set.
+    """
+    assert type(a) is type(b)
+    if isinstance(a, BaseModel):
+        assert fields_set(a) == fields_set(b)
+        for name in fields_set(a):
+            assert_same(getattr(a, name), getattr(b, name))
+    elif isinstance(a, list):
+        assert len(a) == len(b)
+        for x, y in zip(a, b):
+            assert_same(x, y)
+    else:
+        assert a == b
+
+
+def test_update(update_data, parse_obj):
+    expected = parse_obj(Update, copy.deepcopy(update_data))
+    parsed = Update.fast_parse(copy.deepcopy(update_data))
+    assert parsed == expected
+    assert_same(parsed, expected)
+
+
+def test_payload(update_data, parse_obj):
+    name = next(k for k in update_data if k != "update_id")
+    model = type(getattr(parse_obj(Update, update_data), name))
+    data = update_data[name]
+    assert_same(model.fast_parse(data), parse_obj(model, data))
+
+
+def test_coercion(parse_obj):
+    data = {"message_id": "5", "date": 1, "chat": {"id": 1, "type": "private"}}
+    assert_same(Message.fast_parse(data), parse_obj(Message, data))
+    data = {"longitude": 1, "latitude": 2.5}
+    assert_same(Location.fast_parse(data), parse_obj(Location, data))
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        {"message_text": "hi", "parse_mode": "HTML"},
+        {"latitude": 1.0, "longitude": 2.0},
+        {"latitude": 1.0, "longitude": 2.0, "title": "Place", "address": "Street"},
+        {"phone_number": "+100", "first_name": "Ann"},
+    ],
+)
+def test_union_field(content, parse_obj):
+    data = {
+        "type": "article",
+        "id": "1",
+        "title": "Result",
+        "input_message_content": content,
+    }
+    assert_same(
+        InlineQueryResultArticle.fast_parse(data),
+        parse_obj(InlineQueryResultArticle, data),
+    )
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"message_id": 1, "date": 1, "chat": {"id": 1, "type": "nope"}},
+        {"message_id": "x", "date": 1, "chat": {"id": 1, "type": "private"}},
+    ],
+)
+def test_invalid(data, parse_obj):
+    with pytest.raises(ValidationError):
+        parse_obj(Message, data)
+    with pytest.raises(ValidationError):
+        Message.fast_parse(data)
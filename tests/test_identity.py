@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from telefone_types import *
+from telefone_types._compat import PYDANTIC_V2
+from telefone_types.identity import IdentityMap, identity_scope
+from telefone_types.trusted import construct_trusted
+
+USER = {"id": 1, "is_bot": False, "first_name": "Ann"}
+
+
+@pytest.mark.parametrize(
+    "trusted",
+    [
+        # pydantic v2 validates in its core, only the trusted objects are shared
+        pytest.param(False, marks=pytest.mark.skipif(PYDANTIC_V2, reason="v1 only")),
+        True,
+    ],
+)
+def test_batch_is_deduplicated(api, updates, trusted):
+    messages = [u for u in updates if "message" in u][:5]
+    methods = APIMethods(
+        api.respond({"ok": True, "result": messages}),
+        trusted=trusted,
+        identity_map=True,
+    )
+    parsed = asyncio.run(methods.get_updates())
+    senders = {}
+    for update in parsed:
+        sender = update.message.from_
+        assert senders.setdefault(sender.id, sender) is sender
+    assert len(senders) < len(parsed)
+
+
+def test_same_id_other_content():
+    with identity_scope() as identity_map:
+        first = construct_trusted(User, USER)
+        renamed = construct_trusted(User, {**USER, "first_name": "Bob"})
+        again = construct_trusted(User, dict(USER))
+    assert renamed is not first
+    assert renamed.first_name == "Bob"
+    assert again is first
+    assert len(identity_map) == 2
+
+
+def test_nested_objects_are_not_keys():
+    identity_map = IdentityMap()
+    chat = {"id": 1, "type": "private", "photo": {"small_file_id": "a"}}
+    assert identity_map.get(Chat, chat, dict) is not identity_map.get(Chat, chat, dict)
+    assert len(identity_map) == 0
+
+
+def test_maxsize():
+    identity_map = IdentityMap(maxsize=2)
+    users = [{**USER, "id": i} for i in range(3)]
+    first = identity_map.get(User, users[0], dict)
+    identity_map.get(User, users[1], dict)
+    # the first user is used again, so the second one is evicted
+    assert identity_map.get(User, users[0], dict) is first
+    identity_map.get(User, users[2], dict)
+    assert len(identity_map) == 2
+    assert identity_map.get(User, users[0], dict) is first
+    assert (User, 1) not in {key[:2] for key in identity_map.objects}
+
+
+def test_scopes_are_isolated():
+    async def parse(identity_map, user_id):
+        with identity_scope(identity_map):
+            for _ in range(3):
+                construct_trusted(User, {**USER, "id": user_id})
+                await asyncio.sleep(0)
+
+    async def main():
+        maps = IdentityMap(), IdentityMap()
+        await asyncio.gather(parse(maps[0], 1), parse(maps[1], 2))
+        return maps
+
+    first, second = asyncio.run(main())
+    assert [key[1] for key in first.objects] == [1]
+    assert [key[1] for key in second.objects] == [2]
+    # outside of a scope nothing is shared
+    assert construct_trusted(User, USER) is not construct_trusted(User, USER)
@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from telefone_types import *
+from telefone_types.keyboards import (
+    InlineKeyboardBuilder,
+    Keyboard,
+    KeyboardCache,
+    ReplyKeyboardBuilder,
+    freeze,
+)
+
+MARKUP = {"inline_keyboard": [[{"text": "Yes", "callback_data": "y"}]]}
+
+
+def test_keyboard_is_frozen():
+    keyboard = Keyboard(MARKUP)
+    assert hash(keyboard) == hash(Keyboard(MARKUP))
+    assert keyboard == Keyboard(MARKUP)
+    assert isinstance(keyboard["inline_keyboard"], tuple)
+    with pytest.raises(TypeError):
+        keyboard["inline_keyboard"] = []
+    with pytest.raises(TypeError):
+        keyboard["inline_keyboard"][0][0]["text"] = "No"
+    assert json.loads(keyboard.json) == MARKUP
+
+
+def test_keyboard_of_models():
+    button = InlineKeyboardButton(text="Yes", callback_data="y")
+    assert json.loads(Keyboard({"inline_keyboard": [[button]]}).json) == MARKUP
+    assert json.loads(freeze({"inline_keyboard": [[button]]}).json) == MARKUP
+    markup = InlineKeyboardMarkup(inline_keyboard=[[button]])
+    assert freeze(markup) == Keyboard(MARKUP)
+
+
+def test_builders():
+    keyboard = (
+        InlineKeyboardBuilder()
+        .add("Yes", callback_data="y")
+        .add("No", callback_data="n")
+        .row()
+        .add("Site", url="https://example.org")
+        .row()
+        .build(KeyboardCache())
+    )
+    assert json.loads(keyboard.json) == {
+        "inline_keyboard": [
+            [
+                {"text": "Yes", "callback_data": "y"},
+                {"text": "No", "callback_data": "n"},
+            ],
+            [{"text": "Site", "url": "https://example.org"}],
+        ]
+    }
+    keyboard = ReplyKeyboardBuilder(resize_keyboard=True, selective=None).add("A")
+    assert json.loads(keyboard.build(KeyboardCache()).json) == {
+        "keyboard": [[{"text": "A"}]],
+        "resize_keyboard": True,
+    }
+
+
+def test_cache():
+    cache = KeyboardCache(maxsize=2)
+    first = cache.get(MARKUP)
+    assert (
+        cache.get({"inline_keyboard": [[{"text": "Yes", "callback_data": "y"}]]})
+        is first
+    )
+    assert cache.get(first) is first
+    second = cache.get({"keyboard": [[{"text": "A"}]]})
+    # the first keyboard is used again, so the second one is evicted
+    assert cache.get(MARKUP) is first
+    cache.get({"keyboard": [[{"text": "B"}]]})
+    assert len(cache.keyboards) == 2
+    assert cache.get(MARKUP) is first
+    assert cache.get({"keyboard": [[{"text": "A"}]]}) is not second
@@ -0,0 +1,54 @@
+import copy
+import pickle
+
+from telefone_types import *
+from telefone_types._compat import PYDANTIC_V2, fields_set
+from telefone_types.lazy import parse_lazy, parse_lazy_list
+
+
+def test_equal_to_eager(update_data, parse_obj):
+    lazy = parse_lazy(Update, update_data)
+    eager = parse_obj(Update, update_data)
+    assert fields_set(lazy) == fields_set(eager)
+    assert lazy == eager
+
+
+def test_fields_are_loaded_on_access(message):
+    update = parse_lazy(Update, {"update_id": 1, "message": message})
+    assert isinstance(update, Update)
+    assert isinstance(update.message, Message)
+    assert update.message.chat.id == message["chat"]["id"]
+    assert update.edited_message is None
+
+
+def test_list(updates):
+    parsed = parse_lazy_list(Update, updates)
+    assert [u.update_id for u in parsed] == [u["update_id"] for u in updates]
+
+
+def test_copy(message):
+    update = parse_lazy(Update, {"update_id": 1, "message": message})
+    for other in (copy.copy(update), copy.deepcopy(update)):
+        assert other == update
+        assert other.message.text == message["text"]
+    if not PYDANTIC_V2:
+        assert update.copy().message.text == message["text"]
+        assert update.copy(update={"update_id": 2}).update_id == 2
+
+
+def test_pickle(update_data, parse_obj):
+    lazy = parse_lazy(Update, update_data)
+    restored = pickle.loads(pickle.dumps(lazy))
+    assert type(restored) is Update
+    assert restored == parse_obj(Update, update_data)
+    assert fields_set(restored) == fields_set(lazy)
+
+
+def test_validated_as_field(message):
+    lazy = parse_lazy(Update, {"update_id": 1, "message": message})
+    assert Update(update_id=2, message=lazy.message).message.text == message["text"]
+    if PYDANTIC_V2:
+        return
+    from pydantic import parse_obj_as
+
+    assert parse_obj_as(Update, lazy).message.text == message["text"]
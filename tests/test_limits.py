@@ -0,0 +1,71 @@
+import asyncio
+import json
+
+import pytest
+
+from telefone_types import *
+from telefone_types._compat import PYDANTIC_V2, fields_set
+from telefone_types.limits import ParseLimits, Stub
+
+
+def nested(message, depth):
+    message = dict(message)
+    if depth:
+        message["reply_to_message"] = nested(message, depth - 1)
+    return message
+
+
+def dump_json(model):
+    if PYDANTIC_V2:
+        return model.model_dump_json(by_alias=True, exclude_none=True)
+    return model.json(by_alias=True, exclude_none=True)
+
+
+def test_stub_serializes_as_raw(message):
+    data = nested(message, 2)
+    parsed = ParseLimits(max_depth=1).parse(Message, data)
+    assert isinstance(parsed.reply_to_message, Stub)
+    dumped = json.loads(dump_json(parsed))
+    assert dumped["reply_to_message"] == data["reply_to_message"]
+
+
+def test_stub_serialization_is_not_warned(message, recwarn):
+    data = nested(message, 2)
+    parsed = ParseLimits(max_depth=1).parse(Message, data)
+    if PYDANTIC_V2:
+        dumped = parsed.model_dump(exclude={"chat": {"title"}})
+    else:
+        dumped = json.loads(parsed.json(exclude={"chat": {"title"}}))
+    assert dumped["reply_to_message"] == data["reply_to_message"]
+    assert "title" not in dumped["chat"]
+    assert not recwarn.list
+
+
+def test_lazy_updates_limits(api, message):
+    update = {"update_id": 1, "message": nested(message, 2)}
+    methods = APIMethods(
+        api.respond({"ok": True, "result": [update]}),
+        lazy_updates=True,
+        limits=ParseLimits(max_depth=1),
+    )
+    (parsed,) = asyncio.run(methods.get_updates())
+    assert parsed.update_id == 1
+    assert isinstance(parsed.message.reply_to_message, Stub)
+    assert parsed.message.reply_to_message.raw == update["message"]["reply_to_message"]
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_stubs_of_shared_objects(api, updates, trusted):
+    first, second = updates[0], updates[1]
+    chat = second["message"]["chat"] = dict(first["message"]["chat"])
+    first["message"]["chat"] = {**chat, "pinned_message": second["message"]}
+    methods = APIMethods(
+        api.respond({"ok": True, "result": [first, second]}),
+        trusted=trusted,
+        identity_map=True,
+        limits=ParseLimits(max_depth=1),
+    )
+    parsed = asyncio.run(methods.get_updates())
+    assert isinstance(parsed[0].message.chat.pinned_message, Stub)
+    assert parsed[1].message.chat.pinned_message is None
+    assert "pinned_message" not in fields_set(parsed[1].message.chat)
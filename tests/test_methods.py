@@ -0,0 +1,15 @@
+import asyncio
+
+from telefone_types import *
+
+
+def test_mixed_in_client(client, message):
+    client.respond(message, True)
+    sent = asyncio.run(client.send_message(chat_id=1, text="hi"))
+    assert isinstance(sent, Message)
+    assert sent.message_id == message["message_id"]
+    assert asyncio.run(client.delete_message(chat_id=1, message_id=2)) is True
+    assert client.calls == [
+        ("sendMessage", {"chat_id": 1, "text": "hi"}),
+        ("deleteMessage", {"chat_id": 1, "message_id": 2}),
+    ]
@@ -0,0 +1,55 @@
+import pickle
+
+import pytest
+from pydantic import BaseModel
+
+from telefone_types import *
+from telefone_types._compat import fields_set
+from telefone_types.base import _unpack
+from telefone_types.lazy import parse_lazy
+from telefone_types.updates.types import MessageUpdate
+
+
+def assert_same_fields_set(a, b):
+    assert type(a) is type(b)
+    if isinstance(a, BaseModel):
+        assert fields_set(a) == fields_set(b)
+        for name in fields_set(a):
+            assert_same_fields_set(getattr(a, name), getattr(b, name))
+    elif isinstance(a, list):
+        for x, y in zip(a, b):
+            assert_same_fields_set(x, y)
+
+
+def test_round_trip(update_data, parse_obj):
+    update = parse_obj(Update, update_data)
+    restored = pickle.loads(pickle.dumps(update))
+    assert restored == update
+    assert_same_fields_set(restored, update)
+
+
+def test_schema_mismatch(message, parse_obj):
+    unpack, (cls, version, mask, packed) = parse_obj(Message, message).__reduce__()
+    assert unpack is _unpack
+    assert unpack(cls, version, mask, packed) == parse_obj(Message, message)
+    with pytest.raises(pickle.UnpicklingError):
+        unpack(cls, version + 1, mask, packed)
+
+
+def test_lazy_model(update_data, parse_obj):
+    restored = pickle.loads(pickle.dumps(parse_lazy(Update, update_data)))
+    assert type(restored) is Update
+    assert restored == parse_obj(Update, update_data)
+
+
+def test_typed_update_drops_client(message):
+    update = MessageUpdate(
+        **message,
+        unprepared_ctx_api=object(),
+        state_peer={"peer_id": 1, "state": "S:a"},
+    )
+    restored = pickle.loads(pickle.dumps(update))
+    assert type(restored) is MessageUpdate
+    assert restored == update
+    assert restored.ctx_api is None
+    assert restored.state_peer is None
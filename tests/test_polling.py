@@ -0,0 +1,58 @@
+import asyncio
+
+from telefone_types import *
+from telefone_types.polling import UpdateSource
+
+
+def ok(result):
+    return {"ok": True, "result": result}
+
+
+def test_offset_and_prefetch(api, updates):
+    api.respond(ok(updates[:3]), ok([]), ok(updates[3:5]), ok([]))
+
+    async def main():
+        source = UpdateSource(APIMethods(api), offset=5, timeout=10)
+        first = await source.fetch()
+        # the request for the next batch is sent before this one is handled
+        await asyncio.sleep(0)
+        assert len(api.calls) == 2
+        received = [u.update_id for u in first]
+        async for update in source:
+            received.append(update.update_id)
+            if len(received) == 5:
+                break
+        await asyncio.sleep(0)
+        await source.close()
+        return received
+
+    received = asyncio.run(main())
+    assert received == [u["update_id"] for u in updates[:5]]
+    assert [params.get("offset") for _, params in api.calls] == [
+        5,
+        updates[2]["update_id"] + 1,
+        updates[2]["update_id"] + 1,
+        updates[4]["update_id"] + 1,
+    ]
+    assert all(params["timeout"] == 10 for _, params in api.calls)
+
+
+def test_close_cancels_request(api):
+    api.respond(ok([]))
+
+    async def main():
+        api.gate = asyncio.Event()
+        api.gate.set()
+        source = UpdateSource(APIMethods(api))
+        await source.fetch()
+        # the next request is sent and waits for the updates
+        api.gate.clear()
+        pending = source._pending
+        while len(api.calls) < 2:
+            await asyncio.sleep(0)
+        await source.close()
+        assert pending.cancelled()
+        assert source._pending is None
+
+    asyncio.run(main())
+    assert api.methods == ["getUpdates", "getUpdates"]
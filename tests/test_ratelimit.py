@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from telefone_types.ratelimit import RateLimiter, TokenBucket, chat_type
+
+
+class VirtualClockLoop(asyncio.SelectorEventLoop):
+    """
+    Event loop with a virtual clock, which jumps to the next timer once nothing else
+    is ready to run.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+    def _run_once(self):
+        if not self._ready and self._scheduled:
+            self.now = max(self.now, self._scheduled[0].when())
+        super()._run_once()
+
+
+def run(coro):
+    loop = VirtualClockLoop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+async def acquire_all(limiter, chat_ids):
+    loop = asyncio.get_running_loop()
+    woken = []
+
+    async def acquire(i, chat_id):
+        await limiter.acquire(chat_id)
+        woken.append((i, loop.time()))
+
+    await asyncio.gather(*(acquire(i, c) for i, c in enumerate(chat_ids)))
+    return woken
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=2, capacity=3)
+    assert [bucket.reserve(0) for _ in range(5)] == [0, 0, 0, 0.5, 1.0]
+    assert bucket.available_at(0) == 1.5
+    assert bucket.available_at(5) == 5
+    # idle for long enough, the burst is available again
+    assert [bucket.reserve(10) for _ in range(4)] == [10, 10, 10, 10.5]
+
+
+def test_chat_type():
+    assert chat_type(1) == "private"
+    assert chat_type(-100) == "group"
+    assert chat_type("@channel") == "group"
+
+
+def test_chat_slots_in_order():
+    limiter = RateLimiter(global_limit=None)
+    woken = run(acquire_all(limiter, [1] * 4 + [-100] * 2))
+    assert sorted(woken, key=lambda w: w[1])[:5] == [
+        (0, 0.0),
+        (4, 0.0),
+        (1, 1.0),
+        (2, 2.0),
+        (3, 3.0),
+    ]
+    assert dict(woken)[5] == pytest.approx(3.0)
+    assert limiter._waiters == []
+    assert limiter._timer is None
+
+
+def test_global_limit():
+    limiter = RateLimiter(global_limit=(2.0, 2), chat_limits={})
+    woken = run(acquire_all(limiter, range(1, 7)))
+    assert woken == [(0, 0), (1, 0), (2, 0.5), (3, 1.0), (4, 1.5), (5, 2.0)]
+
+
+def test_cancelled_waiter():
+    limiter = RateLimiter(global_limit=None)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        tasks = [asyncio.ensure_future(limiter.acquire(1)) for _ in range(3)]
+        await asyncio.sleep(0)
+        tasks[1].cancel()
+        await asyncio.gather(tasks[0], tasks[2], return_exceptions=True)
+        assert tasks[1].cancelled()
+        assert loop.time() == 2.0
+        assert limiter._waiters == []
+
+    run(main())
+
+
+def test_only_sending_methods_wait():
+    limiter = RateLimiter(global_limit=None)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        for _ in range(3):
+            await limiter.limit("getChat", {"chat_id": 1})
+        assert loop.time() == 0
+        for _ in range(3):
+            await limiter.limit("sendMessage", {"chat_id": 1})
+        assert loop.time() == 2.0
+
+    run(main())
@@ -0,0 +1,62 @@
+import asyncio
+import os
+
+from telefone_types import *
+from telefone_types.sharding import ShardedRunner, shard_key
+
+
+def reply(update):
+    # runs in a worker process
+    return [("sendMessage", {"chat_id": update.message.from_.id, "text": os.getpid()})]
+
+
+class Inbox(list):
+    put = list.append
+
+
+def test_shard_key(updates, parse_obj):
+    for data in updates:
+        update = parse_obj(Update, data)
+        payload = data[next(k for k in data if k != "update_id")]
+        sender = payload.get("from") or payload.get("user")
+        if sender is not None:
+            assert shard_key(update) == sender["id"]
+        elif "chat" in payload:
+            assert shard_key(update) == payload["chat"]["id"]
+        else:
+            assert shard_key(update) == data["update_id"]
+
+
+def test_routing(updates, parse_obj):
+    runner = ShardedRunner(reply, APIMethods(None), processes=3)
+    runner._inboxes = [Inbox() for _ in range(3)]
+    parsed = [parse_obj(Update, data) for data in updates]
+    for update in parsed:
+        runner.submit(update)
+    shards = {}
+    for i, inbox in enumerate(runner._inboxes):
+        for body in inbox:
+            key = shard_key(Update.from_bytes(body))
+            assert shards.setdefault(key, i) == i
+    assert sum(map(len, runner._inboxes)) == len(parsed)
+
+
+def test_replies(api, updates, parse_obj):
+    messages = [u for u in updates if "message" in u and "from" in u["message"]]
+    api.respond(*(u["message"] for u in messages))
+
+    async def main():
+        runner = ShardedRunner(reply, APIMethods(api), processes=2)
+        runner.start()
+        for data in messages:
+            runner.submit(parse_obj(Update, data))
+        await runner.close()
+
+    asyncio.run(main())
+    assert api.methods == ["sendMessage"] * len(messages)
+    pids = {}
+    for _, params in api.calls:
+        assert pids.setdefault(params["chat_id"], params["text"]) == params["text"]
+    assert sorted(p["chat_id"] for _, p in api.calls) == sorted(
+        m["message"]["from"]["id"] for m in messages
+    )
@@ -0,0 +1,53 @@
+import copy
+
+import pytest
+from pydantic import ValidationError
+
+from telefone_types import *
+from telefone_types._compat import fields_set
+from telefone_types.updates.types import UPDATE_TYPES, MessageUpdate, to_bot_update
+
+
+def test_state_peer_from_dict(message):
+    update = MessageUpdate(**message, state_peer={"peer_id": 1, "state": "S:a"})
+    assert isinstance(update.state_peer, StatePeer)
+    assert update.state_peer.state == "S:a"
+    update.state_peer = {"peer_id": 2, "state": "S:b"}
+    assert update.state_peer.peer_id == 2
+    assert update.bind(None, {"peer_id": 3, "state": "S:c"}).state_peer.peer_id == 3
+
+
+def test_invalid_state_peer(message):
+    with pytest.raises(ValidationError):
+        MessageUpdate(**message, state_peer={"peer_id": 1, "state": 5})
+
+
+def test_context_is_shared_by_copies(message):
+    api = object()
+    update = MessageUpdate(**message, unprepared_ctx_api=api)
+    update.context["key"] = "value"
+    for other in (copy.copy(update), copy.deepcopy(update)):
+        assert other.ctx_api is api
+        assert other.context is update.context
+
+
+def test_to_bot_update(update_data, parse_obj):
+    update = parse_obj(Update, update_data)
+    name = next(k for k in update_data if k != "update_id")
+    payload = getattr(update, name)
+    api = object()
+    update_type, typed = to_bot_update(update, api)
+    assert (update_type, type(typed)) == UPDATE_TYPES[name]
+    assert isinstance(typed, type(payload))
+    assert typed.ctx_api is api
+    assert fields_set(typed) == fields_set(payload)
+    for field in fields_set(payload):
+        assert getattr(typed, field) is getattr(payload, field)
+    sender = update_data[name].get("from")
+    if sender is not None:
+        assert typed.from_.id == sender["id"]
+
+
+def test_to_bot_update_without_payload(parse_obj):
+    with pytest.raises(ValueError):
+        to_bot_update(parse_obj(Update, {"update_id": 1}))
@@ -0,0 +1,58 @@
+import pickle
+
+import pytest
+
+from telefone_types import *
+from telefone_types.views import (
+    ChatMemberUpdatedView,
+    ChatView,
+    MessageEntityView,
+    MessageView,
+    UpdateView,
+    View,
+    view,
+    view_type,
+)
+
+
+def test_nested_views(updates):
+    data = updates[1]
+    update = view(data)
+    assert isinstance(update, UpdateView)
+    assert update.raw is data
+    assert update.update_id == data["update_id"]
+    assert isinstance(update.message, MessageView)
+    assert isinstance(update.message.chat, ChatView)
+    assert update.message.chat.raw is data["message"]["chat"]
+    assert update.message.from_.id == data["message"]["from"]["id"]
+    assert all(isinstance(e, MessageEntityView) for e in update.message.entities)
+    assert update.edited_message is None
+
+
+def test_union_views(updates, parse_obj):
+    data = next(u for u in updates if "chat_member" in u)
+    member = view(data).chat_member
+    assert isinstance(member, ChatMemberUpdatedView)
+    status = data["chat_member"]["new_chat_member"]["status"]
+    expected = type(parse_obj(Update, data).chat_member.new_chat_member)
+    assert isinstance(member.new_chat_member, view_type(expected))
+    assert member.new_chat_member.status == status
+
+
+def test_read_only(message):
+    message_view = MessageView(message)
+    with pytest.raises(AttributeError):
+        message_view.text = "changed"
+    with pytest.raises(AttributeError):
+        del message_view.text
+    with pytest.raises(AttributeError):
+        message_view.chat.title = "changed"
+    assert message_view.text == message["text"]
+
+
+def test_to_model(update_data, parse_obj):
+    update = view(update_data)
+    assert update.to_model() == parse_obj(Update, update_data)
+    assert update == view(update_data)
+    assert pickle.loads(pickle.dumps(update)) == update
+    assert isinstance(update, View)